@@ -1,8 +1,16 @@
 from .ascii import ASCII as ASCII
 from .bytes import Bytes as Bytes
+from .bytes_view import BytesView as BytesView
 from .cip import CIPRX as CIPRX
 from .cip import CIPTX as CIPTX
 from .cip import CIPData as CIPData
+from .precompiled import PrecompiledASCII as PrecompiledASCII
+from .precompiled import PrecompiledBytes as PrecompiledBytes
+from .precompiled import PrecompiledCIPTX as PrecompiledCIPTX
+from .precompiled import PrecompiledString as PrecompiledString
+from .precompiled import precompile as precompile
 from .packet import ReceivedPacket as ReceivedPacket
 from .packet import TransmittedPacket as TransmittedPacket
+from .record import RecordField as RecordField
+from .record import RecordLayout as RecordLayout
 from .string import String as String
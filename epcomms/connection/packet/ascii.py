@@ -4,6 +4,8 @@ from .packet import ReceivedPacket, TransmittedPacket
 class ASCII(TransmittedPacket[str, bytes], ReceivedPacket[str, bytes]):
     """ASCII packets are simple strings that are sent and received as-is."""
 
+    __slots__ = ("_data",)
+
     def __init__(self, data: str) -> None:
         self._data = data
 
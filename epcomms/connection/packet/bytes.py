@@ -9,6 +9,8 @@ class Bytes(
     Bytes packets are raw byte sequences.
     """
 
+    __slots__ = ("_data",)
+
     def __init__(self, data: bytes) -> None:
         self._data = data
 
@@ -0,0 +1,60 @@
+from typing import Any, Union
+
+from .packet import ReceivedPacket, TransmittedPacket
+
+
+class BytesView(
+    ReceivedPacket[memoryview, memoryview],
+    TransmittedPacket[memoryview, memoryview],
+):
+    """
+    BytesView packets are raw byte sequences that wrap a memoryview of the
+    underlying buffer instead of copying it.
+
+    When received, the buffer usually belongs to the transmission and is
+    reused for the next frame, so the view is only valid until the next
+    read. Call `copy()` to keep the data, and `release()` (or use the packet
+    as a context manager) once done with it.
+    """
+
+    __slots__ = ("_view",)
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        self._view = memoryview(data)
+
+    def serialize(self) -> memoryview:
+        return self._view
+
+    @classmethod
+    def from_data(cls, data: Union[bytes, bytearray, memoryview]) -> "BytesView":
+        return cls(data)
+
+    @classmethod
+    def from_wire(cls, wire: Union[bytes, bytearray, memoryview]) -> "BytesView":
+        return cls(wire)
+
+    def deserialize(self) -> memoryview:
+        return self._view
+
+    def copy(self) -> bytes:
+        """
+        Copy the data out of the underlying buffer.
+
+        Returns:
+            bytes: an independent copy of the packet data.
+        """
+        return self._view.tobytes()
+
+    def release(self) -> None:
+        """Release the view of the underlying buffer. The packet can't be
+        used afterwards."""
+        self._view.release()
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __enter__(self) -> "BytesView":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.release()
@@ -32,6 +32,8 @@ class CIPTX(TransmittedPacket[CIPData, CIPGenericMessageContent]):
     """Representation of a CIP (Common Industrial Protocol) packet sent from a
     controller to a device on the network."""
 
+    __slots__ = ("_data",)
+
     def __init__(self, data: CIPData) -> None:
         self._data = data
 
@@ -60,6 +62,8 @@ class CIPRX(ReceivedPacket[Union[str, int, float], Tag]):
     """Representation of a CIP (Common Industrial Protocol) packet received from a
     device on the network."""
 
+    __slots__ = ("_data", "_data_type", "_error")
+
     def __init__(self, tag: Tag):
         self._data = tag.value
         self._data_type = tag.type
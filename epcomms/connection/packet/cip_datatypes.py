@@ -1,9 +1,16 @@
 # pylint: disable=useless-import-alias
 # pylint: disable=unused-import
 # This module re-exports CIP data types from the pycomm3 library for convenience.
+from pycomm3.cip.data_types import BYTE as BYTE
+from pycomm3.cip.data_types import DINT as DINT
+from pycomm3.cip.data_types import DWORD as DWORD
+from pycomm3.cip.data_types import INT as INT
+from pycomm3.cip.data_types import LREAL as LREAL
 from pycomm3.cip.data_types import REAL as REAL
+from pycomm3.cip.data_types import SINT as SINT
 from pycomm3.cip.data_types import STRING as STRING
 from pycomm3.cip.data_types import UDINT as UDINT
 from pycomm3.cip.data_types import UINT as UINT
+from pycomm3.cip.data_types import USINT as USINT
 from pycomm3.cip.data_types import WORD as WORD
 from pycomm3.cip.data_types import DataType as DataType
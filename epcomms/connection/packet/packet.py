@@ -9,6 +9,8 @@ class TransmittedPacket(
 ):
     """Base protocol for transmitted packets."""
 
+    __slots__ = ()
+
     def serialize(self) -> Wire:
         """Serialize a packet for transmission over the wire
 
@@ -32,6 +34,8 @@ class TransmittedPacket(
 class ReceivedPacket(Protocol[Data, Wire]):
     """Base protocol for received packets."""
 
+    __slots__ = ()
+
     @classmethod
     def from_wire(cls, wire: Wire) -> "ReceivedPacket[Data, Wire]":
         """Create a packet from received data
@@ -0,0 +1,175 @@
+from collections.abc import Hashable
+from typing import Any, ClassVar, TypeVar, Union, cast
+
+from .ascii import ASCII
+from .bytes import Bytes
+from .cip import CIPTX, CIPData, CIPGenericMessageContent
+from .string import String
+
+# Precompiled packets are built once and shared, so every instance is interned
+# by its data and can't be modified after construction. Their wire
+# representation is computed up front and serialize() just hands it back.
+
+
+# pylint: disable-next=duplicate-bases # false positive from the Protocol bases
+class PrecompiledASCII(ASCII):
+    """Immutable, interned ASCII packet with pre-encoded wire bytes."""
+
+    __slots__ = ("_wire",)
+    _interned: ClassVar[dict[str, "PrecompiledASCII"]] = {}
+    _wire: bytes
+
+    def __new__(cls, data: str) -> "PrecompiledASCII":
+        packet = cls._interned.get(data)
+        if packet is None:
+            packet = super().__new__(cls)
+            object.__setattr__(packet, "_data", data)
+            object.__setattr__(packet, "_wire", data.encode("ascii"))
+            packet = cls._interned.setdefault(data, packet)
+        return packet
+
+    def __init__(self, data: str) -> None:  # pylint: disable=super-init-not-called
+        pass  # everything is set up once, in __new__
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def serialize(self) -> bytes:
+        return self._wire
+
+    @classmethod
+    def from_data(cls, data: str) -> "PrecompiledASCII":
+        return cls(data)
+
+    @classmethod
+    def from_wire(cls, wire: bytes) -> ASCII:
+        # received data is arbitrary, so don't intern it
+        return ASCII.from_wire(wire)
+
+
+# pylint: disable-next=duplicate-bases # false positive from the Protocol bases
+class PrecompiledString(String):
+    """Immutable, interned String packet."""
+
+    __slots__ = ()
+    _interned: ClassVar[dict[str, "PrecompiledString"]] = {}
+
+    def __new__(cls, data: str) -> "PrecompiledString":
+        packet = cls._interned.get(data)
+        if packet is None:
+            packet = super().__new__(cls)
+            object.__setattr__(packet, "_data", data)
+            packet = cls._interned.setdefault(data, packet)
+        return packet
+
+    def __init__(self, data: str) -> None:  # pylint: disable=super-init-not-called
+        pass  # everything is set up once, in __new__
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def from_data(cls, data: str) -> "PrecompiledString":
+        return cls(data)
+
+    @classmethod
+    def from_wire(cls, wire: str) -> String:
+        # received data is arbitrary, so don't intern it
+        return String.from_wire(wire)
+
+
+# pylint: disable-next=duplicate-bases # false positive from the Protocol bases
+class PrecompiledBytes(Bytes):
+    """Immutable, interned Bytes packet."""
+
+    __slots__ = ()
+    _interned: ClassVar[dict[bytes, "PrecompiledBytes"]] = {}
+
+    def __new__(cls, data: Union[bytes, bytearray]) -> "PrecompiledBytes":
+        wire = bytes(data)
+        packet = cls._interned.get(wire)
+        if packet is None:
+            packet = super().__new__(cls)
+            object.__setattr__(packet, "_data", wire)
+            packet = cls._interned.setdefault(wire, packet)
+        return packet
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, data: Union[bytes, bytearray]) -> None:
+        pass  # everything is set up once, in __new__
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def from_data(cls, data: bytearray) -> "PrecompiledBytes":
+        return cls(data)
+
+    @classmethod
+    def from_wire(cls, wire: bytes) -> Bytes:
+        # received data is arbitrary, so don't intern it
+        return Bytes.from_wire(wire)
+
+
+class PrecompiledCIPTX(CIPTX):
+    """Immutable, interned CIPTX packet with pre-built message content.
+
+    The message content returned by serialize() is shared between every
+    request and must not be modified.
+    """
+
+    __slots__ = ("_wire",)
+    _interned: ClassVar[dict[Hashable, "PrecompiledCIPTX"]] = {}
+    _wire: CIPGenericMessageContent
+
+    def __new__(cls, data: CIPData) -> "PrecompiledCIPTX":
+        key = (
+            data.class_code,
+            data.instance,
+            data.attribute,
+            data.data_type,
+            data.request_data,
+        )
+        packet = cls._interned.get(key)
+        if packet is None:
+            packet = super().__new__(cls)
+            object.__setattr__(packet, "_data", data)
+            object.__setattr__(packet, "_wire", CIPTX(data).serialize())
+            packet = cls._interned.setdefault(key, packet)
+        return packet
+
+    def __init__(self, data: CIPData) -> None:  # pylint: disable=super-init-not-called
+        pass  # everything is set up once, in __new__
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def serialize(self) -> CIPGenericMessageContent:
+        return self._wire
+
+    @classmethod
+    def from_data(cls, data: CIPData) -> "PrecompiledCIPTX":
+        return cls(data)
+
+
+PacketT = TypeVar("PacketT", ASCII, String)
+
+
+def precompile(packet_type: type[PacketT], data: str) -> PacketT:
+    """
+    Get the precompiled version of a text packet, for drivers that are
+    generic over their packet type.
+
+    Args:
+        packet_type (type[ASCII] | type[String]): The packet type the driver
+            transmits.
+        data (str): The packet data.
+
+    Returns:
+        ASCII | String: an interned, precompiled packet of that type.
+    """
+    # a precompiled packet is a subclass of the packet type, which the
+    # constrained TypeVar doesn't narrow to
+    if issubclass(packet_type, ASCII):
+        return cast(PacketT, PrecompiledASCII(data))
+    return cast(PacketT, PrecompiledString(data))
@@ -0,0 +1,128 @@
+import struct
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .cip_datatypes import DataType
+
+RecordT = TypeVar("RecordT")
+
+# struct codes for CIP types that pycomm3 doesn't give a struct format (the
+# bit string types), by size. They're read as unsigned integers.
+_UNSIGNED_CODES = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+
+@dataclass(frozen=True)
+class RecordField:
+    """A single field of a binary record."""
+
+    name: str
+    # byte offset of the field from the start of the record
+    offset: int
+    # CIP elementary data type (e.g. UINT, REAL) or a struct format code
+    data_type: Union[type[DataType], str]
+
+    @property
+    def code(self) -> str:
+        """The struct format code for the field (without byte order)."""
+        if isinstance(self.data_type, str):
+            return self.data_type
+        # pycomm3 keeps the struct format on a "private" attribute
+        data_format: str = getattr(self.data_type, "_format", "")
+        if data_format:
+            return data_format.lstrip("<>=!@")
+        size: int = getattr(self.data_type, "size")
+        return _UNSIGNED_CODES[size]
+
+
+class RecordLayout(Generic[RecordT]):
+    """
+    A declarative layout of a fixed-size binary (little-endian) record.
+
+    The layout is compiled once into a `struct.Struct`, so a whole record is
+    decoded with a single `unpack_from` instead of slicing and decoding each
+    field separately. Gaps between fields are skipped as padding.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fields: Iterable[RecordField],
+        record_type: Optional[Callable[..., RecordT]] = None,
+    ) -> None:
+        """
+        Args:
+            name (str): Name of the record, used for the default record type.
+            fields (Iterable[RecordField]): The fields of the record.
+            record_type (Callable[..., RecordT], optional): Type built from
+                the decoded fields, in field order. Defaults to a NamedTuple
+                of the field names.
+        """
+        self.fields = tuple(sorted(fields, key=lambda field: field.offset))
+        record_format = "<"
+        position = 0
+        for field in self.fields:
+            if field.offset < position:
+                raise ValueError(f"Field {field.name} overlaps the previous field")
+            if field.offset > position:
+                record_format += f"{field.offset - position}x"
+            record_format += field.code
+            position = field.offset + struct.calcsize(f"<{field.code}")
+        self._struct = struct.Struct(record_format)
+        if record_type is None:
+            # the default NamedTuple is only known to be a tuple of the values
+            field_types: list[tuple[str, Any]] = [
+                (field.name, Any) for field in self.fields
+            ]
+            record_type = cast(Callable[..., RecordT], NamedTuple(name, field_types))
+        self.record_type = record_type
+
+    @property
+    def size(self) -> int:
+        """Size of the record in bytes."""
+        return self._struct.size
+
+    def unpack(self, data: Union[bytes, bytearray, memoryview]) -> tuple[Any, ...]:
+        """
+        Unpack the raw field values of a record, in field order.
+
+        Args:
+            data (bytes): The record data. Anything after the record is ignored.
+
+        Returns:
+            tuple: the field values.
+        """
+        return self._struct.unpack_from(data)
+
+    def decode(self, data: Union[bytes, bytearray, memoryview]) -> RecordT:
+        """
+        Decode a record.
+
+        Args:
+            data (bytes): The record data. Anything after the record is ignored.
+
+        Returns:
+            RecordT: the decoded record.
+        """
+        return self.record_type(*self._struct.unpack_from(data))
+
+    def encode(self, *values: Any) -> bytes:
+        """
+        Encode a record.
+
+        Args:
+            *values (Any): The field values, in field order.
+
+        Returns:
+            bytes: the encoded record.
+        """
+        return self._struct.pack(*values)
@@ -7,6 +7,8 @@ class String(TransmittedPacket[str, str], ReceivedPacket[str, str]):
     protocols that transmit string data directly.
     """
 
+    __slots__ = ("_data",)
+
     def __init__(self, data: str) -> None:
         self._data = data
 
@@ -1,7 +1,13 @@
 # pylint: disable=missing-module-docstring # that would be crazy to have a module docstring here
 from .ethernet_ip import EthernetIP as EthernetIP
+from .ethernet_ip_io import ImplicitFrame as ImplicitFrame
+from .ethernet_ip_io import ImplicitIOConsumer as ImplicitIOConsumer
+from .gpib_bus import BusStatistics as BusStatistics
+from .gpib_bus import GPIBBus as GPIBBus
 from .serial import Serial as Serial
 from .socket import Socket as Socket
+from .subscribers import Stream as Stream
+from .subscribers import Subscribers as Subscribers
 from .telnet import Telnet as Telnet
 from .transmission import RXPacketT as RXPacketT
 from .transmission import Transmission as Transmission
@@ -1,44 +1,208 @@
-from pycomm3 import CIPDriver, Services
+import struct
+import time
+from os import urandom
+from threading import Event, Thread
+from typing import Any, Optional, TypedDict, cast
+
+from pycomm3 import (
+    PADDED_EPATH,
+    CIPDriver,
+    ClassCode,
+    CommError,
+    ConnectionManagerInstances,
+    ConnectionManagerServices,
+    LogicalSegment,
+    PortSegment,
+    ResponseError,
+    Services,
+)
 from pycomm3.tag import Tag
 
 from epcomms.connection.packet import CIPRX, CIPTX
 
+from .ethernet_ip_io import ImplicitHeartbeat, ImplicitIOConsumer
 from .transmission import Transmission, TransmissionError
 
+# Forward Open network connection parameters (CIP Vol 1 3-5.5.1.1)
+_POINT_TO_POINT = 0b10 << 13
+_PRIORITY_SCHEDULED = 0b10 << 10
+# Transport class/trigger: client, cyclic trigger, transport class 1
+_CLASS_1_CYCLIC = b"\x01"
+# Forward Open reply: O->T and T->O connection IDs, connection serial number,
+# originator vendor ID and serial number, then O->T and T->O actual RPIs
+_FORWARD_OPEN_REPLY = struct.Struct("<IIHHIII")
+# Frames older than this many T->O RPIs mean the producer has stopped
+_STALE_RPIS = 4
+
+# The parts of pycomm3's (untyped) driver configuration a Forward Open needs
+_DriverConfig = TypedDict(
+    "_DriverConfig",
+    {"cip_path": list[PortSegment], "vid": bytes, "vsn": bytes, "ip address": str},
+)
+
 
 class EthernetIP(Transmission[CIPRX, CIPTX]):
+    # pylint: disable=too-many-instance-attributes
     """class for communication with EtherNet/IP devices
     Fun fact: The 'IP' in EtherNet/IP stands for 'Industrial Protocol' and not 'Internet Protocol'
+
+    By default requests are sent as connected (class 3) messages: a Forward
+    Open is done once per session and every request then reuses the CIP
+    connection ID and sequence counter, skipping the device's UCMM path. A
+    background keep-alive sends a cheap request whenever the connection has
+    been idle for `keepalive_interval` seconds so the device doesn't time the
+    connection out between polls.
     """
 
     # The driver object for the pycomm3 library
     driver: CIPDriver
 
-    def __init__(self, device_path: str):
+    # Identity object vendor ID; every EtherNet/IP device must implement it,
+    # so it's a safe target for keep-alive traffic
+    _keepalive_request: dict[str, Any] = {
+        "service": Services.get_attribute_single,
+        "class_code": 1,
+        "instance": 1,
+        "attribute": 1,
+    }
+
+    def __init__(
+        self,
+        device_path: str,
+        connected: bool = True,
+        keepalive_interval: Optional[float] = 10.0,
+    ):
         """Initializes the EthernetIP object
         Args:
             device_path (str): The path to the device, e.g. '192.168.0.172'
+            connected (bool, optional): Use connected (Forward Open) messaging.
+                Set to False for devices that only support unconnected
+                (UCMM) messaging. Defaults to True.
+            keepalive_interval (float, optional): Seconds of idle time after
+                which a keep-alive request is sent on the connected session.
+                None disables the keep-alive. Defaults to 10.0.
         """
         self.driver = CIPDriver(device_path)
+        self._connected = connected
+        self._keepalive_interval = keepalive_interval
+        self._session_open = False
+        self._generation = 0
+        self._last_activity = time.monotonic()
+        self._stop_keepalive = Event()
+        self._keepalive_thread: Optional[Thread] = None
+        # Forward Close request data for each open implicit I/O connection
+        self._implicit_connections: dict[ImplicitIOConsumer, tuple[bytes, bytes]] = {}
         super().__init__()
 
+    @property
+    def generation(self) -> int:
+        """Number of sessions opened so far. Increments every time the
+        session is (re)established, so callers can tell when device-side
+        state (e.g. cached attributes) may have been lost."""
+        return self._generation
+
+    def _open_session(self) -> None:
+        """Open the socket, register a session and (in connected mode) do the
+        Forward Open. Must be called with the lock held."""
+        if self._session_open:
+            return
+        try:
+            if not self.driver.open():
+                raise TransmissionError("EtherNet/IP session registration failed")
+            # pylint: disable=protected-access
+            # pycomm3 only exposes the Forward Open through its private API
+            if (
+                self._connected
+                and not self.driver._forward_open()  # pyright: ignore[reportPrivateUsage]
+            ):
+                raise TransmissionError("EtherNet/IP Forward Open failed")
+        except TransmissionError:
+            self._reset_session()
+            raise
+        except (CommError, ResponseError) as e:
+            self._reset_session()
+            raise TransmissionError(e) from e
+
+        self._session_open = True
+        self._generation += 1
+        self._last_activity = time.monotonic()
+
+        if self._connected and self._keepalive_interval is not None:
+            if self._keepalive_thread is None or not self._keepalive_thread.is_alive():
+                self._stop_keepalive.clear()
+                self._keepalive_thread = Thread(
+                    target=self._keepalive_loop,
+                    args=(self._keepalive_interval,),
+                    daemon=True,
+                )
+                self._keepalive_thread.start()
+
+    def _reset_session(self) -> None:
+        """Tear down a session that is no longer usable. Must be called with
+        the lock held."""
+        self._session_open = False
+        try:
+            self.driver.close()
+        except CommError:
+            pass  # the connection is already gone, nothing more to clean up
+
+    def _generic_message(
+        self, connected: Optional[bool] = None, **kwargs: Any
+    ) -> Tag:
+        """Send a generic message on the session, opening it if needed.
+
+        If the session turns out to be dead (e.g. the device was power cycled)
+        it is re-established and the request retried once. Must be called with
+        the lock held. `connected` defaults to the transmission's own setting.
+        """
+        if connected is None:
+            connected = self._connected
+        for attempt in range(2):
+            self._open_session()
+            try:
+                response_tag: Tag = (
+                    self.driver.generic_message(  # pyright: ignore[reportUnknownMemberType]
+                        connected=connected, **kwargs
+                    )
+                )
+            except (CommError, ResponseError) as e:
+                self._reset_session()
+                if attempt == 1:
+                    raise TransmissionError(e) from e
+                continue
+            self._last_activity = time.monotonic()
+            return response_tag
+
+        # This should be unreachable; the loop either returns or raises
+        raise RuntimeError("Unreachable state in EthernetIP generic message")
+
+    def _keepalive_loop(self, interval: float) -> None:
+        """Keep the connected session alive while it's idle."""
+        while not self._stop_keepalive.wait(interval / 2):
+            with self._lock:
+                if not self._session_open:
+                    continue
+                if time.monotonic() - self._last_activity < interval:
+                    continue
+                try:
+                    self._generic_message(**self._keepalive_request)
+                except TransmissionError:
+                    # The next request will try to re-establish the session
+                    continue
+
     def _command(self, packet: CIPTX):
         """Send a command to the device
 
         Args:
             data (CIPTX): The data to send to the device
         """
-        if not self.driver.connected:
-            self.driver.open()
         serialized_packet = packet.serialize()
-        response_tag: Tag = (
-            self.driver.generic_message(  # pyright: ignore[reportUnknownMemberType]
-                service=Services.set_attribute_single,
-                class_code=serialized_packet["class_code"],
-                instance=serialized_packet["instance"],
-                attribute=serialized_packet["attribute"],
-                request_data=serialized_packet["request_data"],
-            )
+        response_tag = self._generic_message(
+            service=Services.set_attribute_single,
+            class_code=serialized_packet["class_code"],
+            instance=serialized_packet["instance"],
+            attribute=serialized_packet["attribute"],
+            request_data=serialized_packet["request_data"],
         )
 
         if not response_tag:
@@ -63,19 +227,15 @@ class EthernetIP(Transmission[CIPRX, CIPTX]):
         Returns:
             CIPRX: The data received from the device
         """
-        if not self.driver.connected:
-            self.driver.open()
-
         serialized_packet = packet.serialize()
-        response_tag = (
-            self.driver.generic_message(  # pyright: ignore[reportUnknownMemberType]
+        with self._lock:
+            response_tag = self._generic_message(
                 service=Services.get_attribute_single,
                 class_code=serialized_packet["class_code"],
                 instance=serialized_packet["instance"],
                 attribute=serialized_packet["attribute"],
                 data_type=serialized_packet["data_type"],
             )
-        )
 
         if not response_tag:
             raise TransmissionError(
@@ -86,3 +246,146 @@ class EthernetIP(Transmission[CIPRX, CIPTX]):
             )
 
         return CIPRX.from_wire(response_tag)
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    # pylint: disable=too-many-locals
+    def open_implicit_io(
+        self,
+        input_assembly: int,
+        input_size: int,
+        rpi: float,
+        output_assembly: int,
+        configuration_assembly: int,
+        output_size: int = 0,
+        port: int = 2222,
+    ) -> ImplicitIOConsumer:
+        """Open a cyclic (class 1) implicit I/O connection to the device.
+
+        The device then produces its input assembly over UDP every `rpi`
+        seconds without being polled. With the default `output_size` of 0
+        the connection is input-only, and `output_assembly` should be the
+        device's heartbeat connection point.
+
+        Args:
+            input_assembly (int): Assembly instance the device produces
+                (target -> originator).
+            input_size (int): Size of the input assembly in bytes.
+            rpi (float): Requested packet interval in seconds.
+            output_assembly (int): Assembly instance (or heartbeat connection
+                point) the originator produces to.
+            configuration_assembly (int): Configuration assembly instance.
+            output_size (int, optional): Size of the output assembly in bytes.
+                Defaults to 0 (heartbeat only).
+            port (int, optional): Local UDP port to receive frames on.
+                Defaults to 2222.
+
+        Returns:
+            ImplicitIOConsumer: consumer receiving the input assembly. Close
+                it with `close_implicit_io`.
+        """
+        # pylint: disable=protected-access
+        cfg = cast(
+            _DriverConfig,
+            self.driver._cfg,  # pyright: ignore[reportPrivateUsage]
+        )
+        rpi_us = round(rpi * 1_000_000)
+        connection_serial = urandom(2)
+        t_o_connection_id = urandom(4)
+        connection_path = PADDED_EPATH.encode(
+            [
+                *cfg["cip_path"],
+                LogicalSegment(ClassCode.assembly, "class_id"),
+                LogicalSegment(configuration_assembly, "instance_id"),
+                LogicalSegment(output_assembly, "connection_point"),
+                LogicalSegment(input_assembly, "connection_point"),
+            ],
+            length=True,
+        )
+        # O->T carries a 2 byte sequence count and 4 byte run/idle header,
+        # T->O (modeless) just the sequence count
+        o_t_parameters = _POINT_TO_POINT | _PRIORITY_SCHEDULED | (output_size + 6)
+        t_o_parameters = _POINT_TO_POINT | _PRIORITY_SCHEDULED | (input_size + 2)
+        forward_open = b"".join(
+            [
+                b"\x0a",  # priority/time tick
+                b"\x05",  # timeout ticks
+                b"\x00\x00\x00\x00",  # O->T connection ID, chosen by target
+                t_o_connection_id,
+                connection_serial,
+                cfg["vid"],
+                cfg["vsn"],
+                b"\x02",  # timeout multiplier (x16)
+                b"\x00\x00\x00",  # reserved
+                struct.pack("<IH", rpi_us, o_t_parameters),
+                struct.pack("<IH", rpi_us, t_o_parameters),
+                _CLASS_1_CYCLIC,
+            ]
+        )
+
+        with self._lock:
+            response_tag = self._generic_message(
+                service=ConnectionManagerServices.forward_open,
+                class_code=ClassCode.connection_manager,
+                instance=ConnectionManagerInstances.open_request,
+                request_data=forward_open,
+                route_path=connection_path,
+                connected=False,
+            )
+        if not response_tag:
+            raise TransmissionError(
+                f"EtherNet/IP implicit I/O Forward Open failed: {response_tag.error}"
+            )
+
+        o_t_connection_id, t_o_id, *_, o_t_api, t_o_api = (
+            _FORWARD_OPEN_REPLY.unpack_from(response_tag.value)
+        )
+        consumer = ImplicitIOConsumer(
+            t_o_id,
+            port=port,
+            heartbeat=ImplicitHeartbeat(
+                address=(cfg["ip address"], 2222),
+                connection_id=o_t_connection_id,
+                interval=o_t_api / 1_000_000,
+                data=bytes(output_size),
+            ),
+            max_age=_STALE_RPIS * t_o_api / 1_000_000,
+        )
+        forward_close = b"".join(
+            [b"\x0a", b"\x05", connection_serial, cfg["vid"], cfg["vsn"]]
+        )
+        self._implicit_connections[consumer] = (forward_close, connection_path)
+        return consumer
+
+    def close_implicit_io(self, consumer: ImplicitIOConsumer) -> None:
+        """Close an implicit I/O connection opened with `open_implicit_io`.
+
+        Args:
+            consumer (ImplicitIOConsumer): the consumer returned when the
+                connection was opened.
+        """
+        consumer.close()
+        forward_close, connection_path = self._implicit_connections.pop(consumer)
+        with self._lock:
+            try:
+                self._generic_message(
+                    service=ConnectionManagerServices.forward_close,
+                    class_code=ClassCode.connection_manager,
+                    instance=ConnectionManagerInstances.open_request,
+                    request_data=forward_close,
+                    route_path=connection_path,
+                    connected=False,
+                )
+            except TransmissionError:
+                pass  # the device times the connection out on its own
+
+    def close(self) -> None:
+        for consumer in list(self._implicit_connections):
+            self.close_implicit_io(consumer)
+        self._stop_keepalive.set()
+        if self._keepalive_thread is not None:
+            self._keepalive_thread.join()
+            self._keepalive_thread = None
+        with self._lock:
+            if self._session_open:
+                self._reset_session()
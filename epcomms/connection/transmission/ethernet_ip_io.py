@@ -0,0 +1,365 @@
+import socket
+import struct
+import time
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from typing import Callable, ClassVar, Optional
+
+from .subscribers import Stream, Subscribers
+from .transmission import TransmissionError
+
+# Common packet format item IDs used by implicit (class 1) messaging
+_SEQUENCED_ADDRESS_ITEM = 0x8002
+_CONNECTED_DATA_ITEM = 0x00B1
+
+# item count, sequenced address item (type, length, connection ID,
+# encapsulation sequence number), connected data item (type, length) and the
+# 16-bit CIP sequence count that starts every class 1 payload
+_HEADER = struct.Struct("<HHHIIHHH")
+_RUN_IDLE_HEADER = struct.Struct("<I")
+
+
+@dataclass(frozen=True)
+class ImplicitFrame:
+    """A single implicit I/O frame received from a producer."""
+
+    connection_id: int
+    encapsulation_sequence: int
+    sequence: int
+    data: bytes
+    timestamp: float
+
+
+@dataclass(frozen=True)
+class ImplicitHeartbeat:
+    """Originator -> target traffic that keeps a class 1 connection alive."""
+
+    address: tuple[str, int]
+    connection_id: int
+    interval: float
+    data: bytes = b""
+    run_idle_header: bool = True
+
+
+class _ImplicitListener:
+    """A UDP socket and reader thread shared by every consumer on one port.
+
+    Implicit I/O from every device arrives on the same port (2222 by default),
+    so frames are demultiplexed by connection ID rather than by socket.
+    """
+
+    _instances: ClassVar[dict[tuple[str, int], "_ImplicitListener"]] = {}
+    _instances_lock: ClassVar[Lock] = Lock()
+
+    def __init__(self, address: str, port: int) -> None:
+        self._key = (address, port)
+        self._references = 0
+        self._consumers: dict[int, "ImplicitIOConsumer"] = {}
+        self._consumers_lock = Lock()
+        self._closed = Event()
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind((address, port))
+        # recv() isn't interrupted by close(), so wake up periodically to
+        # check whether the listener has been released
+        self.socket.settimeout(0.5)
+        self._thread = Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def acquire(cls, address: str, port: int) -> "_ImplicitListener":
+        """Get the listener for a port, creating it on first use."""
+        with cls._instances_lock:
+            listener = cls._instances.get((address, port))
+            if listener is None or port == 0:
+                # port 0 asks the OS for a fresh port, so never share those
+                listener = cls(address, port)
+                if port != 0:
+                    cls._instances[(address, port)] = listener
+            listener._references += 1
+            return listener
+
+    def release(self) -> None:
+        """Drop a reference to the listener, closing it when unused."""
+        with self._instances_lock:
+            self._references -= 1
+            if self._references > 0:
+                return
+            if self._instances.get(self._key) is self:
+                del self._instances[self._key]
+        self._closed.set()
+        self._thread.join()
+        self.socket.close()
+
+    def add(self, consumer: "ImplicitIOConsumer") -> None:
+        """Route frames for the consumer's connection ID to it."""
+        with self._consumers_lock:
+            if consumer.connection_id in self._consumers:
+                raise ValueError(
+                    f"Connection ID {consumer.connection_id:#010x} is already in use"
+                )
+            self._consumers[consumer.connection_id] = consumer
+
+    def remove(self, consumer: "ImplicitIOConsumer") -> None:
+        """Stop routing frames to the consumer."""
+        with self._consumers_lock:
+            self._consumers.pop(consumer.connection_id, None)
+
+    def _read_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                datagram = self.socket.recv(65535)
+            except TimeoutError:
+                continue
+            except OSError as e:
+                if not self._closed.is_set():
+                    self._fail(TransmissionError(e))
+                return
+            timestamp = time.time()
+            if len(datagram) < _HEADER.size:
+                continue
+            (
+                item_count,
+                address_type,
+                address_length,
+                connection_id,
+                encapsulation_sequence,
+                data_type,
+                data_length,
+                sequence,
+            ) = _HEADER.unpack_from(datagram)
+            if (
+                item_count != 2
+                or address_type != _SEQUENCED_ADDRESS_ITEM
+                or address_length != 8
+                or data_type != _CONNECTED_DATA_ITEM
+            ):
+                continue
+
+            with self._consumers_lock:
+                consumer = self._consumers.get(connection_id)
+            if consumer is not None:
+                # data_length includes the 2-byte CIP sequence count
+                payload = datagram[_HEADER.size : _HEADER.size - 2 + data_length]
+                consumer.deliver(encapsulation_sequence, sequence, payload, timestamp)
+
+    def _fail(self, error: TransmissionError) -> None:
+        """The socket can't be read any more: stop sharing the listener and
+        tell every consumer."""
+        with self._instances_lock:
+            if self._instances.get(self._key) is self:
+                del self._instances[self._key]
+        with self._consumers_lock:
+            consumers = list(self._consumers.values())
+        for consumer in consumers:
+            consumer.connection_lost(error)
+
+
+class ImplicitIOConsumer:
+    # pylint: disable=too-many-instance-attributes
+    """Consumer for cyclic (class 1) implicit I/O frames received over UDP.
+
+    The most recent frame is always available through `latest`; callers that
+    want every frame can register a subscriber callback or iterate `stream()`.
+    If a heartbeat is given, the (usually empty) originator -> target packets
+    the target needs to keep the connection open are sent at its interval.
+    """
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def __init__(
+        self,
+        connection_id: int,
+        address: str = "0.0.0.0",
+        port: int = 2222,
+        run_idle_header: bool = False,
+        heartbeat: Optional[ImplicitHeartbeat] = None,
+        max_age: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            connection_id (int): The target -> originator connection ID to
+                accept frames for.
+            address (str, optional): Local address to listen on. Defaults to
+                "0.0.0.0".
+            port (int, optional): Local UDP port to listen on. Defaults to
+                2222, the EtherNet/IP implicit messaging port.
+            run_idle_header (bool, optional): Whether the producer prefixes
+                its data with a 32-bit run/idle header, which is stripped.
+                Defaults to False.
+            heartbeat (ImplicitHeartbeat, optional): Originator -> target
+                traffic to produce. Defaults to None.
+            max_age (float, optional): Seconds after which the latest frame
+                is stale, i.e. the producer has stopped sending. Usually a few
+                RPIs. Defaults to None (frames never go stale).
+        """
+        self.connection_id = connection_id
+        self.max_age = max_age
+        self._run_idle_header = run_idle_header
+        self._latest: Optional[ImplicitFrame] = None
+        self._new_frame = Event()
+        self._subscribers = Subscribers[ImplicitFrame]("an implicit I/O frame")
+        self._closed = Event()
+        self._listener = _ImplicitListener.acquire(address, port)
+        try:
+            self._listener.add(self)
+        except ValueError:
+            self._listener.release()
+            raise
+
+        self._heartbeat_thread: Optional[Thread] = None
+        if heartbeat is not None:
+            self._heartbeat_thread = Thread(
+                target=self._heartbeat_loop, args=(heartbeat,), daemon=True
+            )
+            self._heartbeat_thread.start()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The local (address, port) frames are received on."""
+        return self._listener.socket.getsockname()
+
+    @property
+    def latest(self) -> Optional[ImplicitFrame]:
+        """The most recently received frame, or None if none has arrived."""
+        return self._latest
+
+    def deliver(
+        self, encapsulation_sequence: int, sequence: int, data: bytes, timestamp: float
+    ) -> None:
+        """Accept a frame from the listener and notify subscribers."""
+        latest = self._latest
+        # Sequence numbers are 32-bit and wrap, so compare modulo 2**32 and
+        # drop anything that arrives out of order or duplicated
+        if (
+            latest is not None
+            and not 0 < (encapsulation_sequence - latest.encapsulation_sequence)
+            % 2**32
+            < 2**31
+        ):
+            return
+        if self._run_idle_header:
+            data = data[_RUN_IDLE_HEADER.size :]
+
+        frame = ImplicitFrame(
+            connection_id=self.connection_id,
+            encapsulation_sequence=encapsulation_sequence,
+            sequence=sequence,
+            data=data,
+            timestamp=timestamp,
+        )
+        self._latest = frame
+        self._new_frame.set()
+        self._subscribers.notify(frame)
+
+    def connection_lost(self, error: TransmissionError) -> None:
+        """Called by the listener when frames can no longer be received:
+        end every `stream()` iterator with the error."""
+        self._subscribers.end(error)
+
+    def wait_for_frame(self, timeout: Optional[float] = None) -> ImplicitFrame:
+        """
+        Get the latest frame, waiting for one to arrive if none has yet or
+        the latest is older than `max_age`.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to None
+                (wait forever).
+
+        Returns:
+            ImplicitFrame: The most recently received frame.
+
+        Raises:
+            TransmissionError: if no fresh frame arrived within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            frame = self._latest
+            if frame is not None and not self._is_stale(frame):
+                return frame
+            self._new_frame.clear()
+            if self._latest is not frame:
+                continue  # a frame arrived before the event was cleared
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if not self._new_frame.wait(remaining):
+                if frame is None:
+                    raise TransmissionError(
+                        "Timed out waiting for an implicit I/O frame"
+                    )
+                raise TransmissionError(
+                    f"The latest implicit I/O frame is "
+                    f"{time.time() - frame.timestamp:.3f} s old; the "
+                    f"connection may have been lost"
+                )
+
+    def register_subscriber(
+        self, callback: Callable[[ImplicitFrame], None]
+    ) -> Callable[[], None]:
+        """
+        Register a subscriber callback to be called for every new frame. The
+        callback runs on the reader thread, so it should be quick.
+
+        Args:
+            callback (Callable[[ImplicitFrame], None]): The callback function to register.
+
+        Returns:
+            Callable[[], None]: unsubscribe function
+        """
+        return self._subscribers.register(callback)
+
+    def stream(self, timeout: Optional[float] = None) -> Stream[ImplicitFrame]:
+        """
+        Iterate over frames as they arrive, until the consumer is closed.
+        Frames are queued from the moment this is called, so none are missed
+        between creating the iterator and first advancing it; `close()` it if
+        it won't be iterated to the end.
+
+        Args:
+            timeout (float, optional): Maximum seconds between frames before
+                the connection is considered lost. Defaults to None (no limit).
+
+        Returns:
+            Stream[ImplicitFrame]: iterator over each new frame.
+        """
+        return self._subscribers.stream(timeout)
+
+    def _is_stale(self, frame: ImplicitFrame) -> bool:
+        return self.max_age is not None and time.time() - frame.timestamp > self.max_age
+
+    def _heartbeat_loop(self, heartbeat: ImplicitHeartbeat) -> None:
+        data = (
+            _RUN_IDLE_HEADER.pack(1) + heartbeat.data
+            if heartbeat.run_idle_header
+            else heartbeat.data
+        )
+        encapsulation_sequence = 0
+        while not self._closed.wait(heartbeat.interval):
+            encapsulation_sequence = (encapsulation_sequence + 1) % 2**32
+            packet = (
+                _HEADER.pack(
+                    2,
+                    _SEQUENCED_ADDRESS_ITEM,
+                    8,
+                    heartbeat.connection_id,
+                    encapsulation_sequence,
+                    _CONNECTED_DATA_ITEM,
+                    len(data) + 2,
+                    encapsulation_sequence % 2**16,
+                )
+                + data
+            )
+            try:
+                self._listener.socket.sendto(packet, heartbeat.address)
+            except OSError:
+                return  # socket closed
+
+    def close(self) -> None:
+        """Stop receiving frames and release the socket."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._listener.remove(self)
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join()
+        # wake up any stream() iterators so they can finish
+        self._subscribers.end()
+        self._listener.release()
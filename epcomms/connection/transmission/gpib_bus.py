@@ -0,0 +1,301 @@
+import re
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Condition, Lock, get_ident
+from typing import Any, ClassVar, Generator, NamedTuple, Optional
+
+# Interface part of a GPIB resource name, e.g. "GPIB0" in "GPIB0::5::INSTR"
+_GPIB_INTERFACE = re.compile(r"^GPIB(\d*)::", re.IGNORECASE)
+# Status byte bit a device sets to request service
+_RQS = 0x40
+
+
+@dataclass(frozen=True)
+class BusStatistics:
+    """Usage of a GPIB bus since the statistics were last reset."""
+
+    transactions: int
+    # seconds the bus was held
+    busy_time: float
+    # seconds since the statistics were reset
+    elapsed: float
+    # seconds transactions spent waiting for the bus
+    total_wait: float
+    max_wait: float
+    # transactions per device
+    device_transactions: dict[str, int]
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the time the bus was held."""
+        return self.busy_time / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Average seconds a transaction waited for the bus."""
+        return self.total_wait / self.transactions if self.transactions else 0.0
+
+
+class _Ticket(NamedTuple):
+    """A transaction waiting for, or holding, the bus. Tickets are told
+    apart by identity."""
+
+    device: str
+    # time.perf_counter_ns() the transaction started waiting at
+    enqueued: int
+
+
+class GPIBBus:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Schedules transactions on one GPIB interface.
+
+    Every instrument on a GPIB interface shares the controller, so only one
+    transaction can be on the bus at a time. Transactions are granted
+    highest priority first, and round-robin between devices within a
+    priority, so a device polled in a tight loop can't starve the others.
+    A thread that holds the bus can start nested transactions (e.g. a
+    driver sending a command while in a transaction of its own).
+
+    There is one bus per interface; get it with `for_interface()` or
+    `for_resource()`.
+    """
+
+    _registry: ClassVar[dict[str, "GPIBBus"]] = {}
+    _registry_lock: ClassVar[Lock] = Lock()
+
+    def __init__(self, interface: str) -> None:
+        self.interface = interface
+        self._condition = Condition()
+        # priority -> device -> waiting tickets. Devices are kept in the
+        # order they are served in; a served device moves to the back.
+        self._queues: dict[int, OrderedDict[str, deque[_Ticket]]] = {}
+        self._owner: Optional[_Ticket] = None
+        self._owner_thread: Optional[int] = None
+        self._depth = 0
+        self._granted_at = 0
+        # resource name -> device, for serial polls
+        self._devices: dict[str, Any] = {}
+        # statistics
+        self._reset_at = time.perf_counter_ns()
+        self._transactions = 0
+        self._busy_ns = 0
+        self._wait_ns = 0
+        self._max_wait_ns = 0
+        self._device_transactions: dict[str, int] = {}
+
+    @classmethod
+    def for_interface(cls, interface: str) -> "GPIBBus":
+        """
+        Get the bus of a GPIB interface, creating it if needed.
+
+        Args:
+            interface (str): the interface, e.g. "GPIB0".
+
+        Returns:
+            GPIBBus: the interface's bus.
+        """
+        interface = interface.upper()
+        with cls._registry_lock:
+            if interface not in cls._registry:
+                cls._registry[interface] = cls(interface)
+            return cls._registry[interface]
+
+    @classmethod
+    def for_resource(cls, resource_name: str) -> Optional["GPIBBus"]:
+        """
+        Get the bus a VISA resource is on.
+
+        Args:
+            resource_name (str): the VISA resource name, e.g.
+                "GPIB0::5::INSTR".
+
+        Returns:
+            Optional[GPIBBus]: the bus, or None if it isn't a GPIB resource.
+        """
+        match = _GPIB_INTERFACE.match(resource_name)
+        if match is None:
+            return None
+        return cls.for_interface(f"GPIB{match.group(1) or 0}")
+
+    @property
+    def waiting(self) -> int:
+        """Number of transactions waiting for the bus."""
+        with self._condition:
+            return sum(
+                len(tickets)
+                for devices in self._queues.values()
+                for tickets in devices.values()
+            )
+
+    @contextmanager
+    def transaction(self, device: str, priority: int = 0) -> Generator[None, None, None]:
+        """
+        Hold the bus for the duration of the block.
+
+        Args:
+            device (str): the device the transaction is for (its resource
+                name).
+            priority (int, optional): higher priorities are served first.
+                Defaults to 0.
+        """
+        self._acquire(device, priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def attach(self, resource_name: str, device: Any) -> None:
+        """
+        Register a device for serial polls.
+
+        Args:
+            resource_name (str): the device's VISA resource name.
+            device (Any): the pyvisa resource (anything with read_stb()).
+        """
+        with self._condition:
+            self._devices[resource_name] = device
+
+    def detach(self, resource_name: str) -> None:
+        """Stop serial polling a device."""
+        with self._condition:
+            self._devices.pop(resource_name, None)
+
+    def service_requests(self, priority: int = 0) -> list[str]:
+        """
+        Serial poll every attached device to find the ones requesting
+        service, all in one bus transaction.
+
+        Args:
+            priority (int, optional): priority of the poll. Defaults to 0.
+
+        Returns:
+            list[str]: resource names of the devices requesting service.
+        """
+        with self._condition:
+            devices = list(self._devices.items())
+        with self.transaction(self.interface, priority):
+            return [
+                resource_name
+                for resource_name, device in devices
+                if device.read_stb() & _RQS
+            ]
+
+    def statistics(self) -> BusStatistics:
+        """
+        Returns:
+            BusStatistics: bus usage since the statistics were reset.
+        """
+        with self._condition:
+            busy = self._busy_ns
+            if self._owner is not None:
+                busy += time.perf_counter_ns() - self._granted_at
+            return BusStatistics(
+                transactions=self._transactions,
+                busy_time=busy / 1e9,
+                elapsed=(time.perf_counter_ns() - self._reset_at) / 1e9,
+                total_wait=self._wait_ns / 1e9,
+                max_wait=self._max_wait_ns / 1e9,
+                device_transactions=dict(self._device_transactions),
+            )
+
+    def reset_statistics(self) -> None:
+        """Start collecting statistics afresh."""
+        with self._condition:
+            self._reset_at = time.perf_counter_ns()
+            self._transactions = 0
+            self._busy_ns = 0
+            self._wait_ns = 0
+            self._max_wait_ns = 0
+            self._device_transactions = {}
+            if self._owner is not None:
+                self._granted_at = self._reset_at
+
+    def _acquire(self, device: str, priority: int) -> None:
+        thread = get_ident()
+        with self._condition:
+            if self._owner_thread == thread:
+                self._depth += 1
+                return
+            ticket = _Ticket(device, time.perf_counter_ns())
+            if self._owner is None and not self._queues:
+                self._grant(ticket)
+            else:
+                self._queues.setdefault(priority, OrderedDict()).setdefault(
+                    device, deque()
+                ).append(ticket)
+                try:
+                    while self._owner is not ticket:
+                        self._condition.wait()
+                except BaseException:
+                    # e.g. KeyboardInterrupt: nobody will use the ticket now
+                    self._withdraw(ticket, priority)
+                    raise
+            self._owner_thread = thread
+            self._depth = 1
+
+    def _release(self) -> None:
+        with self._condition:
+            self._depth -= 1
+            if self._depth:
+                return
+            self._pass_on()
+
+    def _pass_on(self) -> None:
+        """Free the bus and grant it to the next waiting ticket. Must be
+        called with the condition held."""
+        self._busy_ns += time.perf_counter_ns() - self._granted_at
+        self._owner = None
+        self._owner_thread = None
+        ticket = self._next_ticket()
+        if ticket is not None:
+            self._grant(ticket)
+            self._condition.notify_all()
+
+    def _withdraw(self, ticket: _Ticket, priority: int) -> None:
+        """Take back a ticket whose thread stopped waiting for the bus. Must
+        be called with the condition held."""
+        if self._owner is ticket:
+            # It was granted just as the wait was interrupted
+            self._pass_on()
+            return
+        devices = self._queues[priority]
+        tickets = devices[ticket.device]
+        # tickets are told apart by identity, not by value
+        for index, queued in enumerate(tickets):
+            if queued is ticket:
+                del tickets[index]
+                break
+        if not tickets:
+            del devices[ticket.device]
+        if not devices:
+            del self._queues[priority]
+
+    def _next_ticket(self) -> Optional[_Ticket]:
+        """Take the next ticket to serve off the queues."""
+        if not self._queues:
+            return None
+        priority = max(self._queues)
+        devices = self._queues[priority]
+        device, tickets = next(iter(devices.items()))
+        ticket = tickets.popleft()
+        # round-robin: the device goes to the back of its priority's queue
+        del devices[device]
+        if tickets:
+            devices[device] = tickets
+        if not devices:
+            del self._queues[priority]
+        return ticket
+
+    def _grant(self, ticket: _Ticket) -> None:
+        self._owner = ticket
+        self._granted_at = time.perf_counter_ns()
+        wait = self._granted_at - ticket.enqueued
+        self._transactions += 1
+        self._wait_ns += wait
+        self._max_wait_ns = max(self._max_wait_ns, wait)
+        self._device_transactions[ticket.device] = (
+            self._device_transactions.get(ticket.device, 0) + 1
+        )
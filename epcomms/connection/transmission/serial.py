@@ -1,16 +1,22 @@
-from typing import Optional, TypeVar
+from typing import Optional, TypeVar, Union, cast
 
 from serial import Serial as Pyserial
 
-from epcomms.connection.packet import ASCII, Bytes
+from epcomms.connection.packet import ASCII, Bytes, BytesView
 
 from .transmission import Transmission
 
-T = TypeVar("T", ASCII, Bytes)
+T = TypeVar("T", ASCII, Bytes, BytesView)
 
 
-class Serial(Transmission[T, T]):
-    """Serial transmission class using pyserial"""
+class Serial(Transmission[T, Union[T, Bytes]]):
+    """Serial transmission class using pyserial
+
+    With a `BytesView` packet type and a fixed `frame_length`, frames are
+    read into a buffer that is reused for every read, and received packets
+    are views of it that stay valid until the next read. `Bytes` packets
+    (e.g. precompiled command frames) can be sent whatever the packet type.
+    """
 
     # pylint: disable=too-many-arguments
     # pylint: disable=too-many-positional-arguments
@@ -30,6 +36,11 @@ class Serial(Transmission[T, T]):
         self._frame_terminator = frame_terminator
         self._frame_prefix = frame_prefix
         self._frame_length = frame_length
+        self._buffer: Optional[bytearray] = (
+            bytearray(frame_length)
+            if packet_type is BytesView and frame_length is not None
+            else None
+        )
         super().__init__()
 
         if frame_length is None and frame_terminator is None:
@@ -37,19 +48,21 @@ class Serial(Transmission[T, T]):
                 "At least one of frame_length or frame_terminator must be specified"
             )
 
-    def _command(self, packet: T) -> None:
+    def _command(self, packet: Union[T, Bytes]) -> None:
         self.driver.write(packet.serialize())
 
     def _read(self) -> T:
         data = bytes()
         if self._frame_prefix is not None:
             self.driver.read_until(self._frame_prefix)
+        if self._buffer is not None:
+            self.driver.readinto(self._buffer)
+            self._check_terminator()
+            # the buffer is only made for BytesView, which wraps it uncopied
+            return cast(T, BytesView.from_wire(self._buffer))
         if self._frame_length is not None:
             data += self.driver.read(self._frame_length)
-            if self._frame_terminator is not None:
-                postfix = self.driver.read(len(self._frame_terminator))
-                if postfix != self._frame_terminator:
-                    raise RuntimeError("Frame terminator not found where expected")
+            self._check_terminator()
         elif self._frame_terminator is not None:
             data += self.driver.read_until(self._frame_terminator)[
                 : -len(self._frame_terminator)
@@ -59,3 +72,9 @@ class Serial(Transmission[T, T]):
             raise RuntimeError("Unreachable state in Serial read")
 
         return self._packet_type.from_wire(data)
+
+    def _check_terminator(self) -> None:
+        if self._frame_terminator is not None:
+            postfix = self.driver.read(len(self._frame_terminator))
+            if postfix != self._frame_terminator:
+                raise RuntimeError("Frame terminator not found where expected")
@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+from queue import Empty, SimpleQueue
+from threading import Lock
+from typing import Callable, Generic, Optional, TypeVar, Union
+
+from .transmission import TransmissionError
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class _End:
+    """Queued to a stream to end it, raising `error` if there is one."""
+
+    error: Optional[TransmissionError] = None
+
+
+class Stream(Generic[T]):
+    """
+    Iterator over the updates queued for it by `Subscribers.stream()`.
+
+    It stops receiving updates once it finishes, is closed or is garbage
+    collected, so one that is never iterated doesn't keep filling up.
+    """
+
+    def __init__(
+        self,
+        updates: "SimpleQueue[Union[T, _End]]",
+        unsubscribe: Callable[[], None],
+        description: str,
+        timeout: Optional[float],
+    ) -> None:
+        self._updates = updates
+        self._unsubscribe: Optional[Callable[[], None]] = unsubscribe
+        self._description = description
+        self._timeout = timeout
+
+    def __iter__(self) -> "Stream[T]":
+        return self
+
+    def __next__(self) -> T:
+        if self._unsubscribe is None:
+            raise StopIteration
+        try:
+            update = self._updates.get(timeout=self._timeout)
+        except Empty as e:
+            self.close()
+            raise TransmissionError(
+                f"Timed out waiting for {self._description}"
+            ) from e
+        if isinstance(update, _End):
+            self.close()
+            if update.error is not None:
+                raise update.error
+            raise StopIteration
+        return update
+
+    def close(self) -> None:
+        """Stop receiving updates. Iterating afterwards just finishes."""
+        unsubscribe, self._unsubscribe = self._unsubscribe, None
+        if unsubscribe is not None:
+            unsubscribe()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+class Subscribers(Generic[T]):
+    """
+    Fans out updates pushed by a device (frames, status reports...) to
+    subscriber callbacks and `stream()` iterators.
+
+    Callbacks run on the thread that calls `notify`, usually a reader
+    thread, so they should be quick.
+    """
+
+    def __init__(self, description: str = "an update") -> None:
+        """
+        Args:
+            description (str, optional): what an update is, for error
+                messages. Defaults to "an update".
+        """
+        self._description = description
+        self._callbacks: list[Callable[[T], None]] = []
+        self._streams: list[SimpleQueue[Union[T, _End]]] = []
+        self._end: Optional[_End] = None
+        self._lock = Lock()
+
+    def register(self, callback: Callable[[T], None]) -> Callable[[], None]:
+        """
+        Register a callback to be called with every update.
+
+        Args:
+            callback (Callable[[T], None]): The callback function to register.
+
+        Returns:
+            Callable[[], None]: unsubscribe function
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+        def unregister() -> None:
+            with self._lock:
+                self._callbacks.remove(callback)
+
+        return unregister
+
+    def register_singleshot(self, callback: Callable[[T], None]) -> None:
+        """
+        Register a callback to be called with the next update only.
+
+        Args:
+            callback (Callable[[T], None]): callback to register.
+        """
+
+        def self_unregistering_wrapper(update: T) -> None:
+            try:
+                callback(update)
+            finally:
+                unregister()
+
+        unregister = self.register(self_unregistering_wrapper)
+
+    def stream(self, timeout: Optional[float] = None) -> Stream[T]:
+        """
+        Iterate over updates as they arrive, until `end()` is called.
+        Updates are queued from the moment this is called, so none are missed
+        between creating the iterator and first advancing it; `close()` it if
+        it won't be iterated to the end.
+
+        Args:
+            timeout (float, optional): Maximum seconds between updates before
+                the connection is considered lost. Defaults to None (no limit).
+
+        Returns:
+            Stream[T]: iterator over each new update.
+        """
+        updates: SimpleQueue[Union[T, _End]] = SimpleQueue()
+        with self._lock:
+            if self._end is not None:
+                updates.put(self._end)
+            self._streams.append(updates)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._streams.remove(updates)
+
+        return Stream(updates, unsubscribe, self._description, timeout)
+
+    def notify(self, update: T) -> None:
+        """Pass an update to every callback and stream."""
+        with self._lock:
+            callbacks = list(self._callbacks)
+            for updates in self._streams:
+                updates.put(update)
+        for callback in callbacks:
+            callback(update)
+
+    def end(self, error: Optional[TransmissionError] = None) -> None:
+        """
+        End every `stream()` iterator, and any started afterwards.
+
+        Args:
+            error (TransmissionError, optional): raised by the iterators, if
+                the updates stopped because something went wrong. Defaults to
+                None (the iterators just finish).
+        """
+        with self._lock:
+            self._end = _End(error)
+            for updates in self._streams:
+                updates.put(self._end)
@@ -1,4 +1,5 @@
 import time
+from contextlib import AbstractContextManager, nullcontext
 from threading import Lock
 from typing import ClassVar, Optional
 
@@ -6,12 +7,16 @@ import pyvisa
 
 from epcomms.connection.packet import String
 
+from .gpib_bus import GPIBBus
 from .transmission import Transmission
 
 
 class Visa(Transmission[String, String]):
     """
     Visa class for handling communication with VISA-compatible devices using the pyvisa library.
+
+    GPIB resources share their interface's GPIBBus, which schedules the
+    transactions of every instrument on the interface.
     """
 
     class_lock: ClassVar[Lock] = Lock()
@@ -34,7 +39,12 @@ class Visa(Transmission[String, String]):
             resources = cls.resource_manager.list_resources("?*")
         return resources
 
-    def __init__(self, resource_name: str, terminator: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        resource_name: str,
+        terminator: Optional[str] = None,
+        bus_priority: int = 0,
+    ) -> None:
         num_attempts = 10
         for i in range(num_attempts):
             try:
@@ -54,8 +64,27 @@ class Visa(Transmission[String, String]):
             break
         self.device.timeout = 2500
         self.terminator = terminator
+        self.resource_name = resource_name
+        # Priority of this instrument's transactions on a GPIB bus
+        self.bus_priority = bus_priority
+        self.bus = GPIBBus.for_resource(resource_name)
+        if self.bus is not None:
+            self.bus.attach(resource_name, self.device)
         super().__init__()
 
+    def _bus_transaction(self) -> AbstractContextManager[None]:
+        if self.bus is None:
+            return nullcontext()
+        return self.bus.transaction(self.resource_name, self.bus_priority)
+
+    def command(self, packet: String) -> None:
+        with self._bus_transaction():
+            super().command(packet)
+
+    def read(self) -> String:
+        with self._bus_transaction():
+            return super().read()
+
     def _command(self, packet: String) -> None:
         try:
             self.device.write(packet.serialize(), termination=self.terminator)
@@ -71,11 +100,13 @@ class Visa(Transmission[String, String]):
         return packet
 
     def poll(self, packet: String) -> String:
-        with self._lock:
+        with self._bus_transaction(), self._lock:
             try:
                 return String.from_wire(self.device.query(packet.serialize()))
             except Exception as e:
                 raise e
 
     def close(self) -> None:
+        if self.bus is not None:
+            self.bus.detach(self.resource_name)
         self.device.close()
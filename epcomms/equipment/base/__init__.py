@@ -2,4 +2,8 @@ from .instrument import CommandError as CommandError
 from .instrument import Instrument as Instrument
 from .instrument import MeasurementError as MeasurementError
 from .instrument import TransmissionTypeT as TransmissionTypeT
+from .scpiinstrument import SCPI_OVERFLOW as SCPI_OVERFLOW
+from .scpiinstrument import ErrorCheckPolicy as ErrorCheckPolicy
+from .scpiinstrument import SCPIArray as SCPIArray
 from .scpiinstrument import SCPIInstrument as SCPIInstrument
+from .scpiinstrument import SCPITemplate as SCPITemplate
@@ -1,4 +1,184 @@
-from typing import Callable, TypeVar, Union
+import re
+from contextlib import contextmanager
+from enum import Enum
+from functools import lru_cache
+from threading import local
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    NamedTuple,
+    Optional,
+    Protocol,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import numpy as np
+import numpy.typing as npt
+
+from epcomms.connection.packet import ASCII, String
+from epcomms.connection.transmission import Transmission
+
+from .instrument import CommandError
+
+# pylint: disable-next=invalid-name
+ChannelsT = Union[int, list[int], tuple[int, ...], None]
+
+
+def _hashable_channels(channels: ChannelsT) -> Union[int, tuple[int, ...], None]:
+    return tuple(channels) if isinstance(channels, list) else channels
+
+
+def _channel_string(channels: Union[int, list[int], tuple[int, ...], str]) -> str:
+    """Build a SCPI channel list, writing runs of three or more consecutive
+    channels as ranges, e.g. [1, 2, 3, 5] -> "1:3,5"."""
+    if not isinstance(channels, (list, tuple)):
+        return str(channels)
+
+    entries: list[str] = []
+    run: list[int] = []
+    for channel in filter(None, channels):
+        if run and channel != run[-1] + 1:
+            entries += _run_entries(run)
+            run = []
+        run.append(channel)
+    entries += _run_entries(run)
+    return ",".join(entries)
+
+
+def _run_entries(run: list[int]) -> list[str]:
+    if len(run) >= 3:
+        return [f"{run[0]}:{run[-1]}"]
+    return [str(channel) for channel in run]
+
+
+@lru_cache(maxsize=1024)
+def _format_message(
+    keyword: str,
+    arguments: Union[str, tuple[Optional[str], ...], None],
+    channels: Union[int, tuple[int, ...], None],
+) -> str:
+    """Build (and remember) a SCPI message string. `keyword` already carries
+    the trailing '?' for queries."""
+    if isinstance(arguments, tuple):
+        arguments = ",".join(filter(None, arguments))
+
+    message = keyword
+    if arguments:
+        message += f" {arguments}"
+    if channels:
+        if arguments:
+            message += ","
+        message += f" (@{_channel_string(channels)})"
+    return message
+
+
+# Value SCPI instruments report for an overloaded (out of range) reading
+SCPI_OVERFLOW = 9.9e37
+
+
+class SCPIArray(NamedTuple):
+    """A numeric SCPI response parsed into arrays."""
+
+    values: npt.NDArray[np.float64]
+    # True where the instrument reported an overload
+    overflow: npt.NDArray[np.bool_]
+    # Unit suffix of each value (e.g. "VDC"), or None if the response had none
+    units: Optional[npt.NDArray[np.str_]] = None
+
+
+# An error queue entry, e.g. -113,"Undefined header"
+_ERROR_ENTRY = re.compile(r'([+-]?\d+),\s*"([^"]*)"')
+
+
+class ErrorCheckPolicy(Enum):
+    """When to check an instrument's error queue."""
+
+    # Only when asked to (read_errors())
+    OFF = "off"
+    # After every N operations
+    EVERY_N = "every_n"
+    # Piggybacked on each query as ';:SYST:ERR?', costing no extra round trip
+    APPENDED = "appended"
+
+
+class SCPITemplate:
+    # pylint: disable=too-few-public-methods # it's used by calling it
+    """
+    A SCPI command or query with a fixed keyword and argument schema.
+
+    The template is compiled once with one formatter per argument (e.g. to
+    validate a range and turn it into a string), and every message it
+    renders is cached, so hot loops that send the same message over and
+    over get the same string back without re-validating or re-formatting.
+    """
+
+    __slots__ = ("keyword", "_formatters", "_render")
+
+    def __init__(
+        self,
+        keyword: str,
+        *formatters: Callable[[Any], str],
+        query: bool = False,
+        cache_size: int = 256,
+    ) -> None:
+        """
+        Args:
+            keyword (str): The SCPI command or query keyword.
+            *formatters (Callable[[Any], str]): One formatter per argument,
+                converting the argument to its SCPI string.
+            query (bool, optional): Whether this is a query ('?' is
+                appended to the keyword). Defaults to False.
+            cache_size (int, optional): Number of rendered messages to
+                remember. Defaults to 256.
+        """
+        self.keyword = f"{keyword}?" if query else keyword
+        self._formatters = formatters
+        self._render = lru_cache(maxsize=cache_size)(self._render_uncached)
+
+    def __call__(self, *arguments: Any, channels: ChannelsT = None) -> str:
+        """
+        Render the message.
+
+        Args:
+            *arguments (Any): The arguments, one per formatter.
+            channels (int, list[int]): The channel number(s) to apply the
+                message to.
+
+        Returns:
+            str: The SCPI message string.
+        """
+        return self._render(arguments, _hashable_channels(channels))
+
+    def _render_uncached(
+        self,
+        arguments: tuple[Any, ...],
+        channels: Union[int, tuple[int, ...], None],
+    ) -> str:
+        if len(arguments) != len(self._formatters):
+            raise TypeError(
+                f"{self.keyword} takes {len(self._formatters)} arguments "
+                f"({len(arguments)} given)"
+            )
+        return _format_message(
+            self.keyword,
+            tuple(
+                formatter(argument)
+                for formatter, argument in zip(self._formatters, arguments)
+            ),
+            channels,
+        )
+
+
+class _HasTransmission(Protocol):
+    """What SCPIInstrument needs from the instrument it's mixed into."""
+
+    @property
+    def transmission(self) -> Transmission[Any, Any]:
+        """The instrument's transmission."""
+        raise NotImplementedError
 
 
 class SCPIInstrument:
@@ -7,16 +187,103 @@ class SCPIInstrument:
 
     This mixin provides utility methods for generating SCPI command and query
     strings, as well as parsing SCPI responses.
+
+    Commands sent with `_write` can be deferred with `batch()` and sent
+    together as one message.
     """
 
+    # Packet type commands are sent as
+    _packet: type[Union[String, ASCII]] = String
+
+    @property
+    def _batch(self) -> Optional[list[str]]:
+        """Commands deferred by the calling thread's batch(), or None outside
+        of a batch. Batches are per thread, so commands from other threads
+        are never caught up in one."""
+        return getattr(self._batch_threads, "commands", None)
+
+    @_batch.setter
+    def _batch(self, commands: Optional[list[str]]) -> None:
+        self._batch_threads.commands = commands
+
+    @property
+    def _batch_threads(self) -> local:
+        # The mixin has no __init__, so the thread-local state is made on
+        # first use. setdefault() keeps threads racing to make it on one.
+        try:
+            return self.__dict__["_batch_local"]
+        except KeyError:
+            return self.__dict__.setdefault("_batch_local", local())
+
+    @property
+    def _scpi_transmission(self) -> Transmission[Any, Any]:
+        # Declared by the instrument class, with its own (narrower) type
+        # pylint: disable-next=no-member
+        return cast(_HasTransmission, self).transmission
+
+    @contextmanager
+    def batch(self, wait: bool = False) -> Generator[None, None, None]:
+        """
+        Defer commands (e.g. set_voltage(), set_output()) until the end of
+        the block, then send them as one ';'-joined message. Queries are not
+        deferred. If the block raises, the deferred commands are dropped.
+        Nested batches join the outermost one. Only commands from the thread
+        that opened the batch are deferred.
+
+        Args:
+            wait (bool, optional): follow the commands with *OPC? and wait
+                for the instrument to finish them. Defaults to False.
+        """
+        if self._batch is not None:
+            yield
+            return
+
+        self._batch = []
+        try:
+            yield
+            commands = self._batch
+        except BaseException:
+            self._batch_failed()
+            raise
+        finally:
+            self._batch = None
+
+        if not commands:
+            return
+        message = ";:".join(commands)
+        try:
+            if wait:
+                response = self._scpi_transmission.poll(
+                    self._packet.from_data(f"{message};*OPC?")
+                ).deserialize()
+                if response.strip() != "1":
+                    raise CommandError(f"Unexpected *OPC? response: {response}")
+            else:
+                self._scpi_transmission.command(self._packet.from_data(message))
+        except BaseException:
+            self._batch_failed()
+            raise
+
+    def _write(self, message: str) -> None:
+        """Send a command, or defer it if in a batch()."""
+        if self._batch is not None:
+            self._batch.append(message)
+        else:
+            self._scpi_transmission.command(self._packet.from_data(message))
+
+    def _batch_failed(self) -> None:
+        """Called when deferred commands are dropped or fail to send, so
+        drivers can forget state that assumed they were applied."""
+
     def generate_command(
         self,
         command_keyword: str,
         arguments: Union[str, list[str], None] = None,
-        channels: Union[int, list[int], None] = None,
+        channels: ChannelsT = None,
     ) -> str:
         """
-        Generates a SCPI command string.
+        Generates a SCPI command string. Generated strings are cached, so
+        repeated identical commands are cheap.
 
         Args:
             command_keyword (str): The SCPI command keyword.
@@ -26,24 +293,21 @@ class SCPIInstrument:
         Returns:
             str: The SCPI command string.
         """
-
-        channel_str = self._channel_string(channels) if channels else None
-
-        if isinstance(arguments, list):
-            arguments = ",".join(list(filter(None, arguments)))
-
-        # pylint: disable=line-too-long
-        # IDK man it's a long line, what are you gonna do
-        return f"{command_keyword}{f" {arguments}" if arguments else ''}{',' if arguments and channels else ''}{f" (@{channel_str})" if channels else ''}"
+        return _format_message(
+            command_keyword,
+            tuple(arguments) if isinstance(arguments, list) else arguments,
+            _hashable_channels(channels),
+        )
 
     def generate_query(
         self,
         query_keyword: str,
         arguments: Union[str, list[str], None] = None,
-        channels: Union[int, list[int], None] = None,
+        channels: ChannelsT = None,
     ) -> str:
         """
-        Generates a SCPI query string.
+        Generates a SCPI query string. Generated strings are cached, so
+        repeated identical queries are cheap.
 
         Args:
             query_keyword (str): The SCPI query keyword.
@@ -52,14 +316,11 @@ class SCPIInstrument:
         Returns:
             str: The SCPI query string.
         """
-        channel_str = self._channel_string(channels) if channels else None
-
-        if isinstance(arguments, list):
-            arguments = list(filter(None, arguments))
-            arguments = ",".join(arguments)
-
-        # pylint: disable=line-too-long
-        return f"{query_keyword}?{f" {arguments}" if arguments else ''}{',' if arguments and channels else ''}{f" (@{channel_str})" if channels else ''}"
+        return _format_message(
+            f"{query_keyword}?",
+            tuple(arguments) if isinstance(arguments, list) else arguments,
+            _hashable_channels(channels),
+        )
 
     T = TypeVar("T")
 
@@ -83,10 +344,54 @@ class SCPIInstrument:
 
         return [conversion_function(value) for value in value_list]
 
-    @classmethod
-    def _channel_string(cls, channels: Union[int, list[int], str]) -> str:
-        return (
-            ",".join([str(ch) for ch in list(filter(None, channels))])
-            if isinstance(channels, list)
-            else str(channels)
+    def parse_errors(self, response: str) -> list[tuple[int, str]]:
+        """
+        Parse one or more SYST:ERR? responses, leaving out "No error" entries.
+
+        Args:
+            response (str): the SCPI response string, e.g.
+                '-113,"Undefined header";+0,"No error"'
+
+        Returns:
+            list[tuple[int, str]]: the (code, message) of each error.
+        """
+        return [
+            (int(code), message)
+            for code, message in _ERROR_ENTRY.findall(response)
+            if int(code) != 0
+        ]
+
+    def parse_array(
+        self, response: str, overflow: Optional[float] = SCPI_OVERFLOW
+    ) -> SCPIArray:
+        """
+        Parse a comma separated numeric SCPI response into arrays in one pass,
+        rather than converting every value separately. Use this for long
+        responses such as buffered readings or multi-channel queries.
+
+        Args:
+            response (str): the SCPI response string
+            overflow (float, optional): magnitude at or above which a value is
+                flagged as an overload. None disables the check. Defaults to
+                SCPI_OVERFLOW (9.9e37).
+
+        Returns:
+            SCPIArray: the values, their overflow mask and their units, if
+                the values had unit suffixes.
+        """
+        fields = response.strip().split(",")
+        units: Optional[npt.NDArray[np.str_]] = None
+        try:
+            values = np.array(fields, dtype=np.float64)
+        except ValueError:
+            # values with unit suffixes, e.g. "+1.2345E+00 VDC"
+            parts = np.char.partition(np.char.strip(np.array(fields)), " ")
+            values = parts[:, 0].astype(np.float64)
+            units = np.char.strip(parts[:, 2])
+
+        mask = (
+            np.abs(values) >= overflow
+            if overflow is not None
+            else np.zeros(values.shape, dtype=np.bool_)
         )
+        return SCPIArray(values, mask, units)
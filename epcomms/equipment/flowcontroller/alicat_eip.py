@@ -1,8 +1,20 @@
 from dataclasses import dataclass
-
-from epcomms.connection.packet import CIPTX, CIPData
+from typing import Callable, Optional
+
+from epcomms.connection.packet import (
+    CIPTX,
+    CIPData,
+    PrecompiledCIPTX,
+    RecordField,
+    RecordLayout,
+)
 from epcomms.connection.packet.cip_datatypes import REAL, STRING, UDINT, UINT, WORD
-from epcomms.connection.transmission import EthernetIP, TransmissionError
+from epcomms.connection.transmission import (
+    EthernetIP,
+    ImplicitFrame,
+    ImplicitIOConsumer,
+    TransmissionError,
+)
 
 from .flow_controller import FlowController
 
@@ -32,10 +44,114 @@ class AlicatEIP(FlowController[EthernetIP]):
         "serial_number": (6, UDINT),
         "product_name": (7, STRING),
     }
+    # identity elements that never change while connected; everything else
+    # (i.e. the status word) is always read from the device
+    _static_identity_elements = frozenset(
+        {"vendor_id", "device_type", "product_code", "serial_number", "product_name"}
+    )
+
+    # Request packets that never change are built once
+    _identity_packets: dict[str, PrecompiledCIPTX] = {
+        element: PrecompiledCIPTX(
+            CIPData(class_code=1, instance=1, attribute=attribute, data_type=data_type)
+        )
+        for element, (attribute, data_type) in _identity_lut.items()
+    }
+    _setpoint_packet = PrecompiledCIPTX(
+        CIPData(class_code=4, instance=100, attribute=3, data_type=REAL)
+    )
+    _readings_packet = PrecompiledCIPTX(CIPData(class_code=4, instance=101, attribute=3))
+    _command_status_packet = PrecompiledCIPTX(
+        CIPData(class_code=4, instance=102, attribute=3)
+    )
+
+    # Readings assembly (instance 101) layout
+    _readings_layout = RecordLayout(
+        "DeviceReadings",
+        [
+            RecordField("gas", 0, UINT),
+            RecordField("status", 2, UDINT),
+            RecordField("gauge_pressure", 6, REAL),
+            RecordField("flow_temp", 10, REAL),
+            RecordField("volumetric_flow", 14, REAL),
+            RecordField("mass_flow", 18, REAL),
+            RecordField("mass_flow_setpoint", 22, REAL),
+        ],
+        record_type=DeviceReadings,
+    )
+    # Command assembly (instance 102) layout; the command status reads back
+    # the same two fields
+    _command_layout: RecordLayout[tuple[int, int]] = RecordLayout(
+        "DeviceCommand",
+        [RecordField("command_id", 0, UINT), RecordField("argument", 2, UINT)],
+    )
+
+    # Implicit I/O assemblies. The readings assembly (instance 101) is 26
+    # bytes; the heartbeat and configuration connection points follow the
+    # usual ODVA input-only convention.
+    _readings_assembly = 101
+    _readings_size = _readings_layout.size
+    _heartbeat_connection_point = 198
+    _configuration_assembly = 1
 
     def __init__(self, routing_path: str):
         transmission = EthernetIP(routing_path)
         super().__init__(transmission)
+        self._implicit_io: Optional[ImplicitIOConsumer] = None
+        self._identity_cache: dict[str, int | str] = {}
+        self._identity_cache_generation = 0
+
+    def start_streaming(self, rpi: float = 0.05) -> None:
+        """
+        Open a cyclic implicit I/O connection so the device pushes its
+        readings every `rpi` seconds. While streaming, all reading getters
+        return the most recent pushed readings instead of polling the device.
+
+        Args:
+            rpi (float, optional): Requested packet interval in seconds.
+                Defaults to 0.05.
+        """
+        if self._implicit_io is not None:
+            return
+        self._implicit_io = self.transmission.open_implicit_io(
+            input_assembly=self._readings_assembly,
+            input_size=self._readings_size,
+            rpi=rpi,
+            output_assembly=self._heartbeat_connection_point,
+            configuration_assembly=self._configuration_assembly,
+        )
+
+    def stop_streaming(self) -> None:
+        """Close the implicit I/O connection and go back to polling."""
+        if self._implicit_io is None:
+            return
+        self.transmission.close_implicit_io(self._implicit_io)
+        self._implicit_io = None
+
+    def register_subscriber(
+        self, callback: Callable[[DeviceReadings], None]
+    ) -> Callable[[], None]:
+        """
+        Register a callback to be called with every pushed set of readings.
+        Streaming must have been started with `start_streaming`.
+
+        Args:
+            callback (Callable[[DeviceReadings], None]): The callback function to register.
+
+        Returns:
+            Callable[[], None]: unsubscribe function
+        """
+        if self._implicit_io is None:
+            raise RuntimeError("Streaming has not been started.")
+
+        def decode_frame(frame: ImplicitFrame) -> None:
+            callback(self._decode_device_readings(frame.data))
+
+        return self._implicit_io.register_subscriber(decode_frame)
+
+    def close(self) -> None:
+        self.stop_streaming()
+        super().close()
 
     def get_pressure(self) -> float:
         return self._get_device_readings().gauge_pressure
@@ -83,10 +199,7 @@ class AlicatEIP(FlowController[EthernetIP]):
         Returns:
             float: The current setpoint value.
         """
-        packet = CIPTX.from_data(
-            CIPData(class_code=4, instance=100, attribute=3, data_type=REAL)
-        )
-        response = self.transmission.poll(packet)
+        response = self.transmission.poll(self._setpoint_packet)
         return float(response.deserialize())
 
     def set_setpoint(self, setpoint: float) -> None:
@@ -233,22 +346,29 @@ class AlicatEIP(FlowController[EthernetIP]):
                 - "mass_flow" (float): The mass flow rate.
                 - "mass_flow_setpoint" (float): The mass flow setpoint.
         """
-        packet = CIPTX.from_data(CIPData(class_code=4, instance=101, attribute=3))
+        if self._implicit_io is not None:
+            return self._decode_device_readings(
+                self._implicit_io.wait_for_frame(timeout=1.0).data
+            )
 
-        data = self.transmission.poll(packet).deserialize()
+        data = self.transmission.poll(self._readings_packet).deserialize()
         if not isinstance(data, bytes) or isinstance(data, str):
             # str is a subclass of bytes(?), so check that first
             raise TransmissionError("Device readings response is not bytes.")
 
-        return DeviceReadings(
-            gas=UINT.decode(data[0:2]),
-            status=UDINT.decode(data[2:6]),
-            gauge_pressure=REAL.decode(data[6:10]),
-            flow_temp=REAL.decode(data[10:14]),
-            volumetric_flow=REAL.decode(data[14:18]),
-            mass_flow=REAL.decode(data[18:22]),
-            mass_flow_setpoint=REAL.decode(data[22:26]),
-        )
+        return self._decode_device_readings(data)
+
+    def _decode_device_readings(self, data: bytes) -> DeviceReadings:
+        """
+        Decode the readings assembly (instance 101).
+
+        Args:
+            data (bytes): The raw assembly data.
+
+        Returns:
+            DeviceReadings: the decoded readings.
+        """
+        return self._readings_layout.decode(data)
 
     def _send_device_command(self, command_id: int, argument: int) -> None:
         """
@@ -260,39 +380,63 @@ class AlicatEIP(FlowController[EthernetIP]):
         Raises:
             TransmissionError: If the device does not acknowledge the command correctly.
         """
-        params = UINT.encode(command_id) + UINT.encode(argument)
+        params = self._command_layout.encode(command_id, argument)
         packet = CIPTX.from_data(
             CIPData(class_code=4, instance=102, attribute=3, request_data=params)
         )
         self.transmission.command(packet)
-        check_packet = CIPTX.from_data(CIPData(class_code=4, instance=102, attribute=3))
 
-        data = self.transmission.poll(check_packet).deserialize()
+        data = self.transmission.poll(self._command_status_packet).deserialize()
         if not isinstance(data, bytes) or isinstance(data, str):
             # str is a subclass of bytes(?), so check that explicitly.
             raise TransmissionError("Device readings response is not bytes.")
-        if UINT.decode(data[0:2]) != command_id or UINT.decode(data[2:4]) != argument:
+        if self._command_layout.unpack(data) != (command_id, argument):
             raise TransmissionError("Device did not acknowledge command.")
 
+    def clear_identity_cache(self) -> None:
+        """
+        Forget cached static identity elements so they are read from the
+        device again. The cache is cleared automatically on reconnect.
+        """
+        self._identity_cache.clear()
+
     def _get_identity_element(self, element: str) -> int | str:
         """
         Retrieves the identity element specified by the given element name.
+        Static elements are cached for the lifetime of the connection.
         Args:
             element (str): The name of the identity element to retrieve.
         Returns:
             Union[int, str]: The value of the requested identity element,
             which can be either an integer or a string.
         """
-        packet = CIPTX.from_data(
-            CIPData(
-                class_code=1,
-                instance=1,
-                attribute=self._identity_lut[element][0],
-                data_type=self._identity_lut[element][1],
-            )
-        )
-
-        response = self.transmission.poll(packet)
+        if element not in self._static_identity_elements:
+            return self._read_identity_element(element)
+
+        if self._identity_cache_generation != self.transmission.generation:
+            # The device may have been swapped or reconfigured while we
+            # were disconnected
+            self._identity_cache.clear()
+            self._identity_cache_generation = self.transmission.generation
+        if element not in self._identity_cache:
+            value = self._read_identity_element(element)
+            if self._identity_cache_generation != self.transmission.generation:
+                # reconnected during the read; start a fresh cache
+                self._identity_cache.clear()
+                self._identity_cache_generation = self.transmission.generation
+            self._identity_cache[element] = value
+        return self._identity_cache[element]
+
+    def _read_identity_element(self, element: str) -> int | str:
+        """
+        Reads the identity element specified by the given element name from
+        the device.
+        Args:
+            element (str): The name of the identity element to read.
+        Returns:
+            Union[int, str]: The value of the requested identity element.
+        """
+        response = self.transmission.poll(self._identity_packets[element])
 
         data = response.deserialize()
         if isinstance(data, float):
@@ -1,5 +1,13 @@
 from .fluke45 import Fluke45 as Fluke45
 from .keysight_edu34450a import KeysightEDU34450A as KeysightEDU34450A
+from .multimeter import MeasurementFunction as MeasurementFunction
 from .multimeter import Multimeter as Multimeter
+from .multimeter_group import GroupReading as GroupReading
+from .multimeter_group import MultimeterGroup as MultimeterGroup
+from .range_predictor import RangePredictor as RangePredictor
+from .scpi_multimeter import PROFILES as PROFILES
+from .scpi_multimeter import Acquisition as Acquisition
+from .scpi_multimeter import MeasurementProfile as MeasurementProfile
 from .scpi_multimeter import SCPIMultimeter as SCPIMultimeter
+from .scpi_multimeter import Statistics as Statistics
 from .tektronix_dmm4050 import TektronixDMM4050 as TektronixDMM4050
@@ -1,35 +1,83 @@
-from typing import Literal
+import time
+from typing import Iterator, Literal, NamedTuple, Optional
 
-from epcomms.connection.packet import ASCII
+from epcomms.connection.packet import ASCII, PrecompiledASCII
 from epcomms.connection.transmission import Serial, TransmissionError
+from epcomms.equipment.base import MeasurementError
 
-from .multimeter import Multimeter
+from .multimeter import MeasurementFunction, Multimeter
+from .range_predictor import RangePredictor
 
 RangeT = Literal["AUTO"] | float | int | None
 ResolutionT = Literal["S", "M", "F"] | None
 
+# Magnitude of the reading the Fluke 45 sends when it is overloaded
+FLUKE_OVERFLOW = 1e9
+
+
+class FlukeReading(NamedTuple):
+    """A single streamed reading."""
+
+    timestamp: float
+    value: float
+
 
 class Fluke45(Multimeter[Serial[ASCII], RangeT, ResolutionT]):
-    """Fluke 45 Multimeter implementation."""
+    """Fluke 45 Multimeter implementation.
+
+    The driver mirrors the meter's function, range and rate, and only sends
+    the commands needed to change them. Whatever does need sending goes on a
+    single ';'-separated line together with the reading query, so the meter
+    answers with one prompt instead of one per command.
+    """
+
+    _function_commands: dict[MeasurementFunction, str] = {
+        "voltage_ac": "VAC",
+        "voltage_dc": "VDC",
+        "current_ac": "AAC",
+        "current_dc": "ADC",
+        "frequency": "FREQ",
+    }
+    # Full scale of RANGE 1, 2, ... for each function at the medium and fast
+    # rates (30,000 counts) and at the slow rate (100,000 counts)
+    _full_scales: dict[str, tuple[float, ...]] = {
+        "VDC": (0.3, 3.0, 30.0, 300.0, 1000.0),
+        "VAC": (0.3, 3.0, 30.0, 300.0, 750.0),
+        "ADC": (0.03, 0.1, 10.0),
+        "AAC": (0.03, 0.1, 10.0),
+    }
+    _full_scales_slow: dict[str, tuple[float, ...]] = {
+        "VDC": (0.1, 1.0, 10.0, 100.0, 1000.0),
+        "VAC": (0.1, 1.0, 10.0, 100.0, 750.0),
+        "ADC": (0.01, 0.1, 10.0),
+        "AAC": (0.01, 0.1, 10.0),
+    }
 
     def __init__(self, device_location: str, default_meas_rate: str = "F") -> None:
 
         if default_meas_rate not in ["F", "M", "S"]:
             raise ValueError("Invalid default measurement rate")
         super().__init__(transmission=Serial(device_location))
+        # Mirror of the meter's configuration; None when it isn't known
+        self._function: Optional[str] = None
+        self._range: Optional[str] = None
+        self._rate: Optional[str] = None
+        self._secondary: Optional[str] = None
+        self._range_predictor: Optional[RangePredictor] = None
         # set up the multimeter to take measurements at the specified rate
-        self.transmission.poll(ASCII.from_data(f"RATE {default_meas_rate}\r"))
-        self.transmission.poll(ASCII.from_data("TRIGGER 1\r"))
-        self.transmission.poll(ASCII.from_data("AUTO\r"))
+        self._execute([f"RATE {default_meas_rate}", "TRIGGER 1", "AUTO"])
+        self._rate = default_meas_rate
+        self._range = "AUTO"
 
-    def read_fluke_status(self) -> None:
+    @staticmethod
+    def check_fluke_status(status: str) -> None:
         """
-        Read and parse the fluke status string
-        """
-        # Just read the status string it sends back every time it takes a
-        # measurement and raise an error if it's unhappy
+        Check a fluke status string (command prompt), raising an error if the
+        multimeter is unhappy
 
-        status = self.transmission.read().deserialize()
+        Args:
+            status (str): the status string, e.g. "=>"
+        """
         if len(status) != 2 or status[-1] != ">":
             raise TransmissionError("Fluke 45 Invalid status string")
         if status[0] == "?":
@@ -37,64 +85,395 @@ class Fluke45(Multimeter[Serial[ASCII], RangeT, ResolutionT]):
         if status[0] == "!":
             raise TransmissionError("Fluke 45 Execution Error")
 
+    def read_fluke_status(self) -> None:
+        """
+        Read and parse the fluke status string
+        """
+        # Just read the status string it sends back every time it takes a
+        # measurement and raise an error if it's unhappy
+        self.check_fluke_status(self.transmission.read().deserialize())
+
+    def invalidate_state(self) -> None:
+        """
+        Forget the mirrored function, range and rate, so they are sent again
+        with the next measurement. Call this if the meter has been changed
+        from the front panel.
+        """
+        self._function = None
+        self._range = None
+        self._rate = None
+        self._secondary = None
+
+    def set_range_prediction(
+        self, enabled: bool, headroom: float = 1.25, history: int = 8
+    ) -> None:
+        """
+        Turn range prediction on or off. When on, voltage and current
+        measurements that don't give a range pin the smallest range that fits
+        recent readings (with headroom) instead of autoranging, and only
+        autorange again when a reading overloads or falls below 10% of full
+        scale.
+
+        Args:
+            enabled (bool): whether to predict ranges.
+            headroom (float, optional): factor applied to the largest recent
+                reading. Defaults to 1.25.
+            history (int, optional): readings remembered per function.
+                Defaults to 8.
+        """
+        self._range_predictor = (
+            RangePredictor(headroom, history, overflow=FLUKE_OVERFLOW)
+            if enabled
+            else None
+        )
+
     def set_range(self, measurement_range: RangeT) -> None:
         """Set the measurement range of the multimeter"""
+        range_command = self._range_command(measurement_range)
+        if range_command is not None and range_command != self._range:
+            self._execute([range_command])
+            self._range = range_command
+
+    def set_resolution(self, resolution: ResolutionT) -> None:
+        """Set the measurement resolution of the multimeter (i.e. measurement rate)"""
+        rate_command = self._rate_command(resolution)
+        if rate_command is not None and resolution != self._rate:
+            self._execute([rate_command])
+            self._rate = resolution
+
+    @staticmethod
+    def _range_command(measurement_range: RangeT) -> Optional[str]:
         if measurement_range is None:
-            return  # Use whatever range has been configured
+            return None  # Use whatever range has been configured
         if measurement_range == "AUTO":
-            self.transmission.command(ASCII.from_data("AUTO\r"))
-            self.read_fluke_status()
-            return
+            return "AUTO"
         if 1 <= measurement_range <= 7:
-            self.transmission.command(ASCII.from_data(f"RANGE {measurement_range}\r"))
-            self.read_fluke_status()
-            return
+            return f"RANGE {measurement_range}"
 
         raise ValueError(
             "Invalid Measurement range for Fluke 45. Must be AUTO or between 1 and 7"
         )
 
-    def set_resolution(self, resolution: ResolutionT) -> None:
-        """Set the measurement resolution of the multimeter (i.e. measurement rate)"""
+    @staticmethod
+    def _rate_command(resolution: ResolutionT) -> Optional[str]:
         # Resolution is "rate"
         if resolution is None:
-            return  # Use whatever resolution has been configured
+            return None  # Use whatever resolution has been configured
         if resolution in ["S", "M", "F"]:
-            self.transmission.command(ASCII.from_data(f"RATE {resolution}\r"))
-            self.read_fluke_status()
-            return
+            return f"RATE {resolution}"
         raise ValueError("Invalid resolution for Fluke 45. Must be S, M, or F")
 
+    def _execute(self, commands: list[str]) -> None:
+        """
+        Send commands on one line and check the single prompt that follows.
+
+        Args:
+            commands (list[str]): the commands to send.
+        """
+        try:
+            self.check_fluke_status(
+                self.transmission.poll(self._line(commands)).deserialize()
+            )
+        except TransmissionError:
+            # Some of the commands may have been applied; don't trust the mirror
+            self.invalidate_state()
+            raise
+
+    def _query(self, commands: list[str]) -> str:
+        """
+        Send commands ending with a query on one line, and read the response
+        and the prompt that follows it.
+
+        Args:
+            commands (list[str]): the commands to send, the last one a query.
+
+        Returns:
+            str: the response to the query.
+        """
+        try:
+            response = self.transmission.poll(self._line(commands)).deserialize()
+            if response.endswith(">"):
+                # The meter only sends a prompt if a command failed
+                self.check_fluke_status(response)
+                raise TransmissionError("Fluke 45 sent no reading")
+            self.read_fluke_status()
+        except TransmissionError:
+            self.invalidate_state()
+            raise
+        return response
+
+    @staticmethod
+    def _line(commands: list[str]) -> PrecompiledASCII:
+        # The set of lines this driver sends is small, so they're interned
+        return PrecompiledASCII(f"{';'.join(commands)}\r")
+
+    def _measure(
+        self,
+        function: str,
+        measurement_range: RangeT = None,
+        resolution: ResolutionT = None,
+    ) -> float:
+        """
+        Configure the multimeter (if needed) and take a reading, predicting
+        the range if range prediction is on and no range is given.
+
+        Args:
+            function (str): the function command, e.g. "VDC"
+            measurement_range (RangeT, optional): range to use. Defaults to
+                None (keep the current range).
+            resolution (ResolutionT, optional): rate to use. Defaults to
+                None (keep the current rate).
+
+        Returns:
+            float: the reading
+        """
+        rate = resolution if resolution is not None else self._rate
+        if (
+            self._range_predictor is None
+            or measurement_range is not None
+            or function not in self._full_scales
+            or rate is None
+        ):
+            return self._read(function, measurement_range, resolution)
+
+        full_scales = (
+            self._full_scales_slow if rate == "S" else self._full_scales
+        )[function]
+        index = self._range_predictor.predict(function, full_scales)
+        if index is not None:
+            value = self._read(function, index + 1, resolution)
+            if self._range_predictor.observe(function, value, full_scales, index):
+                return value
+        # No prediction yet, or the pinned range overloaded
+        value = self._read(function, "AUTO", resolution)
+        self._range_predictor.observe(function, value)
+        return value
+
+    def _read(
+        self, function: str, measurement_range: RangeT, resolution: ResolutionT
+    ) -> float:
+        commands, range_state = self._configuration_commands(
+            function, measurement_range, resolution
+        )
+        data = self._query([*commands, "VAL1?"])
+        self._update_state(function, range_state, resolution)
+        return float(data)
+
+    def _configuration_commands(
+        self, function: str, measurement_range: RangeT, resolution: ResolutionT
+    ) -> tuple[list[str], Optional[str]]:
+        """
+        Work out which commands are needed to configure the multimeter.
+
+        Returns:
+            tuple[list[str], Optional[str]]: the commands, and what the range
+                will be once they're sent.
+        """
+        range_command = self._range_command(measurement_range)
+        rate_command = self._rate_command(resolution)
+
+        commands: list[str] = []
+        range_state = self._range
+        if function != self._function:
+            commands.append(function)
+            # The range may change along with the function
+            range_state = None
+        if range_command is not None and range_command != range_state:
+            commands.append(range_command)
+            range_state = range_command
+        if rate_command is not None and resolution != self._rate:
+            commands.append(rate_command)
+        return commands, range_state
+
+    def _update_state(
+        self, function: str, range_state: Optional[str], resolution: ResolutionT
+    ) -> None:
+        rate = self._rate if resolution is None else resolution
+        if (function, range_state, rate) != (self._function, self._range, self._rate):
+            # An armed configuration doesn't survive measuring something else
+            self._armed = None
+        if function != self._function:
+            # The secondary display may be turned off along with the function
+            self._secondary = None
+        self._function = function
+        self._range = range_state
+        if resolution is not None:
+            self._rate = resolution
+
+    def measure_pair(
+        self,
+        primary: MeasurementFunction,
+        secondary: MeasurementFunction,
+        measurement_range: RangeT = None,
+        resolution: ResolutionT = None,
+    ) -> tuple[float, float]:
+        for function in (primary, secondary):
+            if function not in self._function_commands:
+                raise NotImplementedError(
+                    f"The Fluke 45 does not support {function} measurements"
+                )
+        function_command = self._function_commands[primary]
+        secondary_command = f"{self._function_commands[secondary]}2"
+
+        commands, range_state = self._configuration_commands(
+            function_command, measurement_range, resolution
+        )
+        if commands[:1] == [function_command] or secondary_command != self._secondary:
+            commands.append(secondary_command)
+        # VAL? returns both displays' readings, from the same trigger
+        data = self._query([*commands, "VAL?"])
+        self._update_state(function_command, range_state, resolution)
+        self._secondary = secondary_command
+
+        primary_value, secondary_value = data.split(",")
+        return float(primary_value), float(secondary_value)
+
+    def arm(
+        self,
+        function: MeasurementFunction,
+        measurement_range: RangeT = None,
+        resolution: ResolutionT = None,
+    ) -> None:
+        """
+        Configure the multimeter for trigger() and fetch(). The meter
+        triggers continuously, so arming only configures it; measuring
+        anything else disarms it.
+
+        Args:
+            function (MeasurementFunction): the measurement function.
+            measurement_range (RangeT, optional): range to use. Defaults to
+                None (keep the current range).
+            resolution (ResolutionT, optional): rate to use. Defaults to
+                None (keep the current rate).
+        """
+        if function not in self._function_commands:
+            raise NotImplementedError(
+                f"The Fluke 45 does not support {function} measurements"
+            )
+        function_command = self._function_commands[function]
+        commands, range_state = self._configuration_commands(
+            function_command, measurement_range, resolution
+        )
+        if commands:
+            self._execute(commands)
+        self._update_state(function_command, range_state, resolution)
+        self._armed = (function, measurement_range, resolution)
+
+    def trigger(self) -> None:
+        """Ask for the latest reading; fetch() picks up the response. The
+        multimeter must have been armed."""
+        if self._armed is None:
+            raise MeasurementError("The multimeter has not been armed")
+        self.transmission.command(self._line(["VAL1?"]))
+
+    def fetch(self) -> float:
+        """
+        Read the response to the last trigger().
+
+        Returns:
+            float: the reading
+        """
+        if self._armed is None:
+            raise MeasurementError("The multimeter has not been armed")
+        try:
+            response = self.transmission.read().deserialize()
+            if response.endswith(">"):
+                self.check_fluke_status(response)
+                raise TransmissionError("Fluke 45 sent no reading")
+            self.read_fluke_status()
+        except TransmissionError:
+            self.invalidate_state()
+            raise
+        return float(response)
+
+    def stream(
+        self,
+        function: Optional[MeasurementFunction] = None,
+        measurement_range: RangeT = None,
+        resolution: ResolutionT = None,
+        auto_print: bool = False,
+    ) -> Iterator[FlukeReading]:
+        """
+        Read measurements continuously, as fast as the meter produces them
+        (use resolution "F" for the highest rate).
+
+        The meter is kept in continuous (internal) trigger mode and polled
+        with VAL1?, keeping a second query in flight so the serial link never
+        sits idle. Responses and prompts are parsed as they arrive, rather
+        than with a separate read per prompt. Don't use the meter for
+        anything else until the iterator is closed.
+
+        Args:
+            function (MeasurementFunction, optional): the function to measure.
+                Defaults to None (keep the current function).
+            measurement_range (RangeT, optional): range to use. Defaults to
+                None (keep the current range).
+            resolution (ResolutionT, optional): rate to use. Defaults to
+                None (keep the current rate).
+            auto_print (bool, optional): the meter is in print-only mode and
+                sends every reading on its own, so just listen. The meter
+                doesn't accept commands in that mode, so it is used as
+                configured from the front panel. Defaults to False.
+
+        Yields:
+            FlukeReading: each reading, with the host time it was received.
+        """
+        if auto_print:
+            while True:
+                line = self.transmission.read().deserialize()
+                yield FlukeReading(time.time(), float(line))
+
+        if function is not None:
+            if function not in self._function_commands:
+                raise NotImplementedError(
+                    f"The Fluke 45 does not support {function} measurements"
+                )
+            commands, range_state = self._configuration_commands(
+                self._function_commands[function], measurement_range, resolution
+            )
+            self._execute([*commands, "TRIGGER 1"])
+            self._update_state(
+                self._function_commands[function], range_state, resolution
+            )
+
+        query = self._line(["VAL1?"])
+        outstanding = 0
+        try:
+            for _ in range(2):
+                self.transmission.command(query)
+                outstanding += 1
+            while True:
+                line = self.transmission.read().deserialize()
+                if not line.endswith(">"):
+                    yield FlukeReading(time.time(), float(line))
+                    continue
+                # A prompt ends each query; raise if it failed, else send
+                # the next one
+                outstanding -= 1
+                self.check_fluke_status(line)
+                self.transmission.command(query)
+                outstanding += 1
+        except TransmissionError:
+            self.invalidate_state()
+            raise
+        finally:
+            # Let the queries still in flight finish so their responses
+            # aren't mistaken for responses to the next command
+            while outstanding > 0:
+                if self.transmission.read().deserialize().endswith(">"):
+                    outstanding -= 1
+
     def measure_voltage_ac(
         self,
         measurement_range: RangeT = None,
         resolution: ResolutionT = None,
     ) -> float:
-        self.set_range(measurement_range)
-        self.set_resolution(resolution)
-        self.transmission.command(
-            ASCII("VAC\r")
-        )  # set the multimeter to measure AC voltage
-        self.read_fluke_status()  # read the status string to make sure the multimeter is happy
-
-        data = self.transmission.poll(
-            ASCII.from_data("VAL1?\r")
-        ).deserialize()  # poll the multimeter for the measurement
-        self.read_fluke_status()  # read the status string to make sure the multimeter is happy
-        return float(data)  # return the measurement
+        return self._measure("VAC", measurement_range, resolution)
 
     def measure_voltage_dc(
         self, measurement_range: RangeT = None, resolution: ResolutionT = None
     ) -> float:
-        # pylint: disable=unused-argument
-        self.transmission.command(ASCII.from_data("VDC\r"))
-        self.read_fluke_status()
-        self.set_range(measurement_range)
-        self.set_resolution(resolution)
-
-        data = self.transmission.poll(ASCII.from_data("VAL1?\r")).deserialize()
-        self.read_fluke_status()
-        return float(data)
+        return self._measure("VDC", measurement_range, resolution)
 
     def measure_capacitance(
         self, measurement_range: RangeT = None, resolution: ResolutionT = None
@@ -112,11 +491,7 @@ class Fluke45(Multimeter[Serial[ASCII], RangeT, ResolutionT]):
         Returns:
             float: the measured resistance
         """
-        self.transmission.command(ASCII.from_data("CONT\r"))
-        self.read_fluke_status()
-        data = self.transmission.poll(ASCII.from_data("VAL1?\r")).deserialize()
-        self.read_fluke_status()
-        return float(data)
+        return self._measure("CONT")
 
     def measure_continuity(self) -> bool:
         return self.measure_continuity_raw() < 0.025
@@ -124,26 +499,12 @@ class Fluke45(Multimeter[Serial[ASCII], RangeT, ResolutionT]):
     def measure_current_ac(
         self, measurement_range: RangeT = None, resolution: ResolutionT = None
     ) -> float:
-        # pylint: disable=unused-argument
-        self.transmission.command(ASCII.from_data("AAC\r"))
-        self.read_fluke_status()
-        self.set_range(measurement_range)
-        self.set_resolution(resolution)
-        data = self.transmission.poll(ASCII.from_data("VAL1?\r")).deserialize()
-        self.read_fluke_status()
-        return float(data)
+        return self._measure("AAC", measurement_range, resolution)
 
     def measure_current_dc(
         self, measurement_range: RangeT = None, resolution: ResolutionT = None
     ) -> float:
-        # cause this is quick and dirty, ignoring the arguments
-        self.transmission.command(ASCII.from_data("ADC\r"))
-        self.read_fluke_status()
-        self.set_range(measurement_range)
-        self.set_resolution(resolution)
-        data = self.transmission.poll(ASCII.from_data("VAL1?\r")).deserialize()
-        self.read_fluke_status()
-        return float(data)
+        return self._measure("ADC", measurement_range, resolution)
 
     def measure_frequency(
         self, measurement_range: RangeT = None, resolution: ResolutionT = None
@@ -154,10 +515,4 @@ class Fluke45(Multimeter[Serial[ASCII], RangeT, ResolutionT]):
         Returns:
             float: the measured frequency
         """
-        self.transmission.command(ASCII.from_data("FREQ\r"))
-        self.read_fluke_status()
-        self.set_range(measurement_range)
-        self.set_resolution(resolution)
-        data = self.transmission.poll(ASCII.from_data("VAL1?\r")).deserialize()
-        self.read_fluke_status()
-        return float(data)
+        return self._measure("FREQ", measurement_range, resolution)
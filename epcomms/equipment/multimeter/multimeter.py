@@ -1,18 +1,78 @@
 # pylint: disable=duplicate-code
 from abc import abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, Literal, Optional, TypeVar
 
-from epcomms.equipment.base import Instrument, TransmissionTypeT
+from epcomms.equipment.base import Instrument, MeasurementError, TransmissionTypeT
 
 RangeT = TypeVar("RangeT")
 ResolutionT = TypeVar("ResolutionT")
 
+# Measurement functions, named after the measure_* methods that take them
+MeasurementFunction = Literal[
+    "voltage_ac",
+    "voltage_dc",
+    "capacitance",
+    "current_ac",
+    "current_dc",
+    "frequency",
+]
+
 
 class Multimeter(
     Instrument[TransmissionTypeT],
     Generic[TransmissionTypeT, RangeT, ResolutionT],
 ):
-    """Abstract class for all multimeters."""
+    """Abstract class for all multimeters.
+
+    Besides the measure_* methods, measurements can be split into arm(),
+    trigger() and fetch() steps, so that several multimeters can be
+    triggered together (see MultimeterGroup). Drivers without hardware
+    triggering take the measurement in trigger().
+    """
+
+    def __init__(self, transmission: TransmissionTypeT) -> None:
+        super().__init__(transmission)
+        self._armed: Optional[tuple[MeasurementFunction, RangeT, ResolutionT]] = None
+        self._triggered_reading: Optional[float] = None
+
+    def arm(
+        self,
+        function: MeasurementFunction,
+        measurement_range: RangeT = None,
+        resolution: ResolutionT = None,
+    ) -> None:
+        """
+        Configure the multimeter and get it ready to measure on trigger().
+        It stays armed, so trigger() and fetch() can be repeated.
+
+        Args:
+            function (MeasurementFunction): the measurement function.
+            measurement_range (RangeT, optional): measurement range.
+                Defaults to None.
+            resolution (ResolutionT, optional): resolution. Defaults to None.
+        """
+        self._armed = (function, measurement_range, resolution)
+
+    def trigger(self) -> None:
+        """Trigger a measurement. The multimeter must have been armed."""
+        if self._armed is None:
+            raise MeasurementError("The multimeter has not been armed")
+        function, measurement_range, resolution = self._armed
+        self._triggered_reading = getattr(self, f"measure_{function}")(
+            measurement_range, resolution
+        )
+
+    def fetch(self) -> float:
+        """
+        Get the reading of the last trigger().
+
+        Returns:
+            float: the reading
+        """
+        if self._triggered_reading is None:
+            raise MeasurementError("The multimeter has not been triggered")
+        reading, self._triggered_reading = self._triggered_reading, None
+        return reading
 
     @abstractmethod
     def measure_voltage_ac(
@@ -125,3 +185,31 @@ class Multimeter(
             float: the measured DC current
         """
         raise NotImplementedError
+
+    def measure_pair(
+        self,
+        primary: MeasurementFunction,
+        secondary: MeasurementFunction,
+        measurement_range: RangeT = None,
+        resolution: ResolutionT = None,
+    ) -> tuple[float, float]:
+        """
+        Measure two quantities from a single trigger, using the multimeter's
+        secondary measurement (display), e.g. DC voltage and frequency.
+
+        Args:
+            primary (MeasurementFunction): the primary measurement function.
+            secondary (MeasurementFunction): the secondary measurement
+                function.
+            measurement_range (RangeT, optional): measurement range for the
+                primary measurement. Defaults to None.
+            resolution (ResolutionT, optional): resolution for the primary
+                measurement. Defaults to None.
+
+        Returns:
+            tuple[float, float]: the primary and secondary measurements
+        """
+        # pylint: disable=unused-argument
+        # Not abstract: most multimeters have no secondary measurement
+        message = f"{type(self).__name__} does not support secondary measurements"
+        raise NotImplementedError(message)
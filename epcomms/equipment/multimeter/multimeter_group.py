@@ -0,0 +1,140 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Barrier, BrokenBarrierError
+from typing import Any, Sequence, Union
+
+from epcomms.equipment.base import MeasurementError
+
+from .multimeter import MeasurementFunction, Multimeter
+
+
+@dataclass(frozen=True)
+class GroupReading:
+    """
+    One synchronized reading from every multimeter in a group.
+
+    The trigger times are when each trigger was sent. For drivers with a
+    hardware trigger (e.g. SCPI multimeters' *TRG) that is when the reading
+    was taken, give or take the transmission latency. Drivers that fall back
+    to the base Multimeter.trigger() take the whole measurement when
+    triggered, so for those it is only when the measurement started; the
+    reading may be acquired up to a whole measurement later.
+    """
+
+    # reading of each multimeter, in group order
+    values: tuple[float, ...]
+    # time.perf_counter_ns() at which each multimeter's trigger was sent
+    trigger_times: tuple[int, ...]
+
+    @property
+    def skew(self) -> int:
+        """Spread of the trigger times in nanoseconds."""
+        return max(self.trigger_times) - min(self.trigger_times)
+
+
+class MultimeterGroup:
+    """
+    Several multimeters measuring together.
+
+    Every multimeter is armed up front; read() then releases one worker
+    thread per multimeter from a barrier so the triggers go out as close
+    together as possible, and fetches the readings afterwards. The trigger
+    skew is bounded by thread wake-up and transmission latency rather than
+    by the time each multimeter takes to measure.
+    """
+
+    def __init__(
+        self, meters: Sequence[Multimeter[Any, Any, Any]], timeout: float = 5.0
+    ) -> None:
+        """
+        Args:
+            meters (Sequence[Multimeter]): the multimeters in the group.
+            timeout (float, optional): seconds to wait for every worker to
+                reach the trigger barrier. Defaults to 5.0.
+        """
+        if not meters:
+            raise ValueError("A multimeter group needs at least one multimeter")
+        self.meters = tuple(meters)
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.meters), thread_name_prefix="MultimeterGroup"
+        )
+        self._barrier = Barrier(len(self.meters))
+
+    def arm(
+        self,
+        function: Union[MeasurementFunction, Sequence[MeasurementFunction]],
+        measurement_range: Any = None,
+        resolution: Any = None,
+    ) -> None:
+        """
+        Arm every multimeter in parallel.
+
+        Args:
+            function (MeasurementFunction | Sequence[MeasurementFunction]):
+                the measurement function, or one per multimeter.
+            measurement_range (optional): measurement range. Defaults to None.
+            resolution (optional): resolution. Defaults to None.
+        """
+        functions: list[MeasurementFunction] = (
+            [function] * len(self.meters)
+            if isinstance(function, str)
+            else list(function)
+        )
+        if len(functions) != len(self.meters):
+            raise ValueError(
+                f"Expected {len(self.meters)} measurement functions, "
+                f"got {len(functions)}"
+            )
+        futures = [
+            self._executor.submit(
+                meter.arm, meter_function, measurement_range, resolution
+            )
+            for meter, meter_function in zip(self.meters, functions)
+        ]
+        for future in futures:
+            future.result()
+
+    def read(self) -> GroupReading:
+        """
+        Trigger every multimeter together and fetch the readings.
+
+        Returns:
+            GroupReading: the readings and the time each trigger was sent.
+        """
+        self._barrier.reset()
+        trigger_futures = [
+            self._executor.submit(self._trigger, meter) for meter in self.meters
+        ]
+        trigger_times = tuple(future.result() for future in trigger_futures)
+        fetch_futures = [
+            self._executor.submit(meter.fetch) for meter in self.meters
+        ]
+        return GroupReading(
+            tuple(future.result() for future in fetch_futures), trigger_times
+        )
+
+    def close(self) -> None:
+        """Stop the worker threads. The multimeters are left open."""
+        self._executor.shutdown()
+
+    def _trigger(self, meter: Multimeter[Any, Any, Any]) -> int:
+        try:
+            self._barrier.wait(self.timeout)
+        except BrokenBarrierError as error:
+            raise MeasurementError(
+                "Timed out waiting to trigger the multimeter group"
+            ) from error
+        trigger_time = time.perf_counter_ns()
+        meter.trigger()
+        return trigger_time
+
+    def __enter__(self) -> "MultimeterGroup":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.meters)
@@ -0,0 +1,125 @@
+from collections import deque
+from collections.abc import Hashable
+from typing import Optional, Sequence
+
+from epcomms.equipment.base import SCPI_OVERFLOW
+
+
+class RangePredictor:
+    """
+    Predicts a fixed measurement range from recent readings.
+
+    Autoranging adds a long, variable settling delay to every measurement.
+    When a signal varies slowly, its next reading can be predicted well
+    enough to pin the smallest range that fits the recent readings plus
+    some headroom. The meter only autoranges again when a pinned reading
+    overloads, or drops so far below full scale that resolution suffers on
+    any range but the lowest.
+
+    Readings are remembered separately for each function (or any other
+    hashable key the driver uses).
+    """
+
+    def __init__(
+        self,
+        headroom: float = 1.25,
+        history: int = 8,
+        underrange: float = 0.1,
+        overflow: float = SCPI_OVERFLOW,
+    ) -> None:
+        """
+        Args:
+            headroom (float, optional): factor the largest recent reading is
+                multiplied by before picking a range. Defaults to 1.25.
+            history (int, optional): number of readings remembered per
+                function. Defaults to 8.
+            underrange (float, optional): fraction of full scale below which
+                a pinned reading falls back to autoranging. Defaults to 0.1.
+            overflow (float, optional): magnitude the meter reports for an
+                overload. Defaults to SCPI_OVERFLOW (9.9e37).
+        """
+        if headroom < 1:
+            raise ValueError("headroom must be at least 1")
+        if history < 1:
+            raise ValueError("history must be at least 1")
+        self.headroom = headroom
+        self.underrange = underrange
+        self.overflow = overflow
+        self._history_length = history
+        self._history: dict[Hashable, deque[float]] = {}
+
+    def predict(self, key: Hashable, full_scales: Sequence[float]) -> Optional[int]:
+        """
+        Pick a range for the next reading.
+
+        Args:
+            key (Hashable): the function being measured.
+            full_scales (Sequence[float]): full scale of each of the meter's
+                ranges for the function, smallest first.
+
+        Returns:
+            Optional[int]: index of the range to use, or None to autorange
+                (no recent readings, or none of the ranges fit).
+        """
+        history = self._history.get(key)
+        if not history:
+            return None
+        expected = max(history) * self.headroom
+        for index, full_scale in enumerate(full_scales):
+            if full_scale >= expected:
+                return index
+        return None
+
+    def observe(
+        self,
+        key: Hashable,
+        value: float,
+        full_scales: Sequence[float] = (),
+        index: Optional[int] = None,
+    ) -> bool:
+        """
+        Record a reading.
+
+        Args:
+            key (Hashable): the function measured.
+            value (float): the reading.
+            full_scales (Sequence[float], optional): full scale of each of
+                the meter's ranges for the function, smallest first, as
+                passed to predict().
+            index (Optional[int]): index of the pinned range the reading was
+                taken on, or None if the meter autoranged.
+
+        Returns:
+            bool: False if the reading overloaded and should be retaken with
+                autoranging, True otherwise.
+        """
+        magnitude = abs(value)
+        if magnitude >= self.overflow:
+            self.reset(key)
+            return False
+        # There's no smaller range to find on the lowest one, so a reading
+        # near zero stays pinned there
+        if index is not None and index > 0 and (
+            magnitude < self.underrange * full_scales[index]
+        ):
+            # Still a valid reading, but autorange next time to find the
+            # signal's new level
+            self.reset(key)
+            return True
+        self._history.setdefault(
+            key, deque(maxlen=self._history_length)
+        ).append(magnitude)
+        return True
+
+    def reset(self, key: Optional[Hashable] = None) -> None:
+        """
+        Forget recent readings, so the next reading autoranges.
+
+        Args:
+            key (Hashable, optional): the function to forget. Defaults to
+                None (all functions).
+        """
+        if key is None:
+            self._history.clear()
+        else:
+            self._history.pop(key, None)
@@ -1,17 +1,138 @@
-from typing import Generic, TypeVar, Union
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from typing import Generic, Iterator, NamedTuple, Optional, TypeVar, Union
 
-from epcomms.connection.packet import ASCII, String
+import numpy as np
+import numpy.typing as npt
+
+from epcomms.connection.packet import ASCII, String, precompile
 from epcomms.connection.transmission import Transmission
-from epcomms.equipment.base import SCPIInstrument
+from epcomms.equipment.base import (
+    CommandError,
+    ErrorCheckPolicy,
+    MeasurementError,
+    SCPIInstrument,
+    SCPITemplate,
+)
 
-from .multimeter import Multimeter
+from .multimeter import MeasurementFunction, Multimeter
+from .range_predictor import RangePredictor
 
 PacketT = TypeVar("PacketT", ASCII, String)
 # TODO: need to come up with a better solution for these types
 # pylint: disable=invalid-name
 RangeT = Union[str, int, float, None]
 # pylint: disable=invalid-name
-ResolutionT = Union[str, None]
+ResolutionT = Union[str, int, float, None]
+
+
+class Acquisition(NamedTuple):
+    """A block of buffered readings."""
+
+    values: npt.NDArray[np.float64]
+    # Host time.time() of each reading, interpolated between arming the
+    # meter and receiving the readings
+    timestamps: npt.NDArray[np.float64]
+    # True where the meter reported an overload
+    overflow: npt.NDArray[np.bool_]
+
+
+@dataclass(frozen=True)
+class Statistics:
+    """Statistics of a set of readings, computed on the instrument."""
+
+    minimum: float
+    maximum: float
+    mean: float
+    standard_deviation: float
+    count: int
+
+
+@dataclass(frozen=True)
+class MeasurementProfile:
+    """
+    A speed/accuracy trade-off, applied after every CONF.
+
+    Integration time is given either in power line cycles (`nplc`) or in
+    seconds (`aperture`); the driver converts between them for functions
+    that only take the other. Settings left as None keep what CONF sets.
+    """
+
+    nplc: Optional[float] = None
+    aperture: Optional[float] = None
+    # Automatic zero measurement after every reading; roughly halves the
+    # reading rate of DC measurements
+    autozero: Optional[bool] = None
+    # Resolution used when a measurement doesn't give one
+    resolution: ResolutionT = None
+
+    def __post_init__(self) -> None:
+        if self.nplc is not None and self.aperture is not None:
+            raise ValueError("Give either nplc or aperture, not both")
+
+    def integration_time(self, line_frequency: float) -> Optional[float]:
+        """
+        Args:
+            line_frequency (float): mains frequency in Hz.
+
+        Returns:
+            Optional[float]: integration time per reading in seconds, or
+                None if the profile doesn't set one.
+        """
+        if self.aperture is not None:
+            return self.aperture
+        if self.nplc is not None:
+            return self.nplc / line_frequency
+        return None
+
+
+PROFILES: dict[str, MeasurementProfile] = {
+    "fast": MeasurementProfile(nplc=0.02, autozero=False, resolution="MAX"),
+    "balanced": MeasurementProfile(nplc=1, autozero=True, resolution="DEF"),
+    "precise": MeasurementProfile(nplc=10, autozero=True, resolution="MIN"),
+}
+
+
+@lru_cache(maxsize=128, typed=True)
+def _format_range(measurement_range: RangeT) -> str:
+    if measurement_range is None:
+        measurement_range = "DEF"
+
+    if not (
+        isinstance(measurement_range, (float, int))
+        or measurement_range.upper() in {"AUTO", "DEF", "MAX", "MIN"}
+    ):
+        raise ValueError(
+            "Invalid value for measurement_range. Measurement_range must "
+            "be a numeric value or one of 'AUTO','DEF','MAX','MIN'."
+        )
+
+    range_str = (
+        measurement_range
+        if isinstance(measurement_range, str)
+        else f"{measurement_range:.2e}"
+    )
+
+    return range_str
+
+
+@lru_cache(maxsize=64, typed=True)
+def _format_resolution(resolution: ResolutionT) -> str:
+    if resolution is None:
+        resolution = "DEF"
+
+    if isinstance(resolution, (float, int)):
+        return f"{resolution:.2e}"
+
+    if not (resolution.upper() in {"DEF", "MAX", "MIN"}):
+        raise ValueError(
+            "Invalid value for resolution. Resolution must be a numeric "
+            "value or one of 'DEF','MAX','MIN'."
+        )
+
+    return resolution
 
 
 class SCPIMultimeter(
@@ -19,45 +140,602 @@ class SCPIMultimeter(
     SCPIInstrument,
     Generic[PacketT],
 ):
+    # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """
     A class to represent a generic SCPI multimeter.
     """
 
+    # Fixed commands, precompiled into `_commands` for the driver's packet type
+    _fixed_commands: tuple[str, ...] = (
+        "SYST:BEEP",
+        "SYST:ERR?",
+        "MEAS:CONT?",
+        "INIT",
+        "FETC?",
+        "ABOR",
+        "READ?",
+        "READ?;:SYST:ERR?",
+        "CALC:STAT OFF",
+        "*TRG",
+        "FETC?;:SYST:ERR?",
+    )
+    # Number of error queue entries read per round trip
+    _error_batch = 5
+
+    # CONF keyword for each measurement function
+    _function_keywords: dict[MeasurementFunction, str] = {
+        "voltage_ac": "CONF:VOLT:AC",
+        "voltage_dc": "CONF:VOLT:DC",
+        "capacitance": "CONF:CAP",
+        "current_ac": "CONF:CURR:AC",
+        "current_dc": "CONF:CURR:DC",
+        "frequency": "CONF:FREQ",
+    }
+    _configure: dict[MeasurementFunction, SCPITemplate] = {
+        function: SCPITemplate(keyword, _format_range, _format_resolution)
+        for function, keyword in _function_keywords.items()
+    }
+    # Range used when none is given
+    _default_range: RangeT = "DEF"
+    # SENS subsystem node for each measurement function
+    _sense_keywords: dict[MeasurementFunction, str] = {
+        "voltage_ac": "VOLT:AC",
+        "voltage_dc": "VOLT:DC",
+        "capacitance": "CAP",
+        "current_ac": "CURR:AC",
+        "current_dc": "CURR:DC",
+        "frequency": "FREQ",
+    }
+    # Functions whose integration time is set in power line cycles (these
+    # also take ZERO:AUTO), and those set with an aperture in seconds
+    _nplc_functions: tuple[MeasurementFunction, ...] = ("voltage_dc", "current_dc")
+    _aperture_functions: tuple[MeasurementFunction, ...] = ("frequency",)
+    # Full scale of each range, smallest first, for the functions whose
+    # range can be predicted (see set_range_prediction())
+    _ranges: dict[MeasurementFunction, tuple[float, ...]] = {}
+
     def __init__(
         self, transmission: Transmission[PacketT, PacketT], packet: type[PacketT]
     ) -> None:
         super().__init__(transmission)
         self._packet = packet
+        # the same type, as the transmission's packet type rather than the
+        # mixin's String | ASCII
+        self._packet_type = packet
+        self._commands: dict[str, PacketT] = {
+            command: precompile(packet, command) for command in self._fixed_commands
+        }
+        # (function, range, resolution) the meter is known to be configured
+        # for, or None if unknown
+        self._configuration: Optional[tuple[MeasurementFunction, str, str]] = None
+        # Incremented whenever the configuration is lost or replaced, so
+        # state that CONF resets (e.g. a secondary measurement) can be tracked
+        self._configuration_epoch = 0
+        self._configuration_lock = Lock()
+        self._error_check_policy = ErrorCheckPolicy.OFF
+        self._error_check_interval = 1
+        self._operations_since_check = 0
+        self._range_predictor: Optional[RangePredictor] = None
+        self._profile: Optional[MeasurementProfile] = None
+        # Commands applying the profile after CONF, for each function
+        self._profile_commands: dict[MeasurementFunction, str] = {}
+
+    def set_profile(
+        self,
+        profile: Union[str, MeasurementProfile, None],
+        line_frequency: float = 50.0,
+    ) -> Optional[float]:
+        """
+        Set the speed/accuracy profile applied whenever the meter is
+        configured. The meter is reconfigured with the next measurement.
 
-    def format_range(self, measurement_range: RangeT) -> str:
+        Args:
+            profile (str | MeasurementProfile | None): "fast", "balanced",
+                "precise", a MeasurementProfile with explicit NPLC or aperture
+                values, or None to use the meter's defaults.
+            line_frequency (float, optional): mains frequency in Hz, for
+                converting between NPLC and aperture. Defaults to 50.0.
+
+        Returns:
+            Optional[float]: expected DC readings per second with the profile,
+                or None if it can't be estimated.
         """
-        Formats the measurement_range parameter for SCPI commands.
+        if isinstance(profile, str):
+            if profile not in PROFILES:
+                raise ValueError(
+                    f"Unknown profile {profile}. Must be one of {list(PROFILES)}"
+                )
+            profile = PROFILES[profile]
+
+        profile_commands: dict[MeasurementFunction, str] = {}
+        integration_time = (
+            profile.integration_time(line_frequency) if profile else None
+        )
+        for function, sense in self._sense_keywords.items():
+            commands: list[str] = []
+            if integration_time is not None:
+                if function in self._nplc_functions:
+                    nplc = integration_time * line_frequency
+                    commands.append(f"SENS:{sense}:NPLC {nplc:g}")
+                elif function in self._aperture_functions:
+                    commands.append(f"SENS:{sense}:APER {integration_time:g}")
+            if (
+                profile is not None
+                and profile.autozero is not None
+                and function in self._nplc_functions
+            ):
+                autozero = "ON" if profile.autozero else "OFF"
+                commands.append(f"SENS:{sense}:ZERO:AUTO {autozero}")
+            if commands:
+                profile_commands[function] = "".join(
+                    f";:{command}" for command in commands
+                )
+
+        with self._configuration_lock:
+            self._profile = profile
+            self._profile_commands = profile_commands
+            self._reset_configuration()
+
+        if integration_time is None or not self._nplc_functions:
+            return None
+        autozero = profile is not None and profile.autozero is not False
+        return 1 / (integration_time * (2 if autozero else 1))
+
+    def set_range_prediction(
+        self, enabled: bool, headroom: float = 1.25, history: int = 8
+    ) -> None:
+        """
+        Turn range prediction on or off. When on, measure() calls that don't
+        give a range pin the smallest range that fits recent readings of the
+        function (with headroom) instead of autoranging, and only autorange
+        again when a reading overloads or falls below 10% of full scale.
 
         Args:
-            measurement_range (RangeT): The desired measurement range setting.
+            enabled (bool): whether to predict ranges.
+            headroom (float, optional): factor applied to the largest recent
+                reading. Defaults to 1.25.
+            history (int, optional): readings remembered per function.
+                Defaults to 8.
+        """
+        self._range_predictor = (
+            RangePredictor(headroom, history) if enabled else None
+        )
+
+    def set_error_check_policy(
+        self, policy: ErrorCheckPolicy, interval: int = 10
+    ) -> None:
+        """
+        Set when the instrument's error queue is checked. Whenever errors are
+        found, the queue is emptied and a CommandError is raised.
+
+        Args:
+            policy (ErrorCheckPolicy): OFF (only read_errors()), EVERY_N
+                (after every `interval` operations) or APPENDED (with every
+                query, in the same round trip).
+            interval (int, optional): Operations between checks for EVERY_N.
+                Defaults to 10.
+        """
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        self._error_check_policy = policy
+        self._error_check_interval = interval
+        self._operations_since_check = 0
+
+    def read_errors(self) -> list[tuple[int, str]]:
+        """
+        Read and clear the instrument's error queue. Several entries are
+        read per round trip.
 
         Returns:
-            str: The formatted measurement range string.
+            list[tuple[int, str]]: the (code, message) of each error, oldest
+                first.
         """
-        if measurement_range is None:
-            measurement_range = "DEF"
+        errors: list[tuple[int, str]] = []
+        batch = self._to_packet(";:".join(["SYST:ERR?"] * self._error_batch))
+        # bounded, in case an instrument never reports an empty queue
+        for _ in range(20 // self._error_batch):
+            batch_errors = self.parse_errors(
+                self.transmission.poll(batch).deserialize()
+            )
+            errors += batch_errors
+            if len(batch_errors) < self._error_batch:
+                break
+        self._operations_since_check = 0
+        return errors
 
-        if not (
-            isinstance(measurement_range, (float, int))
-            or measurement_range.upper() in {"DEF", "MAX", "MIN"}
+    def _to_packet(self, message: str) -> PacketT:
+        """The message as a packet for the transmission, precompiled if it is
+        one of the fixed commands."""
+        packet = self._commands.get(message)
+        return self._packet_type.from_data(message) if packet is None else packet
+
+    def _checked_poll(self, message: str) -> str:
+        """
+        Send a query, checking the error queue as the error check policy
+        says to.
+
+        Args:
+            message (str): the query.
+
+        Returns:
+            str: the response.
+        """
+        if self._error_check_policy is ErrorCheckPolicy.APPENDED:
+            message = f"{message};:SYST:ERR?"
+        response = self.transmission.poll(self._to_packet(message)).deserialize()
+
+        if self._error_check_policy is ErrorCheckPolicy.APPENDED:
+            response, error = response.rsplit(";", 1)
+            if self.parse_errors(error):
+                self._raise_errors(self.parse_errors(error) + self.read_errors())
+        elif self._error_check_policy is ErrorCheckPolicy.EVERY_N:
+            self._operations_since_check += 1
+            if self._operations_since_check >= self._error_check_interval:
+                self._raise_errors(self.read_errors())
+        return response
+
+    def _raise_errors(self, errors: list[tuple[int, str]]) -> None:
+        if errors:
+            # the configuration may not have been applied
+            self._reset_configuration()
+            raise CommandError(
+                "; ".join(f"{code}: {message}" for code, message in errors)
+            )
+
+    def measure(
+        self,
+        function: MeasurementFunction,
+        measurement_range: RangeT = None,
+        resolution: ResolutionT = None,
+    ) -> float:
+        """
+        Take a single measurement.
+
+        The meter is only reconfigured (with CONF) when the function, range
+        or resolution differ from the last measurement; otherwise a bare
+        READ? is sent, skipping the reconfiguration time.
+
+        Args:
+            function (MeasurementFunction): The measurement function.
+            measurement_range (RangeT, optional): A numeric range or one of
+                {AUTO|DEF|MAX|MIN}. Defaults to the driver's default range.
+            resolution (ResolutionT, optional): A numeric resolution or one
+                of {DEF|MAX|MIN}. Defaults to the profile's resolution, or
+                'DEF'.
+
+        Returns:
+            float: The measured value.
+        """
+        if (
+            self._range_predictor is not None
+            and measurement_range is None
+            and function in self._ranges
         ):
-            raise ValueError(
-                "Invalid value for measurement_range. Measurement_range must "
-                "be a numeric value or one of 'AUTO','DEF','MAX','MIN'."
+            return self._measure_predicted(
+                self._range_predictor, function, resolution
+            )
+        return self._measure_once(function, measurement_range, resolution)
+
+    def _measure_predicted(
+        self,
+        predictor: RangePredictor,
+        function: MeasurementFunction,
+        resolution: ResolutionT,
+    ) -> float:
+        full_scales = self._ranges[function]
+        index = predictor.predict(function, full_scales)
+        if index is not None:
+            value = self._measure_once(function, full_scales[index], resolution)
+            if predictor.observe(function, value, full_scales, index):
+                return value
+        # No prediction yet, or the pinned range overloaded
+        value = self._measure_once(function, "AUTO", resolution)
+        predictor.observe(function, value)
+        return value
+
+    def _measure_once(
+        self,
+        function: MeasurementFunction,
+        measurement_range: RangeT,
+        resolution: ResolutionT,
+    ) -> float:
+        with self._configuration_lock:
+            configuration, configure = self._configuration_message(
+                function, measurement_range, resolution
+            )
+            response = self._checked_poll(
+                "READ?" if configure is None else f"{configure};:READ?"
+            )
+            self._configuration = configuration
+        return float(response)
+
+    def _configuration_message(
+        self,
+        function: MeasurementFunction,
+        measurement_range: RangeT,
+        resolution: ResolutionT,
+    ) -> tuple[tuple[MeasurementFunction, str, str], Optional[str]]:
+        """
+        Work out whether the meter needs reconfiguring. Must be called with
+        the configuration lock held.
+
+        Returns:
+            tuple: the requested configuration, and the CONF command to send,
+                or None if the meter is already configured that way.
+        """
+        if measurement_range is None:
+            measurement_range = self._default_range
+        if resolution is None and self._profile is not None:
+            resolution = self._profile.resolution
+        configuration = (
+            function,
+            self.format_range(measurement_range),
+            self.format_resolution(resolution),
+        )
+        if configuration == self._configuration:
+            return configuration, None
+        # Forget the old configuration first in case CONF fails
+        self._reset_configuration()
+        return configuration, self._configure_message(
+            function, measurement_range, resolution
+        )
+
+    def _configure_message(
+        self,
+        function: MeasurementFunction,
+        measurement_range: RangeT,
+        resolution: ResolutionT,
+    ) -> str:
+        """The CONF command for a measurement, followed by the commands
+        applying the profile."""
+        if measurement_range is None:
+            measurement_range = self._default_range
+        if resolution is None and self._profile is not None:
+            resolution = self._profile.resolution
+        return self._configure[function](
+            measurement_range, resolution
+        ) + self._profile_commands.get(function, "")
+
+    def _reset_configuration(self) -> None:
+        """Mark the configuration as unknown. Must be called with the
+        configuration lock held."""
+        self._configuration = None
+        self._configuration_epoch += 1
+        # Whatever replaces the configuration also replaces an arm()
+        self._armed = None
+
+    def invalidate_configuration(self) -> None:
+        """
+        Forget the tracked measurement configuration, so the next measurement
+        reconfigures the meter. Call this after changing the configuration
+        some other way (e.g. from the front panel or a raw command).
+        """
+        with self._configuration_lock:
+            self._reset_configuration()
+
+    def acquire(
+        self,
+        n: int,
+        function: MeasurementFunction,
+        measurement_range: RangeT = None,
+        resolution: ResolutionT = None,
+    ) -> Acquisition:
+        """
+        Take `n` readings into the meter's buffer with a single trigger and
+        fetch them all at once, which is much faster than one query per
+        reading. The transmission timeout must allow for all `n` readings.
+
+        Args:
+            n (int): Number of readings.
+            function (MeasurementFunction): The measurement function.
+            measurement_range (RangeT, optional): A numeric range or one of
+                {AUTO|DEF|MAX|MIN}. Defaults to the driver's default range.
+            resolution (ResolutionT, optional): A numeric resolution or one
+                of {DEF|MAX|MIN}. Defaults to the profile's resolution, or
+                'DEF'.
+
+        Returns:
+            Acquisition: the readings and their host timestamps.
+        """
+        with self._configuration_lock:
+            start = self._arm(n, function, measurement_range, resolution)
+            try:
+                return self._fetch(n, start)
+            finally:
+                # CONF resets the sample count for the next single reading
+                self._reset_configuration()
+
+    def stream(
+        self,
+        function: MeasurementFunction,
+        measurement_range: RangeT = None,
+        resolution: ResolutionT = None,
+        chunk: int = 100,
+    ) -> Iterator[Acquisition]:
+        """
+        Take readings continuously, `chunk` at a time. The next chunk is
+        triggered as soon as the previous one has been fetched, so the meter
+        keeps measuring while the caller handles each chunk. Don't take other
+        measurements with the meter until the iterator has been closed.
+
+        Args:
+            function (MeasurementFunction): The measurement function.
+            measurement_range (RangeT, optional): A numeric range or one of
+                {AUTO|DEF|MAX|MIN}. Defaults to the driver's default range.
+            resolution (ResolutionT, optional): A numeric resolution or one
+                of {DEF|MAX|MIN}. Defaults to the profile's resolution, or
+                'DEF'.
+            chunk (int, optional): Number of readings per chunk. Defaults to
+                100.
+
+        Yields:
+            Acquisition: each chunk of readings.
+        """
+        with self._configuration_lock:
+            start = self._arm(chunk, function, measurement_range, resolution)
+        try:
+            while True:
+                readings = self._fetch(chunk, start)
+                start = time.time()
+                self.transmission.command(self._commands["INIT"])
+                yield readings
+        finally:
+            self.transmission.command(self._commands["ABOR"])
+            self.invalidate_configuration()
+
+    def arm(
+        self,
+        function: MeasurementFunction,
+        measurement_range: RangeT = None,
+        resolution: ResolutionT = None,
+    ) -> None:
+        """
+        Configure the multimeter for a bus-triggered reading and start
+        waiting for the trigger. The next measurement (or profile change)
+        reconfigures the meter and disarms it.
+
+        Args:
+            function (MeasurementFunction): the measurement function.
+            measurement_range (RangeT, optional): A numeric range or one of
+                {AUTO|DEF|MAX|MIN}. Defaults to the driver's default range.
+            resolution (ResolutionT, optional): A numeric resolution or one
+                of {DEF|MAX|MIN}. Defaults to the profile's resolution, or
+                'DEF'.
+        """
+        if measurement_range is None:
+            measurement_range = self._default_range
+        with self._configuration_lock:
+            # CONF puts the trigger source back to immediate for measure()
+            self._reset_configuration()
+            self.transmission.command(
+                self._to_packet(
+                    f"{self._configure_message(function, measurement_range, resolution)};"
+                    ":TRIG:SOUR BUS;:SAMP:COUN 1;:TRIG:COUN 1;:INIT"
+                )
+            )
+            self._armed = (function, measurement_range, resolution)
+
+    def trigger(self) -> None:
+        """Send a bus trigger (*TRG). The multimeter must have been armed."""
+        if self._armed is None:
+            raise MeasurementError("The multimeter has not been armed")
+        self.transmission.command(self._commands["*TRG"])
+
+    def fetch(self) -> float:
+        """
+        Get the reading of the last trigger() and wait for the next trigger.
+
+        Returns:
+            float: the reading
+        """
+        if self._armed is None:
+            raise MeasurementError("The multimeter has not been armed")
+        reading = float(self._checked_poll("FETC?"))
+        # wait for the next trigger
+        self.transmission.command(self._commands["INIT"])
+        return reading
+
+    def measure_statistics(
+        self,
+        n: int,
+        function: MeasurementFunction,
+        measurement_range: RangeT = None,
+        resolution: ResolutionT = None,
+    ) -> Statistics:
+        """
+        Take `n` readings and have the meter compute their statistics, so
+        only the statistics are transferred. Readings are taken at the
+        meter's full rate. The transmission timeout must allow for all `n`
+        readings.
+
+        Args:
+            n (int): Number of readings.
+            function (MeasurementFunction): The measurement function.
+            measurement_range (RangeT, optional): A numeric range or one of
+                {AUTO|DEF|MAX|MIN}. Defaults to the driver's default range.
+            resolution (ResolutionT, optional): A numeric resolution or one
+                of {DEF|MAX|MIN}. Defaults to the profile's resolution, or
+                'DEF'.
+
+        Returns:
+            Statistics: the minimum, maximum, mean, standard deviation and
+                count of the readings.
+        """
+        if n < 1:
+            raise ValueError("At least one reading must be taken")
+        if measurement_range is None:
+            measurement_range = self._default_range
+        with self._configuration_lock:
+            self._reset_configuration()
+            self.transmission.command(
+                self._to_packet(
+                    f"{self._configure_message(function, measurement_range, resolution)};"
+                    f":SAMP:COUN {n};:TRIG:COUN 1;:CALC:FUNC AVER;:CALC:STAT ON"
+                )
             )
+            try:
+                # *WAI holds the statistics query until every reading is in
+                response = self._checked_poll(
+                    "INIT;*WAI;:CALC:AVER:MIN?;MAX?;AVER?;SDEV?;COUN?"
+                )
+            finally:
+                self.transmission.command(self._commands["CALC:STAT OFF"])
+                self._reset_configuration()
+
+        minimum, maximum, mean, standard_deviation, count = response.split(";")
+        return Statistics(
+            minimum=float(minimum),
+            maximum=float(maximum),
+            mean=float(mean),
+            standard_deviation=float(standard_deviation),
+            count=int(float(count)),
+        )
 
-        range_str = (
-            measurement_range
-            if isinstance(measurement_range, str)
-            else f"{measurement_range:.2e}"
+    def _arm(
+        self,
+        n: int,
+        function: MeasurementFunction,
+        measurement_range: RangeT,
+        resolution: ResolutionT,
+    ) -> float:
+        """Configure the meter for `n` readings per trigger and start the
+        first acquisition. Returns the host time it was started at."""
+        if n < 1:
+            raise ValueError("At least one reading must be taken")
+        if measurement_range is None:
+            measurement_range = self._default_range
+        self._reset_configuration()
+        self.transmission.command(
+            self._to_packet(
+                f"{self._configure_message(function, measurement_range, resolution)};"
+                f":SAMP:COUN {n};:TRIG:COUN 1"
+            )
         )
+        start = time.time()
+        self.transmission.command(self._commands["INIT"])
+        return start
+
+    def _fetch(self, n: int, start: float) -> Acquisition:
+        """Fetch the `n` readings of the acquisition started at `start`."""
+        response = self._checked_poll("FETC?")
+        end = time.time()
+        values, overflow, _ = self.parse_array(response)
+        if len(values) != n:
+            raise MeasurementError(f"Expected {n} readings, got {len(values)}")
+        timestamps = np.linspace(start, end, n + 1)[1:]
+        return Acquisition(values, timestamps, overflow)
+
+    def format_range(self, measurement_range: RangeT) -> str:
+        """
+        Formats the measurement_range parameter for SCPI commands.
 
-        return range_str
+        Args:
+            measurement_range (RangeT): The desired measurement range setting.
+
+        Returns:
+            str: The formatted measurement range string.
+        """
+        return _format_range(measurement_range)
 
     def format_resolution(self, resolution: ResolutionT) -> str:
         """
@@ -69,16 +747,7 @@ class SCPIMultimeter(
         Returns:
             str: The formatted resolution string.
         """
-        if resolution is None:
-            resolution = "DEF"
-
-        if not (resolution.upper() in {"DEF", "MAX", "MIN"}):
-            raise ValueError(
-                "Invalid value for resolution. Resolution must be one of "
-                "'DEF','MAX','MIN'."
-            )
-
-        return resolution
+        return _format_resolution(resolution)
 
     def beep(self) -> None:
         """
@@ -91,7 +760,7 @@ class SCPIMultimeter(
         Returns:
             None
         """
-        self.transmission.command(self._packet.from_data("SYST:BEEP"))
+        self.transmission.command(self._commands["SYST:BEEP"])
 
     def measure_voltage_ac(
         self,
@@ -112,19 +781,7 @@ class SCPIMultimeter(
             float: The measured voltage value.
         """
 
-        return float(
-            self.transmission.poll(
-                self._packet.from_data(
-                    self.generate_query(
-                        "MEAS:VOLT:AC",
-                        arguments=[
-                            self.format_range(measurement_range),
-                            self.format_resolution(resolution),
-                        ],
-                    )
-                )
-            ).deserialize()
-        )
+        return self.measure("voltage_ac", measurement_range, resolution)
 
     def measure_voltage_dc(
         self,
@@ -146,19 +803,7 @@ class SCPIMultimeter(
             float: The measured voltage value.
         """
 
-        return float(
-            self.transmission.poll(
-                self._packet.from_data(
-                    self.generate_query(
-                        "MEAS:VOLT:DC",
-                        arguments=[
-                            self.format_range(measurement_range),
-                            self.format_resolution(resolution),
-                        ],
-                    )
-                )
-            ).deserialize()
-        )
+        return self.measure("voltage_dc", measurement_range, resolution)
 
     def measure_capacitance(
         self,
@@ -180,19 +825,7 @@ class SCPIMultimeter(
             float: The measured capacitance value.
         """
 
-        return float(
-            self.transmission.poll(
-                self._packet.from_data(
-                    self.generate_query(
-                        "MEAS:CAP",
-                        arguments=[
-                            self.format_range(measurement_range),
-                            self.format_resolution(resolution),
-                        ],
-                    )
-                )
-            ).deserialize()
-        )
+        return self.measure("capacitance", measurement_range, resolution)
 
     def measure_continuity_raw(self) -> float:
         """Performs a 2-wire continuity test.
@@ -203,11 +836,11 @@ class SCPIMultimeter(
         """
         # TODO confirm return value when instrument sees an open circuit
         # (>1.2 kOhm). Programmer guide is unclear.
-        return float(
-            self.transmission.poll(
-                self._packet.from_data(self.generate_query("MEAS:CONT"))
-            ).deserialize()
-        )
+        with self._configuration_lock:
+            # MEAS reconfigures the meter
+            self._reset_configuration()
+            response = self.transmission.poll(self._commands["MEAS:CONT?"])
+        return float(response.deserialize())
 
     def measure_continuity(self) -> bool:
         """Performs a 2-wire continuity test. The Keysight's internal threshold
@@ -237,19 +870,7 @@ class SCPIMultimeter(
             float: The measured current value.
         """
 
-        return float(
-            self.transmission.poll(
-                self._packet.from_data(
-                    self.generate_query(
-                        "MEAS:CURR:AC",
-                        arguments=[
-                            self.format_range(measurement_range),
-                            self.format_resolution(resolution),
-                        ],
-                    )
-                )
-            ).deserialize()
-        )
+        return self.measure("current_ac", measurement_range, resolution)
 
     def measure_current_dc(
         self,
@@ -270,19 +891,7 @@ class SCPIMultimeter(
         Returns:
             float: The measured current value.
         """
-        return float(
-            self.transmission.poll(
-                self._packet.from_data(
-                    self.generate_query(
-                        "MEAS:CURR:DC",
-                        arguments=[
-                            self.format_range(measurement_range),
-                            self.format_resolution(resolution),
-                        ],
-                    )
-                )
-            ).deserialize()
-        )
+        return self.measure("current_dc", measurement_range, resolution)
 
     def measure_frequency(
         self,
@@ -329,37 +938,14 @@ class SCPIMultimeter(
             )
 
         self.transmission.command(
-            self._packet.from_data(
+            self._to_packet(
                 self.generate_command(
                     "SENS:FREQ:VOLT:RANGE", arguments=str(amplitude_range)
                 )
             )
         )
-        return float(
-            self.transmission.poll(
-                self._packet.from_data(
-                    self.generate_query(
-                        "MEASURE:FREQUENCY",
-                        arguments=[
-                            self.format_range(measurement_range),
-                            self.format_resolution(resolution),
-                        ],
-                    )
-                )
-            ).deserialize()
+        return self.measure(
+            "frequency",
+            "DEF" if measurement_range is None else measurement_range,
+            resolution,
         )
-
-    def read_errors(self):
-        """
-        Reads and prints all errors from the instrument error queue.
-        """
-        # TODO c'mon. Really? Return the errors instead.
-        i = 0
-        while True:
-            err = self.transmission.poll(
-                self._packet.from_data("SYST:ERR?")
-            ).deserialize()
-            print(err)
-            i += 1
-            if err == '+0, "No error"' or i >= 20:
-                break
@@ -7,6 +7,12 @@ from .scpi_multimeter import SCPIMultimeter
 class TektronixDMM4050(SCPIMultimeter[ASCII]):
     """Tektronix DMM4050 Multimeter implementation."""
 
+    _fixed_commands = SCPIMultimeter._fixed_commands + (
+        "SYST:REM",
+        "SYST:LOC",
+        "DISP:TEXT:CLE",
+    )
+
     def __init__(self, host: str, port: int):
         transmission = Telnet(host, port, "\n", 5)
         super().__init__(transmission, ASCII)
@@ -23,9 +29,7 @@ class TektronixDMM4050(SCPIMultimeter[ASCII]):
         Returns:
             None
         """
-        self.transmission.command(
-            self._packet.from_data(self.generate_command("SYST:REM"))
-        )
+        self.transmission.command(self._commands["SYST:REM"])
 
     def command_local(self) -> None:
         """
@@ -38,9 +42,7 @@ class TektronixDMM4050(SCPIMultimeter[ASCII]):
         Returns:
             None
         """
-        self.transmission.command(
-            self._packet.from_data(self.generate_command("SYST:LOC"))
-        )
+        self.transmission.command(self._commands["SYST:LOC"])
 
     def display_text(self, text: str) -> None:
         """
@@ -57,9 +59,7 @@ class TektronixDMM4050(SCPIMultimeter[ASCII]):
             None
         """
         self.transmission.command(
-            self._packet.from_data(
-                self.generate_command("DISP:TEXT", arguments=f'"{text}"')
-            )
+            self._to_packet(self.generate_command("DISP:TEXT", arguments=f'"{text}"'))
         )
 
     def clear_text(self) -> None:
@@ -73,6 +73,4 @@ class TektronixDMM4050(SCPIMultimeter[ASCII]):
         Returns:
             None
         """
-        self.transmission.command(
-            self._packet.from_data(self.generate_command("DISP:TEXT:CLE"))
-        )
+        self.transmission.command(self._commands["DISP:TEXT:CLE"])
@@ -1,4 +1,6 @@
 from .bk1694_esp32 import BK1694 as BK1694
 from .hp_6030a import HP6030A as HP6030A
 from .keysight_edu36311a import KeysightEDU36311A as KeysightEDU36311A
+from .list_mode_power_supply import ListModePowerSupply as ListModePowerSupply
+from .power_supply import OutputSnapshot as OutputSnapshot
 from .power_supply import PowerSupply as PowerSupply
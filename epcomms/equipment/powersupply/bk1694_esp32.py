@@ -7,7 +7,11 @@ See https://github.com/Electric-Propulsion/BK1694_Controller.
 """
 
 import json
-from dataclasses import dataclass
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Any, Optional, cast
 
 from epcomms.connection.packet import String
 from epcomms.connection.transmission import Socket
@@ -15,7 +19,7 @@ from epcomms.connection.transmission import Socket
 from .power_supply import PowerSupply
 
 
-@dataclass
+@dataclass(frozen=True)
 class BK1694Status:
     """Dataclass representing the status of the BK1694 power supply."""
 
@@ -24,13 +28,42 @@ class BK1694Status:
 
 
 class BK1694(PowerSupply[Socket]):
-    """BK1694 Power Supply ESP32 interface implementation"""
+    # pylint: disable=too-many-instance-attributes
+    """BK1694 Power Supply ESP32 interface implementation
 
-    def __init__(self, ip: str):
+    The supply's status (setpoint and output state) is cached for
+    `status_ttl` seconds, and callers asking for it while a getStatus
+    request is in flight wait for that request rather than sending their
+    own. Writes update the cached status from their responses.
+    """
+
+    def __init__(self, ip: str, status_ttl: float = 0.1):
+        """
+        Args:
+            ip (str): IP address of the ESP32.
+            status_ttl (float, optional): seconds a status is reused for.
+                Defaults to 0.1.
+        """
         self.ip = ip  # Ours is "192.168.0.156"
         self.ws_url = f"ws://{self.ip}:7777"  # shouldn't hardcode port
         transmission = Socket(self.ws_url)
         super().__init__(transmission)
+        self.status_ttl = status_ttl
+        self._status: Optional[BK1694Status] = None
+        # time.monotonic() the cached status was read at
+        self._status_time = 0.0
+        # Incremented before and after every write, so a status read that
+        # started before or during a write doesn't overwrite what it did
+        self._status_generation = 0
+        # The getStatus request in flight, with the generation it was sent in
+        self._status_request: Optional[tuple[int, Future[BK1694Status]]] = None
+        self._status_lock = Lock()
+
+    def invalidate_status(self) -> None:
+        """Forget the cached status, so the next status is read afresh."""
+        with self._status_lock:
+            self._status = None
+            self._status_generation += 1
 
     def set_voltage(self, voltage: float, channel: int | list[int]) -> None:
         """Set the voltage.
@@ -46,10 +79,9 @@ class BK1694(PowerSupply[Socket]):
                 f"Invalid channel provided: {channel}. Channel for BK1694 must "
                 "be set to 1 or None."
             )
-        data = json.dumps(
-            {"command": "setValue", "value": self._convert_voltage_to_value(voltage)}
-        )
-        self.transmission.poll(String.from_data(data))
+        value = self._convert_voltage_to_value(voltage)
+        data = json.dumps({"command": "setValue", "value": value})
+        self._send_command({"value": value}, data)
 
     def measure_voltage_setpoint(self, channel: int | list[int] = 1) -> float:
         """Measure the voltage setpoint."""
@@ -110,13 +142,62 @@ class BK1694(PowerSupply[Socket]):
             )
 
         data = json.dumps({"command": "enable", "value": state})
-        self.transmission.poll(String.from_data(data))
+        self._send_command({"enable": state}, data)
 
     def _get_status(self) -> BK1694Status:
-        """Gets system status.
+        """Gets system status, from the cache if it is fresh enough.
 
         Returns:
-            dict: Response from ESP32 server.
+            BK1694Status: the supply's status.
+        """
+        with self._status_lock:
+            if (
+                self._status is not None
+                and time.monotonic() - self._status_time <= self.status_ttl
+            ):
+                return self._status
+            generation = self._status_generation
+            in_flight = self._status_request
+            # A request sent before a write may miss what the write did, so
+            # only share one sent since the last write
+            if in_flight is not None and in_flight[0] == generation:
+                leader = False
+                request = in_flight[1]
+            else:
+                leader = True
+                request = Future[BK1694Status]()
+                self._status_request = (generation, request)
+
+        if not leader:
+            # Share the request already in flight
+            return request.result()
+
+        try:
+            status = self._request_status()
+        except BaseException as error:
+            self._finish_status_request(request)
+            request.set_exception(error)
+            raise
+        with self._status_lock:
+            if generation == self._status_generation:
+                self._status = status
+                self._status_time = time.monotonic()
+        self._finish_status_request(request)
+        request.set_result(status)
+        return status
+
+    def _finish_status_request(self, request: Future[BK1694Status]) -> None:
+        """Stop sharing a status request, unless a newer one has already
+        replaced it."""
+        with self._status_lock:
+            if self._status_request is not None and self._status_request[1] is request:
+                self._status_request = None
+
+    def _request_status(self) -> BK1694Status:
+        """Sends a getStatus request.
+
+        Returns:
+            BK1694Status: the supply's status.
         """
         data = {"command": "getStatus"}
         response = self.transmission.poll(
@@ -124,6 +205,48 @@ class BK1694(PowerSupply[Socket]):
         ).deserialize()
         return BK1694Status(**json.loads(response))
 
+    def _send_command(self, written: dict[str, Any], data: str) -> None:
+        """Sends a command and updates the cached status.
+
+        Args:
+            written (dict[str, Any]): the status fields the command sets.
+            data (str): the JSON command.
+        """
+        with self._status_lock:
+            self._status_generation += 1
+        try:
+            response = self.transmission.poll(String.from_data(data)).deserialize()
+        except BaseException:
+            self.invalidate_status()
+            raise
+
+        status = self._parse_status(response)
+        with self._status_lock:
+            if status is not None:
+                # The server answered with the full status
+                self._status = status
+                self._status_time = time.monotonic()
+            elif self._status is not None:
+                # Only the written fields are known; keep the status' age so
+                # the other fields are still refreshed on time
+                self._status = replace(self._status, **written)
+            # A getStatus sent while the write was in flight may have been
+            # answered with the old status
+            self._status_generation += 1
+
+    @staticmethod
+    def _parse_status(response: str) -> Optional[BK1694Status]:
+        try:
+            status: Any = json.loads(response)
+        except ValueError:
+            return None
+        if not isinstance(status, dict):
+            return None
+        fields = cast(dict[str, Any], status)
+        if {"value", "enable"} <= fields.keys():
+            return BK1694Status(value=fields["value"], enable=fields["enable"])
+        return None
+
     def _convert_value_to_voltage(self, value: int) -> float:
         """Converts the integer value to a voltage.
 
@@ -33,9 +33,7 @@ class HP6030A(PowerSupply[Visa], SCPIInstrument):
         Returns:
             None
         """
-        self.transmission.command(
-            String.from_data(self.generate_command("SYST:LANG", arguments=language))
-        )
+        self._write(self.generate_command("SYST:LANG", arguments=language))
 
     def set_voltage(self, voltage: float, channel: Union[int, list[int]] = 1) -> None:
         """
@@ -54,8 +52,11 @@ class HP6030A(PowerSupply[Visa], SCPIInstrument):
                 "must be set to 1 or None."
             )
 
-        self.transmission.command(
-            String.from_data(self.generate_command("VOLT", arguments=str(voltage)))
+        self._mirrored_set(
+            "voltage",
+            voltage,
+            1,
+            lambda: self._write(self.generate_command("VOLT", arguments=str(voltage))),
         )
 
     def measure_voltage_setpoint(
@@ -76,11 +77,15 @@ class HP6030A(PowerSupply[Visa], SCPIInstrument):
                 "must be set to 1 or None."
             )
 
-        return self.parse_response(
-            float,
-            self.transmission.poll(
-                String.from_data(self.generate_query("VOLT", channels=None))
-            ).deserialize(),
+        return self._mirrored_get(
+            "voltage",
+            1,
+            lambda: self.parse_response(
+                float,
+                self.transmission.poll(
+                    String.from_data(self.generate_query("VOLT", channels=None))
+                ).deserialize(),
+            ),
         )
 
     def measure_voltage(
@@ -127,8 +132,11 @@ class HP6030A(PowerSupply[Visa], SCPIInstrument):
                 "must be set to 1 or None."
             )
 
-        self.transmission.command(
-            String.from_data(self.generate_command("CURR", arguments=str(current)))
+        self._mirrored_set(
+            "current_limit",
+            current,
+            1,
+            lambda: self._write(self.generate_command("CURR", arguments=str(current))),
         )
 
     def measure_current_limit(
@@ -149,11 +157,15 @@ class HP6030A(PowerSupply[Visa], SCPIInstrument):
                 "must be set to 1 or None."
             )
 
-        return self.parse_response(
-            float,
-            self.transmission.poll(
-                String.from_data(self.generate_query("CURR"))
-            ).deserialize(),
+        return self._mirrored_get(
+            "current_limit",
+            1,
+            lambda: self.parse_response(
+                float,
+                self.transmission.poll(
+                    String.from_data(self.generate_query("CURR"))
+                ).deserialize(),
+            ),
         )
 
     def measure_current(
@@ -198,11 +210,15 @@ class HP6030A(PowerSupply[Visa], SCPIInstrument):
                 "must be set to 1 or None."
             )
 
-        return self.parse_response(
-            lambda value: bool(int(value)),
-            self.transmission.poll(
-                String.from_data(self.generate_query("OUTP", channels=None))
-            ).deserialize(),
+        return self._mirrored_get(
+            "output",
+            1,
+            lambda: self.parse_response(
+                lambda value: bool(int(value)),
+                self.transmission.poll(
+                    String.from_data(self.generate_query("OUTP", channels=None))
+                ).deserialize(),
+            ),
         )
 
     def set_output(self, state: bool, channel: Union[int, list[int]] = 1) -> None:
@@ -219,6 +235,9 @@ class HP6030A(PowerSupply[Visa], SCPIInstrument):
             )
 
         value = 1 if state else 0
-        self.transmission.command(
-            String.from_data(self.generate_command("OUTP", arguments=str(value)))
+        self._mirrored_set(
+            "output",
+            bool(state),
+            1,
+            lambda: self._write(self.generate_command("OUTP", arguments=str(value))),
         )
@@ -1,17 +1,26 @@
 from typing import Union
 
-from epcomms.connection.packet import String
+from epcomms.connection.packet import PrecompiledString, String
 from epcomms.connection.transmission import Visa
-from epcomms.equipment.base import SCPIInstrument
+from epcomms.equipment.base import MeasurementError
 
-from .power_supply import PowerSupply
+from .list_mode_power_supply import ListModePowerSupply
+from .power_supply import OutputSnapshot
 
 
-class KeysightEDU36311A(PowerSupply[Visa], SCPIInstrument):
+class KeysightEDU36311A(ListModePowerSupply[Visa]):
     """
     A class to represent the Keysight EDU36311A power supply.
+
+    Ramps run in the supply's list mode.
     """
 
+    _commands: dict[str, PrecompiledString] = {
+        command: PrecompiledString(command) for command in ["SYST:BEEP"]
+    }
+    # Queries making up an output snapshot, in OutputSnapshot field order
+    _snapshot_queries = ("MEAS:VOLT", "MEAS:CURR", "VOLT", "CURR", "OUTP")
+
     def __init__(self, resource_name: str) -> None:
         """
         Initializes the Keysight EDU36311A power supply.
@@ -33,7 +42,7 @@ class KeysightEDU36311A(PowerSupply[Visa], SCPIInstrument):
         Returns:
             None
         """
-        self.transmission.command(String.from_data("SYST:BEEP"))
+        self.transmission.command(self._commands["SYST:BEEP"])
 
     def set_voltage(self, voltage: float, channel: Union[int, list[int]]) -> None:
         """
@@ -46,10 +55,13 @@ class KeysightEDU36311A(PowerSupply[Visa], SCPIInstrument):
         Returns:
             None
         """
-        self.transmission.command(
-            String.from_data(
+        self._mirrored_set(
+            "voltage",
+            voltage,
+            channel,
+            lambda: self._write(
                 self.generate_command("VOLT", arguments=str(voltage), channels=channel)
-            )
+            ),
         )
 
     def measure_voltage_setpoint(
@@ -64,11 +76,15 @@ class KeysightEDU36311A(PowerSupply[Visa], SCPIInstrument):
         Returns:
             float: The measured voltage value.
         """
-        return self.parse_response(
-            float,
-            self.transmission.poll(
-                String.from_data(self.generate_query("VOLT", channels=channel))
-            ).deserialize(),
+        return self._mirrored_get(
+            "voltage",
+            channel,
+            lambda: self.parse_response(
+                float,
+                self.transmission.poll(
+                    String.from_data(self.generate_query("VOLT", channels=channel))
+                ).deserialize(),
+            ),
         )
 
     def measure_voltage(self, channel: Union[int, list[int]]) -> float | list[float]:
@@ -99,10 +115,13 @@ class KeysightEDU36311A(PowerSupply[Visa], SCPIInstrument):
         Returns:
             None
         """
-        self.transmission.command(
-            String.from_data(
+        self._mirrored_set(
+            "current_limit",
+            current,
+            channel,
+            lambda: self._write(
                 self.generate_command("CURR", arguments=str(current), channels=channel)
-            )
+            ),
         )
 
     def measure_current_limit(
@@ -117,11 +136,15 @@ class KeysightEDU36311A(PowerSupply[Visa], SCPIInstrument):
         Returns:
             float: The measured current in amperes.
         """
-        return self.parse_response(
-            float,
-            self.transmission.poll(
-                String.from_data(self.generate_query("CURR", channels=channel))
-            ).deserialize(),
+        return self._mirrored_get(
+            "current_limit",
+            channel,
+            lambda: self.parse_response(
+                float,
+                self.transmission.poll(
+                    String.from_data(self.generate_query("CURR", channels=channel))
+                ).deserialize(),
+            ),
         )
 
     def measure_current(self, channel: Union[int, list[int]]) -> float | list[float]:
@@ -151,11 +174,15 @@ class KeysightEDU36311A(PowerSupply[Visa], SCPIInstrument):
         Returns:
             bool: The output status of the channel.
         """
-        return self.parse_response(
-            lambda value: bool(int(value)),
-            self.transmission.poll(
-                String.from_data(self.generate_query("OUTP", channels=channel))
-            ).deserialize(),
+        return self._mirrored_get(
+            "output",
+            channel,
+            lambda: self.parse_response(
+                lambda value: bool(int(value)),
+                self.transmission.poll(
+                    String.from_data(self.generate_query("OUTP", channels=channel))
+                ).deserialize(),
+            ),
         )
 
     def set_output(self, state: bool, channel: Union[int, list[int]]) -> None:
@@ -166,8 +193,50 @@ class KeysightEDU36311A(PowerSupply[Visa], SCPIInstrument):
             channel (int, optional): The channel number to enable output for.
         """
         value = 1 if state else 0
-        self.transmission.command(
-            String.from_data(
+        self._mirrored_set(
+            "output",
+            bool(state),
+            channel,
+            lambda: self._write(
                 self.generate_command("OUTP", arguments=str(value), channels=channel)
-            )
+            ),
         )
+
+    def measure_outputs(
+        self, channels: Union[int, list[int]] = 1
+    ) -> list[OutputSnapshot]:
+        """
+        Measure the voltage, current, setpoints and output state of several
+        channels with a single compound query, e.g.
+        MEAS:VOLT? (@1:3);:MEAS:CURR? (@1:3);...;:OUTP? (@1:3)
+
+        Args:
+            channels (int | list[int], optional): the channel(s) to measure.
+                Defaults to 1.
+
+        Returns:
+            list[OutputSnapshot]: the state of each channel, in order.
+        """
+        channel_list = [channels] if isinstance(channels, int) else list(channels)
+        response = self.transmission.poll(
+            String.from_data(
+                ";:".join(
+                    self.generate_query(query, channels=channel_list)
+                    for query in self._snapshot_queries
+                )
+            )
+        ).deserialize()
+
+        columns = [field.split(",") for field in response.strip().split(";")]
+        if len(columns) != len(self._snapshot_queries) or any(
+            len(column) != len(channel_list) for column in columns
+        ):
+            raise MeasurementError(f"Unexpected snapshot response: {response}")
+        return [
+            OutputSnapshot(
+                channel,
+                *(float(value) for value in values[:-1]),
+                output=bool(int(values[-1])),
+            )
+            for channel, *values in zip(channel_list, *columns)
+        ]
@@ -0,0 +1,97 @@
+import time
+from typing import Any, Optional, Sequence, TypeVar, Union
+
+from epcomms.connection.transmission import Transmission
+from epcomms.equipment.base import SCPIInstrument
+
+from .power_supply import PowerSupply
+
+TransmissionT = TypeVar("TransmissionT", bound=Transmission[Any, Any])
+
+
+class ListModePowerSupply(PowerSupply[TransmissionT], SCPIInstrument):
+    # pylint: disable=abstract-method  # drivers implement the rest
+    """
+    Base class for SCPI power supplies with a list mode (LIST:VOLT,
+    LIST:CURR, LIST:DWEL), which run ramps on the instrument.
+
+    The whole list is sent in one message and started with a bus trigger, so
+    step timing is set by the supply rather than by the host, and the bus is
+    free while the ramp runs.
+    """
+
+    # Most points a list can hold
+    _max_list_points = 512
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def ramp(
+        self,
+        voltages: Sequence[float],
+        dwell: Union[float, Sequence[float]],
+        channel: Union[int, list[int]] = 1,
+        current_limits: Optional[Sequence[float]] = None,
+        wait: bool = True,
+    ) -> None:
+        """
+        Step the output through a sequence of voltages (and optionally
+        current limits), holding each for its dwell time. The supply runs
+        the list itself, started by a bus trigger.
+
+        Args:
+            voltages (Sequence[float]): the voltage of each step.
+            dwell (float | Sequence[float]): seconds to hold each step, or
+                one dwell time per step.
+            channel (int | list[int], optional): channel(s) to ramp.
+                Defaults to 1.
+            current_limits (Sequence[float], optional): the current limit of
+                each step. Defaults to None (leave the limit alone).
+            wait (bool, optional): return once the last step's dwell time is
+                over and put the output back in fixed mode. If False, return
+                as soon as the list has started; the output stays in list
+                mode, holding the last step, until the next ramp. Defaults to
+                True.
+        """
+        dwells = self._ramp_dwells(voltages, dwell, current_limits)
+        if len(voltages) > self._max_list_points:
+            raise ValueError(
+                f"A list holds at most {self._max_list_points} points, "
+                f"got {len(voltages)}"
+            )
+
+        commands = [
+            self.generate_command("VOLT:MODE", "LIST", channel),
+            self.generate_command("LIST:VOLT", self._list(voltages), channel),
+        ]
+        if current_limits is not None:
+            commands += [
+                self.generate_command("CURR:MODE", "LIST", channel),
+                self.generate_command("LIST:CURR", self._list(current_limits), channel),
+            ]
+        commands += [
+            self.generate_command("LIST:DWEL", self._list(dwells), channel),
+            self.generate_command("LIST:COUN", "1", channel),
+            # hold the last step's values once the list is done
+            self.generate_command("LIST:TERM:LAST", "ON", channel),
+            self.generate_command("TRIG:TRAN:SOUR", "BUS", channel),
+            self.generate_command("INIT:TRAN", channels=channel),
+        ]
+        # The supply's settings change under the mirror
+        self.invalidate_state_mirror()
+        # common commands (*TRG) don't take the ':' root prefix
+        self.transmission.command(
+            self._packet.from_data(f"{';:'.join(commands)};*TRG")
+        )
+        if not wait:
+            return
+
+        # Leave the bus alone until the list has run
+        time.sleep(sum(dwells))
+        commands = [self.generate_command("VOLT:MODE", "FIX", channel)]
+        if current_limits is not None:
+            commands.append(self.generate_command("CURR:MODE", "FIX", channel))
+        self.transmission.command(self._packet.from_data(";:".join(commands)))
+
+    @staticmethod
+    def _list(values: Sequence[float]) -> str:
+        return ",".join(f"{value:g}" for value in values)
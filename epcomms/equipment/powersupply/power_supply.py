@@ -1,13 +1,277 @@
 # pylint: disable=duplicate-code
 
+import time
 from abc import abstractmethod
-from typing import Union
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Optional, Sequence, TypeVar, Union, cast
 
 from epcomms.equipment.base import Instrument, TransmissionTypeT
 
+ValueT = TypeVar("ValueT")
+
+# How long before a ramp step the host stops sleeping and spins, since
+# time.sleep() can overshoot by about a millisecond
+_SPIN_NS = 2_000_000
+
+
+def _dwell_times(dwell: Union[float, Sequence[float]], steps: int) -> list[float]:
+    """Per-step dwell times (seconds) for a ramp of `steps` steps."""
+    if steps < 1:
+        raise ValueError("A ramp needs at least one step")
+    dwells = [float(dwell)] * steps if isinstance(dwell, (float, int)) else list(dwell)
+    if len(dwells) != steps:
+        raise ValueError(f"Expected {steps} dwell times, got {len(dwells)}")
+    if any(step_dwell < 0 for step_dwell in dwells):
+        raise ValueError("Dwell times can't be negative")
+    return dwells
+
+
+def _wait_until(deadline_ns: int) -> None:
+    """Wait until time.perf_counter_ns() reaches `deadline_ns`: sleep for
+    most of the time, then spin for the last couple of milliseconds."""
+    while True:
+        remaining = deadline_ns - time.perf_counter_ns()
+        if remaining <= 0:
+            return
+        if remaining > _SPIN_NS:
+            time.sleep((remaining - _SPIN_NS) / 1e9)
+
+
+def _as_list(value: Any) -> list[Any]:
+    """A value, or a list of values, as a list."""
+    return cast(list[Any], value) if isinstance(value, list) else [value]
+
+
+@dataclass(frozen=True)
+class OutputSnapshot:
+    """The state of one power supply output."""
+
+    channel: int
+    voltage: float
+    current: float
+    voltage_setpoint: float
+    current_limit: float
+    output: bool
+
 
 class PowerSupply(Instrument[TransmissionTypeT]):
-    """Abstract Base Class for all Power Supplies."""
+    """Abstract Base Class for all Power Supplies.
+
+    Drivers can keep an optional mirror of the supply's setpoints (see
+    enable_state_mirror()). They route setters through `_mirrored_set` and
+    setpoint queries through `_mirrored_get`, keyed by setting name.
+    """
+
+    def __init__(self, transmission: TransmissionTypeT) -> None:
+        super().__init__(transmission)
+        self._mirror_enabled = False
+        self._mirror_max_age: Optional[float] = None
+        # (setting, channel) -> (value, time.monotonic() it was known at)
+        self._mirror: dict[tuple[str, Any], tuple[Any, float]] = {}
+        # held while the mirror is read or changed, never during I/O
+        self._mirror_lock = Lock()
+
+    def enable_state_mirror(self, max_age: Optional[float] = None) -> None:
+        """
+        Serve setpoint queries (voltage setpoint, current limit, output
+        state) from the values last written or read, and skip writes that
+        wouldn't change anything. Only use this if nothing else changes the
+        supply's settings, or call invalidate_state_mirror() when it does.
+
+        Args:
+            max_age (float, optional): seconds after which a mirrored value
+                is read back from the supply again. Defaults to None (never).
+        """
+        with self._mirror_lock:
+            self._mirror_enabled = True
+            self._mirror_max_age = max_age
+            self._mirror.clear()
+
+    def disable_state_mirror(self) -> None:
+        """Always query and write the supply."""
+        with self._mirror_lock:
+            self._mirror_enabled = False
+            self._mirror.clear()
+
+    def invalidate_state_mirror(self) -> None:
+        """Forget the mirrored values, so they are read back from the supply
+        the next time they're asked for."""
+        with self._mirror_lock:
+            self._mirror.clear()
+
+    def _batch_failed(self) -> None:
+        # SCPI drivers (see SCPIInstrument.batch()) dropped commands the
+        # mirror assumed had been sent
+        self.invalidate_state_mirror()
+
+    def ramp(
+        self,
+        voltages: Sequence[float],
+        dwell: Union[float, Sequence[float]],
+        channel: Union[int, list[int]] = 1,
+        current_limits: Optional[Sequence[float]] = None,
+    ) -> None:
+        """
+        Step the output through a sequence of voltages (and optionally
+        current limits), holding each for its dwell time. Returns once the
+        last step's dwell time is over.
+
+        Supplies with a list mode run the sequence themselves (see
+        ListModePowerSupply). Otherwise the host sets each step, scheduled
+        against perf_counter_ns from the start of the ramp so that timing
+        errors don't accumulate from step to step.
+
+        Args:
+            voltages (Sequence[float]): the voltage of each step.
+            dwell (float | Sequence[float]): seconds to hold each step, or
+                one dwell time per step.
+            channel (int | list[int], optional): channel(s) to ramp.
+                Defaults to 1.
+            current_limits (Sequence[float], optional): the current limit of
+                each step. Defaults to None (leave the limit alone).
+        """
+        dwells = self._ramp_dwells(voltages, dwell, current_limits)
+        deadline = time.perf_counter_ns()
+        for step, (voltage, step_dwell) in enumerate(zip(voltages, dwells)):
+            _wait_until(deadline)
+            if current_limits is not None:
+                self.set_current_limit(current_limits[step], channel)
+            self.set_voltage(voltage, channel)
+            deadline += round(step_dwell * 1e9)
+        _wait_until(deadline)
+
+    @staticmethod
+    def _ramp_dwells(
+        voltages: Sequence[float],
+        dwell: Union[float, Sequence[float]],
+        current_limits: Optional[Sequence[float]],
+    ) -> list[float]:
+        """Check a ramp's arguments and get the dwell time of each step."""
+        dwells = _dwell_times(dwell, len(voltages))
+        if current_limits is not None and len(current_limits) != len(voltages):
+            raise ValueError("Expected one current limit per voltage")
+        return dwells
+
+    def _mirrored_values(
+        self, setting: str, channels: list[Any]
+    ) -> Optional[list[Any]]:
+        """The mirrored values of a setting on each channel, or None if any of
+        them are missing or stale."""
+        now = time.monotonic()
+        values: list[Any] = []
+        with self._mirror_lock:
+            if not self._mirror_enabled:
+                return None
+            for channel in channels:
+                entry = self._mirror.get((setting, channel))
+                if entry is None or (
+                    self._mirror_max_age is not None
+                    and now - entry[1] > self._mirror_max_age
+                ):
+                    return None
+                values.append(entry[0])
+        return values
+
+    def _remember(self, setting: str, channels: list[Any], values: list[Any]) -> None:
+        now = time.monotonic()
+        with self._mirror_lock:
+            if not self._mirror_enabled:
+                return
+            for channel, value in zip(channels, values):
+                self._mirror[(setting, channel)] = (value, now)
+
+    def _mirrored_set(
+        self,
+        setting: str,
+        value: Any,
+        channel: Union[int, list[int], None],
+        write: Callable[[], None],
+    ) -> None:
+        """
+        Write a setting, unless the mirror says it already has that value.
+
+        Args:
+            setting (str): name of the setting, shared with `_mirrored_get`.
+            value (Any): the value being written.
+            channel (int | list[int] | None): the channel(s) written.
+            write (Callable[[], None]): sends the setting to the supply.
+        """
+        channels = channel if isinstance(channel, list) else [channel]
+        if self._mirrored_values(setting, channels) == [value] * len(channels):
+            return
+        try:
+            write()
+        except Exception:
+            # The write may or may not have been applied
+            with self._mirror_lock:
+                for mirrored_channel in channels:
+                    self._mirror.pop((setting, mirrored_channel), None)
+            raise
+        self._remember(setting, channels, [value] * len(channels))
+
+    def _mirrored_get(
+        self,
+        setting: str,
+        channel: Union[int, list[int], None],
+        read: Callable[[], Union[ValueT, list[ValueT]]],
+    ) -> Union[ValueT, list[ValueT]]:
+        """
+        Get a setting from the mirror, or read it from the supply (and
+        mirror it) if it isn't mirrored.
+
+        Args:
+            setting (str): name of the setting, shared with `_mirrored_set`.
+            channel (int | list[int] | None): the channel(s) to get.
+            read (Callable): queries the supply. Returns one value, or a list
+                with one value per channel.
+
+        Returns:
+            ValueT | list[ValueT]: the value, or a list of values if there is
+                more than one channel (as SCPIInstrument.parse_response).
+        """
+        channels = channel if isinstance(channel, list) else [channel]
+        values = self._mirrored_values(setting, channels)
+        if values is not None:
+            return values[0] if len(values) == 1 else values
+
+        response = read()
+        read_values = _as_list(response)
+        if len(read_values) == len(channels):
+            self._remember(setting, channels, read_values)
+        return response
+
+    def measure_outputs(
+        self, channels: Union[int, list[int]] = 1
+    ) -> list[OutputSnapshot]:
+        """
+        Measure the voltage, current, setpoints and output state of several
+        outputs. Drivers that can should override this to read everything in
+        a single round trip; by default every value is queried separately.
+
+        Args:
+            channels (int | list[int], optional): the channel(s) to measure.
+                Defaults to 1.
+
+        Returns:
+            list[OutputSnapshot]: the state of each channel, in order.
+        """
+        return [
+            OutputSnapshot(
+                channel=channel,
+                voltage=self._single(self.measure_voltage(channel)),
+                current=self._single(self.measure_current(channel)),
+                voltage_setpoint=self._single(self.measure_voltage_setpoint(channel)),
+                current_limit=self._single(self.measure_current_limit(channel)),
+                output=bool(self._single(self.get_output(channel))),
+            )
+            for channel in ([channels] if isinstance(channels, int) else channels)
+        ]
+
+    @staticmethod
+    def _single(value: Union[float, list[float], bool, list[bool]]) -> float:
+        # Single channel queries may still come back as a one element list
+        return value[0] if isinstance(value, list) else value
 
     @abstractmethod
     def set_voltage(self, voltage: float, channel: Union[int, list[int]]) -> None:
@@ -1,3 +1,3 @@
-from .inficon_bgp400 import InficonBGP400 as InficonBGP400
+from .inficon_BGP400 import InficonBGP400 as InficonBGP400
 from .terranova_962a import Terranova962A as Terranova962A
 from .vacuum_controller import VacuumController as VacuumController
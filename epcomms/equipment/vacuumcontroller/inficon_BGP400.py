@@ -1,11 +1,15 @@
 import logging
 from concurrent.futures import Future
 from dataclasses import dataclass
-from threading import Lock, Thread
-from typing import Callable, Literal
+from functools import lru_cache
+from threading import Thread
+from typing import Any, Callable, Literal
 
-from epcomms.connection.packet.bytes import Bytes
-from epcomms.connection.transmission import Serial, TransmissionError
+import numpy as np
+import numpy.typing as npt
+
+from epcomms.connection.packet import BytesView, PrecompiledBytes
+from epcomms.connection.transmission import Serial, Subscribers, TransmissionError
 
 from .vacuum_controller import VacuumController
 
@@ -25,19 +29,123 @@ class InficonBGP400State:
     error_msg: str | None
 
 
-class InficonBGP400(VacuumController[Serial[Bytes]]):
+# Frames are decoded through lookup tables, since every field is a function
+# of a single byte (or, for the pressure, of a 16 bit measurement and the
+# unit). The pressure tables are built on first use of each unit.
+
+# Pressure is 10 ** (measurement / 4000 - offset), with an offset per unit
+_PRESSURE_OFFSETS: dict[str, float] = {"mbar": 12.5, "Torr": 12.625, "Pa": 10.5}
+_UNIT_NAMES = ("mbar", "Torr", "Pa", "")
+
+
+def _decode_emission(status: int) -> Literal["Off", "25 uA", "5 mA", "Degas"]:
+    match status & 0b11:
+        case 0b00:
+            return "Off"
+        case 0b01:
+            return "25 uA"
+        case 0b10:
+            return "5 mA"
+        case _:
+            return "Degas"
+
+
+def _decode_unit(status: int) -> Literal["mbar", "Torr", "Pa", None]:
+    match (status >> 4) & 0b11:
+        case 0b00:
+            return "mbar"
+        case 0b01:
+            return "Torr"
+        case 0b10:
+            return "Pa"
+        case _:
+            return None
+
+
+def _decode_error(error: int) -> str | None:
+    match (error >> 4) & 0b1111:
+        case 0b0101:
+            return "Pirani adjusted poorly"
+        case 0b1000:
+            return "BA error"
+        case 0b1001:
+            return "Pirani error"
+        case _:
+            return None
+
+
+_EMISSION_TABLE: tuple[Literal["Off", "25 uA", "5 mA", "Degas"], ...] = tuple(
+    _decode_emission(status) for status in range(256)
+)
+_ADJUSTMENT_TABLE = tuple(
+    f"1000 mbar adjustment {'on' if (status >> 2) & 0b1 else 'off'}"
+    for status in range(256)
+)
+_UNIT_TABLE: tuple[Literal["mbar", "Torr", "Pa", None], ...] = tuple(
+    _decode_unit(status) for status in range(256)
+)
+_ERROR_TABLE = tuple(_decode_error(error) for error in range(256))
+_SOFTWARE_VERSION_TABLE = tuple(f"v{version/20.0}" for version in range(256))
+
+# The same tables as arrays, for decoding batches of frames
+_UNIT_ARRAY = np.array(_UNIT_NAMES)
+_EMISSION_ARRAY = np.array(_EMISSION_TABLE)
+_ADJUSTMENT_ARRAY = np.array(_ADJUSTMENT_TABLE)
+_SOFTWARE_VERSION_ARRAY = np.array(_SOFTWARE_VERSION_TABLE)
+_ERROR_ARRAY = np.array([msg or "" for msg in _ERROR_TABLE])
+
+_STATE_DTYPE = np.dtype(
+    [
+        ("pressure", np.float64),
+        ("unit", "U4"),
+        ("emission", "U5"),
+        ("adjustment", "U24"),
+        ("software_version", "U8"),
+        ("toggle_bit", np.uint8),
+        ("error_msg", "U22"),
+        ("valid", np.bool_),
+    ]
+)
+
+
+@lru_cache(maxsize=None)
+def _pressure_table(unit: str) -> list[float]:
+    offset = _PRESSURE_OFFSETS[unit]
+    # a list rather than an array: indexing it is quicker for single frames
+    return [10 ** (measurement / 4000 - offset) for measurement in range(65536)]
+
+
+@lru_cache(maxsize=None)
+def _stacked_pressure_table() -> npt.NDArray[np.float64]:
+    # one row per unit code; the invalid code (0b11) maps to NaN
+    return np.stack(
+        [np.array(_pressure_table(unit)) for unit in _UNIT_NAMES[:3]]
+        + [np.full(65536, np.nan)]
+    )
+
+
+class InficonBGP400(VacuumController[Serial[BytesView]]):
     """Inficon BGP400 Vacuum Controller implementation."""
 
+    # Command frames are fixed, so they are built once. Only received
+    # frames are BytesView, read into the transmission's reused buffer.
+    _commands: dict[str, PrecompiledBytes] = {
+        "degas_on": PrecompiledBytes(bytes([3, 16, 93, 148, 1])),
+        "degas_off": PrecompiledBytes(bytes([3, 16, 93, 105, 214])),
+        "set_mbar": PrecompiledBytes(bytes([3, 16, 62, 0, 78])),
+        "set_torr": PrecompiledBytes(bytes([3, 16, 62, 1, 79])),
+        "set_pa": PrecompiledBytes(bytes([3, 16, 62, 2, 80])),
+    }
+
     def __init__(self, device_location: str):
         transmission = Serial(
             device_location,
-            packet_type=Bytes,
+            packet_type=BytesView,
             frame_prefix=b"\x07\x05",
             frame_length=7,
             frame_terminator=b"",
         )
-        self._subscribers: list[Callable[[InficonBGP400State], None]] = []
-        self._subscriber_lock = Lock()
+        self._subscribers = Subscribers[InficonBGP400State]()
         super().__init__(transmission)
         self._worker_thread = Thread(target=self.read_loop, daemon=True)
         self._worker_thread.start()
@@ -54,14 +162,7 @@ class InficonBGP400(VacuumController[Serial[Bytes]]):
         Returns:
             Callable[[], None]: unsubscribe function
         """
-        with self._subscriber_lock:
-            self._subscribers.append(callback)
-
-        def unregister() -> None:
-            with self._subscriber_lock:
-                self._subscribers.remove(callback)
-
-        return unregister
+        return self._subscribers.register(callback)
 
     def register_singleshot(
         self, callback: Callable[[InficonBGP400State], None]
@@ -74,56 +175,42 @@ class InficonBGP400(VacuumController[Serial[Bytes]]):
             callback (Callable[[InficonBGP400State], None]): callback to register.
                 It will only be called once.
         """
-
-        def self_unregistering_wrapper(state: InficonBGP400State) -> None:
-            try:
-                callback(state)
-            finally:
-                unregister()
-
-        unregister = self.register_subscriber(self_unregistering_wrapper)
+        self._subscribers.register_singleshot(callback)
 
     def degas_on(self) -> None:
         """Enable degas mode on the vacuum controller."""
-        packet = Bytes.from_data(bytearray([3, 16, 93, 148, 1]))
-        self.transmission.command(packet)
+        self.transmission.command(self._commands["degas_on"])
 
     def degas_off(self) -> None:
         """Disable degas mode on the vacuum controller."""
-        packet = Bytes.from_data(bytearray([3, 16, 93, 105, 214]))
-        self.transmission.command(packet)
+        self.transmission.command(self._commands["degas_off"])
 
     def set_mbar(self) -> None:
         """Set pressure unit to mbar."""
-        packet = Bytes.from_data(bytearray([3, 16, 62, 0, 78]))
-        self.transmission.command(packet)
+        self.transmission.command(self._commands["set_mbar"])
 
     def set_torr(self) -> None:
         """Set pressure unit to torr."""
-        packet = Bytes.from_data(bytearray([3, 16, 62, 1, 79]))
-        self.transmission.command(packet)
+        self.transmission.command(self._commands["set_torr"])
 
     def set_pa(self) -> None:
         """Set pressure unit to pa."""
-        packet = Bytes.from_data(bytearray([3, 16, 62, 2, 80]))
-        self.transmission.command(packet)
+        self.transmission.command(self._commands["set_pa"])
 
     def read_loop(self) -> None:
         """Continuously read state updates from the vacuum controller and
         notify subscribers."""
         while True:
-            packet = self.transmission.read()
-            data = packet.deserialize()
-            try:
-                state = self.decode_output_packet(data)
-            except TransmissionError as e:
-                print(f"Error decoding Inficon BGP400 packet: {e}")
-                continue
-
-            with self._subscriber_lock:
-                subscriber_functions = list(self._subscribers)
-            for subscriber in subscriber_functions:
-                subscriber(state)
+            # The packet is a view of the serial read buffer, so decode it
+            # straight away rather than copying it
+            with self.transmission.read() as packet:
+                try:
+                    state = self.decode_output_packet(packet.deserialize())
+                except TransmissionError as e:
+                    print(f"Error decoding Inficon BGP400 packet: {e}")
+                    continue
+
+            self._subscribers.notify(state)
 
     def get_state(self) -> InficonBGP400State:
         """
@@ -140,102 +227,90 @@ class InficonBGP400(VacuumController[Serial[Bytes]]):
         self.register_singleshot(callback)
         return future_state.result()
 
-    # pylint: disable=too-many-locals
-    # It's just going to have a lot of locals, dude.
-    def decode_output_packet(self, packet: bytearray) -> InficonBGP400State:
+    @staticmethod
+    def decode_output_packet(packet: bytearray | memoryview) -> InficonBGP400State:
         """
         Decode an output packet from the Inficon BGP400 vacuum controller.
 
         Args:
-            packet (bytearray): The raw packet data to decode.
+            packet (bytearray | memoryview): The raw packet data to decode.
 
         Returns:
             InficonBGP400State: The decoded state of the vacuum controller.
         """
-        status = packet[0]
-        error = packet[1]
-        measurement_msb = packet[2]
-        measurement_lsb = packet[3]
-        software_version = packet[4]
-        sensor_type = packet[5]
-        checksum = packet[6]
+        (
+            status,
+            error,
+            measurement_msb,
+            measurement_lsb,
+            software_version,
+            sensor_type,
+            checksum,
+        ) = packet[0:7]
 
         if sensor_type != 10:
             raise TransmissionError(f"Invalid sensor type: {sensor_type} (expected 10)")
-        if checksum != ((sum(packet[0:6]) + 5) % 256):
+        expected_checksum = (
+            status
+            + error
+            + measurement_msb
+            + measurement_lsb
+            + software_version
+            + sensor_type
+            + 5
+        ) & 0xFF
+        if checksum != expected_checksum:
             raise TransmissionError(
-                f"Invalid checksum: {checksum} (expected {(sum(packet[0:6])+5) % 256})"
+                f"Invalid checksum: {checksum} (expected {expected_checksum})"
             )
 
-        emission_status = (status) & 0b11
-        match emission_status:
-            case 0b00:
-                emission = "Off"
-            case 0b01:
-                emission = "25 uA"
-            case 0b10:
-                emission = "5 mA"
-            case 0b11:
-                emission = "Degas"
-            case _:
-                raise TransmissionError(f"Invalid emission status: {emission_status}")
-
-        adjustment_status = (status >> 2) & 0b1
-        match adjustment_status:
-            case 0b00:
-                adjustment = "1000 mbar adjustment off"
-            case 0b01:
-                adjustment = "1000 mbar adjustment on"
-            case _:
-                adjustment = None
-
-        toggle_bit = (status >> 3) & 0b1
-
-        pressure_unit = (status >> 4) & 0b11
-        match pressure_unit:
-            case 0b00:
-                unit = "mbar"
-            case 0b01:
-                unit = "Torr"
-            case 0b10:
-                unit = "Pa"
-            case _:
-                unit = None
-
-        match ((error >> 4) & 0b1111):
-            case 0b0101:
-                error_msg = "Pirani adjusted poorly"
-            case 0b1000:
-                error_msg = "BA error"
-            case 0b1001:
-                error_msg = "Pirani error"
-            case _:
-                error_msg = None
-
-        software_version_str = f"v{software_version/20.0}"
-
-        match unit:
-            case "mbar":
-                pressure = 10 ** (
-                    ((measurement_msb * 256) + measurement_lsb) / 4000 - 12.5
-                )
-            case "Torr":
-                pressure = 10 ** (
-                    ((measurement_msb * 256) + measurement_lsb) / 4000 - 12.625
-                )
-            case "Pa":
-                pressure = 10 ** (
-                    ((measurement_msb * 256) + measurement_lsb) / 4000 - 10.5
-                )
-            case _:
-                pressure = None
-
+        unit = _UNIT_TABLE[status]
         return InficonBGP400State(
-            pressure=pressure,
+            pressure=(
+                _pressure_table(unit)[(measurement_msb << 8) | measurement_lsb]
+                if unit is not None
+                else None
+            ),
             unit=unit,
-            emission=emission,
-            adjustment=adjustment,
-            software_version=software_version_str,
-            toggle_bit=toggle_bit,
-            error_msg=error_msg,
+            emission=_EMISSION_TABLE[status],
+            adjustment=_ADJUSTMENT_TABLE[status],
+            software_version=_SOFTWARE_VERSION_TABLE[software_version],
+            toggle_bit=(status >> 3) & 0b1,
+            error_msg=_ERROR_TABLE[error],
         )
+
+    @staticmethod
+    def decode_output_packets(packets: npt.NDArray[np.uint8]) -> npt.NDArray[Any]:
+        """
+        Decode a batch of output packets in one vectorized pass, e.g. to catch
+        up on a backlog of frames.
+
+        Args:
+            packets (npt.NDArray[np.uint8]): array of shape (N, 7) holding N
+                raw packets.
+
+        Returns:
+            npt.NDArray: structured array of N decoded states, with the fields
+                of InficonBGP400State plus `valid`, which is False for packets
+                with a bad sensor type or checksum. Pressure is NaN where it
+                is unknown.
+        """
+        packets = np.asarray(packets, dtype=np.uint8).reshape(-1, 7)
+        status = packets[:, 0]
+        error = packets[:, 1]
+        measurement = (packets[:, 2].astype(np.uint16) << 8) | packets[:, 3]
+        unit_code = (status >> 4) & 0b11
+
+        checksum = (packets[:, 0:6].sum(axis=1, dtype=np.uint32) + 5) & 0xFF
+        valid = (packets[:, 5] == 10) & (checksum == packets[:, 6])
+
+        states = np.empty(len(packets), dtype=_STATE_DTYPE)
+        states["pressure"] = _stacked_pressure_table()[unit_code, measurement]
+        states["unit"] = _UNIT_ARRAY[unit_code]
+        states["emission"] = _EMISSION_ARRAY[status]
+        states["adjustment"] = _ADJUSTMENT_ARRAY[status]
+        states["software_version"] = _SOFTWARE_VERSION_ARRAY[packets[:, 4]]
+        states["toggle_bit"] = (status >> 3) & 0b1
+        states["error_msg"] = _ERROR_ARRAY[error]
+        states["valid"] = valid
+        return states
@@ -1,4 +1,4 @@
-from epcomms.connection.packet import ASCII
+from epcomms.connection.packet import ASCII, PrecompiledASCII
 from epcomms.connection.transmission import Serial, TransmissionError
 from epcomms.equipment.base import MeasurementError
 
@@ -8,6 +8,10 @@ from .vacuum_controller import VacuumController
 class Terranova962A(VacuumController[Serial[ASCII]]):
     """Terranova 962A Vacuum Controller implementation."""
 
+    _commands: dict[str, PrecompiledASCII] = {
+        command: PrecompiledASCII(command) for command in ["u", "v", "x", "p"]
+    }
+
     def __init__(self, device_location: str):
         transmission = Serial(device_location)
         super().__init__(transmission)
@@ -34,14 +38,14 @@ class Terranova962A(VacuumController[Serial[ASCII]]):
         """
         Get the units of the pressure readings.
         """
-        unit_str = self.transmission.poll(ASCII.from_data("u")).deserialize()
+        unit_str = self.transmission.poll(self._commands["u"]).deserialize()
         return unit_str
 
     def get_identity(self) -> str:
         """
         Get the identity string of the device.
         """
-        ident_string = self.transmission.poll(ASCII.from_data("v")).deserialize()
+        ident_string = self.transmission.poll(self._commands["v"]).deserialize()
         if "926" in ident_string:
             return ident_string
 
@@ -53,7 +57,7 @@ class Terranova962A(VacuumController[Serial[ASCII]]):
         """
         Get the type of pressure gauge connected.
         """
-        gauge_str = self.transmission.poll(ASCII.from_data("x")).deserialize()
+        gauge_str = self.transmission.poll(self._commands["x"]).deserialize()
         if gauge_str in ["CEP", "275"]:
             return gauge_str
 
@@ -66,7 +70,7 @@ class Terranova962A(VacuumController[Serial[ASCII]]):
         Get the pressure reading from gauge n.
         """
         press_str = (
-            self.transmission.poll(ASCII.from_data("p"))
+            self.transmission.poll(self._commands["p"])
             .deserialize()
             .strip()
             .split(" ")[n]
@@ -0,0 +1,20 @@
+from pytest import raises
+
+from epcomms.connection.packet import BytesView
+
+
+def test_view_shares_buffer():
+    buffer = bytearray(b"\x01\x02\x03")
+    packet = BytesView.from_wire(buffer)
+    kept = packet.copy()
+    buffer[0] = 0xFF
+    assert packet.deserialize()[0] == 0xFF
+    assert kept == b"\x01\x02\x03"
+    assert len(packet) == 3
+
+
+def test_release():
+    with BytesView.from_wire(bytearray(b"\x01")) as packet:
+        assert packet.deserialize()[0] == 1
+    with raises(ValueError):
+        packet.deserialize()[0]
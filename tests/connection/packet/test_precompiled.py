@@ -0,0 +1,53 @@
+from pytest import raises
+
+from epcomms.connection.packet import (
+    ASCII,
+    CIPData,
+    PrecompiledASCII,
+    PrecompiledBytes,
+    PrecompiledCIPTX,
+    PrecompiledString,
+    String,
+    precompile,
+)
+from epcomms.connection.packet.cip_datatypes import REAL
+
+
+def test_interned():
+    assert PrecompiledASCII("u") is PrecompiledASCII("u")
+    assert PrecompiledASCII("u") is not PrecompiledASCII("v")
+    assert PrecompiledString("SYST:BEEP") is PrecompiledString.from_data("SYST:BEEP")
+    assert PrecompiledBytes(b"\x03\x10") is PrecompiledBytes(bytearray(b"\x03\x10"))
+    assert PrecompiledCIPTX(
+        CIPData(class_code=4, instance=100, attribute=3, data_type=REAL)
+    ) is PrecompiledCIPTX(
+        CIPData(class_code=4, instance=100, attribute=3, data_type=REAL)
+    )
+
+
+def test_immutable():
+    packets = [
+        PrecompiledASCII("u"),
+        PrecompiledString("SYST:BEEP"),
+        PrecompiledBytes(b"\x03\x10"),
+        PrecompiledCIPTX(CIPData(class_code=1, instance=1, attribute=1)),
+    ]
+    for packet in packets:
+        with raises(AttributeError):
+            packet._data = "changed"
+
+
+def test_serialize():
+    assert PrecompiledASCII("VDC\r").serialize() == b"VDC\r"
+    assert PrecompiledString("SYST:BEEP").serialize() == "SYST:BEEP"
+    assert PrecompiledBytes(bytearray(b"\x03\x10")).serialize() == b"\x03\x10"
+
+
+def test_received_packets_not_interned():
+    assert type(PrecompiledASCII.from_wire(b"1.0\r")) is ASCII
+    assert type(PrecompiledString.from_wire("1.0")) is String
+
+
+def test_precompile():
+    assert precompile(ASCII, "INIT") is PrecompiledASCII("INIT")
+    assert precompile(String, "INIT") is PrecompiledString("INIT")
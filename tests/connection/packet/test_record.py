@@ -0,0 +1,40 @@
+import struct
+
+from pytest import raises
+
+from epcomms.connection.packet import RecordField, RecordLayout
+from epcomms.connection.packet.cip_datatypes import REAL, UDINT, UINT, WORD
+
+
+def test_decode():
+    layout = RecordLayout(
+        "Readings",
+        [
+            RecordField("gas", 0, UINT),
+            RecordField("status", 2, UDINT),
+            # leave a gap, which should be skipped
+            RecordField("pressure", 8, REAL),
+            RecordField("flags", 12, WORD),
+        ],
+    )
+    assert layout.size == 14
+
+    data = struct.pack("<HIxxfH", 7, 3, 1.5, 0x8001) + b"trailing"
+    record = layout.decode(data)
+    assert record.gas == 7
+    assert record.status == 3
+    assert record.pressure == 1.5
+    assert record.flags == 0x8001
+
+
+def test_encode_round_trip():
+    layout = RecordLayout(
+        "Command", [RecordField("command_id", 0, UINT), RecordField("argument", 2, "H")]
+    )
+    assert layout.encode(4, 2) == b"\x04\x00\x02\x00"
+    assert layout.unpack(layout.encode(4, 2)) == (4, 2)
+
+
+def test_overlapping_fields():
+    with raises(ValueError):
+        RecordLayout("Bad", [RecordField("a", 0, UDINT), RecordField("b", 2, UINT)])
@@ -0,0 +1,125 @@
+import struct
+import time
+from unittest.mock import patch
+
+from pycomm3 import CommError, ResponseError, Services
+from pycomm3.tag import Tag
+from pytest import raises
+
+from epcomms.connection.packet import CIPTX, CIPData
+from epcomms.connection.transmission import EthernetIP, TransmissionError
+
+
+class FakeCIPDriver:
+    # stand-in for pycomm3's CIPDriver
+    def __init__(self, path):
+        self.path = path
+        self.open_result = True
+        self.opens = 0
+        self.closes = 0
+        self.requests = []
+        # exceptions the next generic messages raise
+        self.failures = []
+        self.response = Tag("generic", 1.0, "REAL")
+
+    def open(self):
+        self.opens += 1
+        return self.open_result
+
+    def _forward_open(self):
+        return True
+
+    def close(self):
+        self.closes += 1
+
+    def generic_message(self, **kwargs):
+        self.requests.append(kwargs)
+        if self.failures:
+            raise self.failures.pop(0)
+        return self.response
+
+
+POLL = CIPTX.from_data(CIPData(class_code=4, instance=100, attribute=3))
+
+
+def make_transmission(**kwargs):
+    with patch(
+        "epcomms.connection.transmission.ethernet_ip.CIPDriver", FakeCIPDriver
+    ):
+        return EthernetIP("192.168.0.172", **kwargs)
+
+
+def test_reconnect_after_dead_session():
+    transmission = make_transmission(keepalive_interval=None)
+    assert transmission.poll(POLL).deserialize() == 1.0
+    assert transmission.generation == 1
+
+    # the device was power cycled: the old session's requests now fail
+    transmission.driver.failures = [CommError("connection reset")]
+    assert transmission.poll(POLL).deserialize() == 1.0
+    assert transmission.driver.opens == 2
+    assert transmission.driver.closes == 1
+    assert transmission.generation == 2
+    transmission.close()
+
+
+def test_retry_on_response_error():
+    transmission = make_transmission(keepalive_interval=None)
+    transmission.driver.failures = [ResponseError("bad reply")]
+    assert transmission.poll(POLL).deserialize() == 1.0
+    assert len(transmission.driver.requests) == 2
+
+    # only one retry
+    transmission.driver.failures = [CommError("reset"), ResponseError("bad reply")]
+    with raises(TransmissionError):
+        transmission.poll(POLL)
+    transmission.close()
+
+
+def test_failed_session_registration():
+    transmission = make_transmission(keepalive_interval=None)
+    transmission.driver.open_result = False
+    with raises(TransmissionError):
+        transmission.poll(POLL)
+    assert transmission.generation == 0
+    assert transmission.driver.closes == 1
+    assert not transmission.driver.requests
+    transmission.close()
+
+
+def test_keepalive_when_idle():
+    transmission = make_transmission(keepalive_interval=0.05)
+    transmission.poll(POLL)
+    time.sleep(0.3)
+    transmission.close()
+
+    keepalives = [
+        request
+        for request in transmission.driver.requests
+        if request["service"] == Services.get_attribute_single
+        and request["class_code"] == 1
+    ]
+    assert keepalives
+    assert all(request["connected"] for request in keepalives)
+
+
+def test_implicit_io_forward_open_is_unconnected():
+    transmission = make_transmission(keepalive_interval=None)
+    transmission.driver._cfg = {
+        "cip_path": [],
+        "vid": b"\x01\x00",
+        "vsn": b"\x01\x02\x03\x04",
+        "ip address": "127.0.0.1",
+    }
+    # Forward Open reply: connection IDs, serial number, vendor, RPIs
+    transmission.driver.response = Tag(
+        "generic", struct.pack("<IIHHIII", 1, 2, 3, 4, 5, 10000, 10000), None
+    )
+    consumer = transmission.open_implicit_io(100, 4, 0.01, 198, 1, port=0)
+    transmission.close_implicit_io(consumer)
+    transmission.close()
+
+    assert [request["connected"] for request in transmission.driver.requests] == [
+        False,
+        False,
+    ]
@@ -0,0 +1,120 @@
+import socket
+import struct
+import time
+
+from pytest import raises
+
+from epcomms.connection.transmission import ImplicitIOConsumer, TransmissionError
+
+
+def make_frame(connection_id, encapsulation_sequence, data):
+    # stand-in for a class 1 producer: sequenced address item + connected data item
+    return (
+        struct.pack(
+            "<HHHIIHHH",
+            2,
+            0x8002,
+            8,
+            connection_id,
+            encapsulation_sequence,
+            0x00B1,
+            len(data) + 2,
+            encapsulation_sequence & 0xFFFF,
+        )
+        + data
+    )
+
+
+def make_consumer(connection_id=0x1234, **kwargs):
+    consumer = ImplicitIOConsumer(
+        connection_id, address="127.0.0.1", port=0, **kwargs
+    )
+    producer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    return consumer, producer
+
+
+def test_latest_frame():
+    consumer, producer = make_consumer()
+    try:
+        assert consumer.latest is None
+        producer.sendto(make_frame(0x1234, 1, b"\x01\x02\x03"), consumer.address)
+        frame = consumer.wait_for_frame(timeout=2)
+        assert frame.data == b"\x01\x02\x03"
+        assert frame.connection_id == 0x1234
+        assert frame.sequence == 1
+    finally:
+        consumer.close()
+        producer.close()
+
+
+def test_stream_ignores_other_and_stale_frames():
+    consumer, producer = make_consumer()
+    try:
+        stream = consumer.stream(timeout=2)
+        producer.sendto(make_frame(0x1234, 5, b"a"), consumer.address)
+        assert next(stream).data == b"a"
+
+        producer.sendto(make_frame(0x9999, 6, b"other connection"), consumer.address)
+        producer.sendto(make_frame(0x1234, 4, b"out of order"), consumer.address)
+        producer.sendto(make_frame(0x1234, 6, b"b"), consumer.address)
+        assert next(stream).data == b"b"
+        assert consumer.latest is not None and consumer.latest.data == b"b"
+    finally:
+        consumer.close()
+        producer.close()
+
+
+def test_wait_for_frame_timeout():
+    consumer, producer = make_consumer()
+    try:
+        with raises(TransmissionError):
+            consumer.wait_for_frame(timeout=0.1)
+    finally:
+        consumer.close()
+        producer.close()
+
+
+def test_wait_for_frame_rejects_stale_frames():
+    consumer, producer = make_consumer(max_age=0.1)
+    try:
+        producer.sendto(make_frame(0x1234, 1, b"a"), consumer.address)
+        assert consumer.wait_for_frame(timeout=2).data == b"a"
+
+        # the producer stopped: the last frame must not be handed out forever
+        time.sleep(0.2)
+        with raises(TransmissionError):
+            consumer.wait_for_frame(timeout=0.1)
+
+        producer.sendto(make_frame(0x1234, 2, b"b"), consumer.address)
+        assert consumer.wait_for_frame(timeout=2).data == b"b"
+    finally:
+        consumer.close()
+        producer.close()
+
+
+def test_socket_error_ends_streams():
+    consumer, producer = make_consumer()
+    try:
+        stream = consumer.stream(timeout=5)
+        consumer._listener.socket.close()
+        with raises(TransmissionError):
+            next(stream)
+    finally:
+        consumer.close()
+        producer.close()
+
+
+def test_unused_streams_unsubscribe():
+    consumer, producer = make_consumer()
+    try:
+        stream = consumer.stream()
+        consumer.stream()  # dropped without ever being iterated
+        assert len(consumer._subscribers._streams) == 1
+
+        stream.close()
+        assert not consumer._subscribers._streams
+        with raises(StopIteration):
+            next(stream)
+    finally:
+        consumer.close()
+        producer.close()
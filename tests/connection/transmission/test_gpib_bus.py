@@ -0,0 +1,103 @@
+import time
+from threading import Condition, Thread
+
+from epcomms.connection.transmission import GPIBBus
+
+
+class FakeDevice:
+    def __init__(self, status_byte):
+        self.status_byte = status_byte
+
+    def read_stb(self):
+        return self.status_byte
+
+
+class InterruptedCondition(Condition):
+    """Interrupts wait(), either straight away or just after being woken up
+    (i.e. just as the bus is granted)."""
+
+    def __init__(self, granted):
+        super().__init__()
+        self.granted = granted
+
+    def wait(self, timeout=None):
+        if self.granted:
+            super().wait(timeout)
+        raise KeyboardInterrupt
+
+
+def test_for_resource():
+    assert GPIBBus.for_resource("GPIB::5::INSTR") is GPIBBus.for_interface("gpib0")
+    assert GPIBBus.for_resource("GPIB1::5::INSTR").interface == "GPIB1"
+    assert GPIBBus.for_resource("USB0::0x2A8D::INSTR") is None
+
+
+def test_round_robin_with_priorities():
+    bus = GPIBBus("GPIB9")
+    order = []
+
+    def transaction(device, priority):
+        with bus.transaction(device, priority):
+            order.append(device)
+
+    threads = []
+    with bus.transaction("controller"):
+        for device, priority in [("a", 0), ("a", 0), ("b", 0), ("c", 1)]:
+            threads.append(Thread(target=transaction, args=(device, priority)))
+            threads[-1].start()
+            while bus.waiting < len(threads):
+                time.sleep(0.001)
+        # nested transactions on the same thread don't wait
+        with bus.transaction("controller"):
+            pass
+    for thread in threads:
+        thread.join()
+
+    assert order == ["c", "a", "b", "a"]
+    statistics = bus.statistics()
+    assert statistics.transactions == 5
+    assert statistics.device_transactions == {"controller": 1, "a": 2, "b": 1, "c": 1}
+    assert 0 < statistics.utilization <= 1
+    assert statistics.max_wait >= statistics.mean_wait > 0
+
+
+def test_service_requests():
+    bus = GPIBBus("GPIB8")
+    bus.attach("GPIB8::1::INSTR", FakeDevice(0x40))
+    bus.attach("GPIB8::2::INSTR", FakeDevice(0x10))
+    assert bus.service_requests() == ["GPIB8::1::INSTR"]
+    bus.detach("GPIB8::1::INSTR")
+    assert not bus.service_requests()
+
+
+def test_interrupted_wait():
+    for granted in (False, True):
+        bus = GPIBBus("GPIB7")
+        bus._condition = InterruptedCondition(granted)
+        interrupted = []
+
+        def transaction():
+            try:
+                with bus.transaction("a"):
+                    pass
+            except KeyboardInterrupt:
+                interrupted.append(True)
+
+        with bus.transaction("controller"):
+            thread = Thread(target=transaction)
+            thread.start()
+            if granted:
+                while bus.waiting < 1:
+                    time.sleep(0.001)
+            else:
+                thread.join()
+        thread.join()
+        assert interrupted
+        assert bus.waiting == 0
+
+        # the ticket doesn't hold on to the bus
+        thread = Thread(target=transaction, daemon=True)
+        thread.start()
+        thread.join(timeout=1)
+        assert not thread.is_alive()
+        assert bus.statistics().transactions == 2 + granted
@@ -0,0 +1,49 @@
+from pytest import raises
+
+from epcomms.equipment.base import SCPIInstrument, SCPITemplate
+
+
+def test_generate_command():
+    instrument = SCPIInstrument()
+    assert instrument.generate_command("SYST:BEEP") == "SYST:BEEP"
+    assert instrument.generate_command("VOLT", arguments="5") == "VOLT 5"
+    assert instrument.generate_command("VOLT", "5", [1, 2]) == "VOLT 5, (@1,2)"
+
+
+def test_generate_query():
+    instrument = SCPIInstrument()
+    assert instrument.generate_query("MEAS:VOLT", channels=[1, 2, 3]) == (
+        "MEAS:VOLT? (@1:3)"
+    )
+    assert instrument.generate_query("OUTP", channels=[1, 2, 4, 5, 6, 8]) == (
+        "OUTP? (@1,2,4:6,8)"
+    )
+    assert instrument.generate_query("MEAS:VOLT:AC", ["DEF", None]) == (
+        "MEAS:VOLT:AC? DEF"
+    )
+    # repeated messages come back from the cache
+    assert instrument.generate_query("MEAS:VOLT", channels=[1, 2, 3]) is (
+        instrument.generate_query("MEAS:VOLT", channels=(1, 2, 3))
+    )
+
+
+def test_template():
+    template = SCPITemplate("MEAS:VOLT:DC", str, str.upper, query=True)
+    assert template(10, "def") == "MEAS:VOLT:DC? 10,DEF"
+    assert template(10, "def", channels=[1, 2]) == "MEAS:VOLT:DC? 10,DEF, (@1,2)"
+    assert template(10, "def") is template(10, "def")
+
+    with raises(TypeError):
+        template(10)
+
+
+def test_parse_array():
+    instrument = SCPIInstrument()
+    parsed = instrument.parse_array("+1.5E+00,-2.0E-03,+9.9E+37\n")
+    assert parsed.values.tolist()[:2] == [1.5, -2.0e-3]
+    assert parsed.overflow.tolist() == [False, False, True]
+    assert parsed.units is None
+
+    parsed = instrument.parse_array("+1.5E+00 VDC, +2.5E+00 VDC")
+    assert parsed.values.tolist() == [1.5, 2.5]
+    assert parsed.units.tolist() == ["VDC", "VDC"]
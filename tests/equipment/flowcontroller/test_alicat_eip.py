@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+from epcomms.equipment.flowcontroller import AlicatEIP
+
+
+class FakeResponse:
+    def __init__(self, value):
+        self.value = value
+
+    def deserialize(self):
+        return self.value
+
+
+class FakeEthernetIP:
+    # identity object attribute -> value
+    identity = {1: 1328, 2: 18, 3: 7, 5: 0, 6: 123456, 7: "LICAT"}
+
+    def __init__(self, path):
+        self.path = path
+        self.generation = 1
+        self.polled = []
+
+    def poll(self, packet):
+        attribute = packet.serialize()["attribute"]
+        self.polled.append(attribute)
+        return FakeResponse(self.identity[attribute])
+
+    def close(self):
+        pass
+
+
+def make_controller():
+    with patch(
+        "epcomms.equipment.flowcontroller.alicat_eip.EthernetIP", FakeEthernetIP
+    ):
+        return AlicatEIP("192.168.0.172")
+
+
+def test_static_identity_read_once():
+    controller = make_controller()
+    first = controller.get_identity_string()
+    assert controller.get_identity_string() == first
+    assert "LICAT" in first and "123456" in first
+    assert sorted(controller.transmission.polled) == [1, 2, 3, 6, 7]
+
+
+def test_status_always_read_live():
+    controller = make_controller()
+    assert not controller.get_status()["ADC_error"]
+    controller.transmission.identity = {**FakeEthernetIP.identity, 5: 0b10000000000}
+    assert controller.get_status()["ADC_error"]
+    assert controller.transmission.polled == [5, 5]
+
+
+def test_identity_cache_cleared_on_reconnect():
+    controller = make_controller()
+    controller.get_identity_string()
+    controller.transmission.polled.clear()
+
+    # a new session: the device may have been swapped
+    controller.transmission.generation += 1
+    controller.transmission.identity = {**FakeEthernetIP.identity, 6: 654321}
+    assert "654321" in controller.get_identity_string()
+    assert sorted(controller.transmission.polled) == [1, 2, 3, 6, 7]
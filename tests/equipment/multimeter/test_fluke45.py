@@ -0,0 +1,128 @@
+from unittest.mock import patch
+
+from pytest import raises
+
+from epcomms.connection.packet import ASCII
+from epcomms.connection.transmission import TransmissionError
+from epcomms.equipment.base import MeasurementError
+from epcomms.equipment.multimeter import Fluke45
+
+
+class FakeFluke:
+    """Stands in for the serial link, answering like a Fluke 45."""
+
+    def __init__(self, *_, **__):
+        self.sent = []
+        self.lines = []
+        self.fail = False
+
+    def poll(self, packet):
+        self.command(packet)
+        return self.read()
+
+    def command(self, packet):
+        line = packet.serialize().decode("ascii")
+        self.sent.append(line)
+        if self.fail:
+            self.lines.append("?>")
+        elif line.endswith("?\r"):
+            self.lines += ["+1.234E+0", "=>"]
+        else:
+            self.lines.append("=>")
+
+    def read(self):
+        return ASCII.from_wire(self.lines.pop(0).encode("ascii"))
+
+
+@patch("epcomms.equipment.multimeter.fluke45.Serial", FakeFluke)
+def test_skips_unchanged_configuration():
+    meter = Fluke45("/dev/null")
+    assert meter.measure_voltage_dc() == 1.234
+    meter.measure_voltage_dc()
+    meter.measure_voltage_dc(3, "F")
+    meter.measure_voltage_dc(3, "S")
+    meter.measure_current_dc(3)
+
+    assert meter.transmission.sent == [
+        "RATE F;TRIGGER 1;AUTO\r",
+        "VDC;VAL1?\r",
+        "VAL1?\r",
+        "RANGE 3;VAL1?\r",
+        "RATE S;VAL1?\r",
+        "ADC;RANGE 3;VAL1?\r",
+    ]
+
+
+@patch("epcomms.equipment.multimeter.fluke45.Serial", FakeFluke)
+def test_error_invalidates_state():
+    meter = Fluke45("/dev/null")
+    meter.measure_voltage_dc()
+    meter.transmission.fail = True
+    with raises(TransmissionError):
+        meter.measure_voltage_dc(2)
+    meter.transmission.fail = False
+    meter.measure_voltage_dc(2)
+    assert meter.transmission.sent[-1] == "VDC;RANGE 2;VAL1?\r"
+
+
+@patch("epcomms.equipment.multimeter.fluke45.Serial", FakeFluke)
+def test_stream():
+    meter = Fluke45("/dev/null")
+    stream = meter.stream("voltage_ac")
+    readings = [next(stream) for _ in range(3)]
+    stream.close()
+
+    assert [reading.value for reading in readings] == [1.234] * 3
+    assert meter.transmission.sent[1] == "VAC;TRIGGER 1\r"
+    assert set(meter.transmission.sent[2:]) == {"VAL1?\r"}
+    # every response was consumed before the stream closed
+    assert meter.transmission.lines == []
+
+
+@patch("epcomms.equipment.multimeter.fluke45.Serial", FakeFluke)
+def test_measure_pair():
+    meter = Fluke45("/dev/null")
+    original_command = meter.transmission.command
+
+    def command(packet):
+        original_command(packet)
+        if packet.serialize().endswith(b"VAL?\r"):
+            meter.transmission.lines[-2] = "+1.0E+0,+5.0E+1"
+
+    meter.transmission.command = command
+    assert meter.measure_pair("voltage_dc", "frequency") == (1.0, 50.0)
+    assert meter.measure_pair("voltage_dc", "frequency") == (1.0, 50.0)
+    assert meter.transmission.sent[1:] == ["VDC;FREQ2;VAL?\r", "VAL?\r"]
+
+
+@patch("epcomms.equipment.multimeter.fluke45.Serial", FakeFluke)
+def test_range_prediction():
+    meter = Fluke45("/dev/null")
+    meter.set_range_prediction(True)
+    meter.measure_voltage_dc()
+    meter.measure_voltage_dc()
+    meter.measure_voltage_dc()
+
+    # 1.234 V fits the 3 V range (RANGE 2) at the fast rate
+    assert meter.transmission.sent[1:] == [
+        "VDC;AUTO;VAL1?\r",
+        "RANGE 2;VAL1?\r",
+        "VAL1?\r",
+    ]
+
+
+@patch("epcomms.equipment.multimeter.fluke45.Serial", FakeFluke)
+def test_reconfiguring_disarms():
+    meter = Fluke45("/dev/null")
+    meter.arm("voltage_dc")
+    meter.trigger()
+    assert meter.fetch() == 1.234
+
+    # same configuration: still armed
+    meter.measure_voltage_dc()
+    meter.trigger()
+    assert meter.fetch() == 1.234
+
+    meter.measure_current_dc()
+    with raises(MeasurementError):
+        meter.trigger()
@@ -0,0 +1,69 @@
+from pytest import raises
+
+from epcomms.connection.packet import String
+from epcomms.connection.transmission import Transmission
+from epcomms.equipment.base import MeasurementError
+from epcomms.equipment.multimeter import MultimeterGroup, SCPIMultimeter
+
+
+class FakeTransmission(Transmission[String, String]):
+    """Records every message and answers queries with canned responses."""
+
+    def __init__(self, responses=None):
+        super().__init__()
+        self.sent = []
+        self.responses = responses or {}
+
+    def _command(self, packet):
+        self.sent.append(packet.serialize())
+
+    def _read(self):
+        return String.from_wire(self.responses.get(self.sent[-1], "+1.0E+00"))
+
+
+def test_group_read():
+    transmissions = [
+        FakeTransmission({"FETC?": "+1.5E+00"}),
+        FakeTransmission({"FETC?": "+2.5E+00"}),
+    ]
+    meters = [SCPIMultimeter(transmission, String) for transmission in transmissions]
+
+    with MultimeterGroup(meters) as group:
+        group.arm(["voltage_dc", "current_dc"], 10)
+        reading = group.read()
+
+    assert reading.values == (1.5, 2.5)
+    assert reading.skew >= 0
+    assert transmissions[0].sent == [
+        "CONF:VOLT:DC 1.00e+01,DEF;:TRIG:SOUR BUS;:SAMP:COUN 1;:TRIG:COUN 1;:INIT",
+        "*TRG",
+        "FETC?",
+        "INIT",
+    ]
+    assert transmissions[1].sent[0].startswith("CONF:CURR:DC 1.00e+01,DEF;")
+
+
+def test_group_requires_arm():
+    meter = SCPIMultimeter(FakeTransmission(), String)
+    with MultimeterGroup([meter]) as group:
+        with raises(MeasurementError):
+            group.read()
+        with raises(ValueError):
+            group.arm(["voltage_dc", "voltage_ac"])
+
+
+def test_reconfiguring_disarms():
+    transmission = FakeTransmission()
+    meter = SCPIMultimeter(transmission, String)
+
+    meter.arm("voltage_dc", 10)
+    meter.trigger()
+    # CONF puts the meter back to immediate triggering
+    meter.measure_current_dc()
+    with raises(MeasurementError):
+        meter.fetch()
+
+    meter.arm("voltage_dc", 10)
+    meter.set_profile("fast")
+    with raises(MeasurementError):
+        meter.trigger()
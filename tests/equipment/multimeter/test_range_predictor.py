@@ -0,0 +1,42 @@
+from epcomms.equipment.multimeter import RangePredictor
+
+FULL_SCALES = (0.1, 1.0, 10.0, 100.0)
+
+
+def test_predict():
+    predictor = RangePredictor(headroom=1.25, history=2)
+    assert predictor.predict("voltage_dc", FULL_SCALES) is None
+
+    assert predictor.observe("voltage_dc", -0.5)
+    assert predictor.predict("voltage_dc", FULL_SCALES) == 1
+    # 0.9 * 1.25 doesn't fit in the 1 V range
+    assert predictor.observe("voltage_dc", 0.9, FULL_SCALES, 1)
+    assert predictor.predict("voltage_dc", FULL_SCALES) == 2
+    # readings are kept per function
+    assert predictor.predict("current_dc", FULL_SCALES) is None
+    # nothing fits
+    predictor.observe("voltage_dc", 500.0)
+    assert predictor.predict("voltage_dc", FULL_SCALES) is None
+
+
+def test_fall_back_to_autorange():
+    predictor = RangePredictor()
+    predictor.observe("voltage_dc", 5.0)
+    # overload: retake the reading with autoranging
+    assert not predictor.observe("voltage_dc", 9.9e37, FULL_SCALES, 2)
+    assert predictor.predict("voltage_dc", FULL_SCALES) is None
+
+    predictor.observe("voltage_dc", 5.0)
+    # below 10% of full scale: keep the reading, autorange next time
+    assert predictor.observe("voltage_dc", 0.5, FULL_SCALES, 2)
+    assert predictor.predict("voltage_dc", FULL_SCALES) is None
+
+
+def test_stay_pinned_on_lowest_range():
+    predictor = RangePredictor()
+    predictor.observe("voltage_dc", 0.05)
+    assert predictor.predict("voltage_dc", FULL_SCALES) == 0
+    # near zero, but there's no smaller range to go to
+    for _ in range(4):
+        assert predictor.observe("voltage_dc", 1e-6, FULL_SCALES, 0)
+        assert predictor.predict("voltage_dc", FULL_SCALES) == 0
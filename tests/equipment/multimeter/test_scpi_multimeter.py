@@ -0,0 +1,295 @@
+from unittest.mock import patch
+
+from pytest import raises
+
+from epcomms.connection.packet import String
+from epcomms.connection.transmission import Transmission
+from epcomms.equipment.base import CommandError, ErrorCheckPolicy
+from epcomms.equipment.multimeter import (
+    KeysightEDU34450A,
+    MeasurementProfile,
+    SCPIMultimeter,
+)
+
+
+class FakeTransmission(Transmission[String, String]):
+    """Records every message and answers queries with canned responses."""
+
+    def __init__(self, responses=None):
+        super().__init__()
+        self.sent = []
+        self.responses = responses or {}
+
+    def _command(self, packet):
+        self.sent.append(packet.serialize())
+
+    def _read(self):
+        return String.from_wire(self.responses.get(self.sent[-1], "+1.0E+00"))
+
+
+def test_configure_only_on_change():
+    transmission = FakeTransmission()
+    meter = SCPIMultimeter(transmission, String)
+
+    assert meter.measure_voltage_dc(10) == 1.0
+    meter.measure_voltage_dc(10)
+    meter.measure_voltage_dc(10, "DEF")
+    meter.measure_voltage_dc(100)
+    meter.measure_current_dc(100)
+
+    assert transmission.sent == [
+        "CONF:VOLT:DC 1.00e+01,DEF;:READ?",
+        "READ?",
+        "READ?",
+        "CONF:VOLT:DC 1.00e+02,DEF;:READ?",
+        "CONF:CURR:DC 1.00e+02,DEF;:READ?",
+    ]
+
+
+def test_invalidate_configuration():
+    transmission = FakeTransmission()
+    meter = SCPIMultimeter(transmission, String)
+
+    meter.measure_voltage_ac()
+    meter.measure_continuity()
+    meter.measure_voltage_ac()
+    meter.invalidate_configuration()
+    meter.measure_voltage_ac()
+
+    assert transmission.sent == [
+        "CONF:VOLT:AC DEF,DEF;:READ?",
+        "MEAS:CONT?",
+        "CONF:VOLT:AC DEF,DEF;:READ?",
+        "CONF:VOLT:AC DEF,DEF;:READ?",
+    ]
+
+
+def test_acquire():
+    transmission = FakeTransmission({"FETC?": "+1.0E+00,+2.0E+00,+9.9E+37"})
+    meter = SCPIMultimeter(transmission, String)
+
+    acquisition = meter.acquire(3, "voltage_dc", 10)
+    assert acquisition.values[:2].tolist() == [1.0, 2.0]
+    assert acquisition.overflow.tolist() == [False, False, True]
+    assert (acquisition.timestamps[1:] >= acquisition.timestamps[:-1]).all()
+    assert transmission.sent == [
+        "CONF:VOLT:DC 1.00e+01,DEF;:SAMP:COUN 3;:TRIG:COUN 1",
+        "INIT",
+        "FETC?",
+    ]
+
+    # the next single reading has to reconfigure the sample count
+    meter.measure_voltage_dc(10)
+    assert transmission.sent[-1] == "CONF:VOLT:DC 1.00e+01,DEF;:READ?"
+
+
+def test_stream():
+    transmission = FakeTransmission({"FETC?": "+1.0E+00,+2.0E+00"})
+    meter = SCPIMultimeter(transmission, String)
+
+    stream = meter.stream("voltage_dc", chunk=2)
+    assert next(stream).values.tolist() == [1.0, 2.0]
+    assert next(stream).values.tolist() == [1.0, 2.0]
+    stream.close()
+
+    assert transmission.sent == [
+        "CONF:VOLT:DC DEF,DEF;:SAMP:COUN 2;:TRIG:COUN 1",
+        "INIT",
+        "FETC?",
+        "INIT",
+        "FETC?",
+        "INIT",
+        "ABOR",
+    ]
+
+
+def test_measure_pair():
+    transmission = FakeTransmission(
+        {
+            'CONF:VOLT:DC AUTO,DEF;:CONF:SEC "FREQ";:READ?;:DATA2?': (
+                "+1.0E+00;+5.0E+01"
+            ),
+            "READ?;:DATA2?": "+2.0E+00;+6.0E+01",
+        }
+    )
+    with patch(
+        "epcomms.equipment.multimeter.keysight_edu34450a.Visa",
+        lambda *_, **__: transmission,
+    ):
+        meter = KeysightEDU34450A("USB0::INSTR")
+
+    assert meter.measure_pair("voltage_dc", "frequency") == (1.0, 50.0)
+    assert meter.measure_pair("voltage_dc", "frequency") == (2.0, 60.0)
+    # reconfiguring the primary measurement turns the secondary off
+    meter.measure_voltage_ac()
+    meter.measure_pair("voltage_dc", "frequency")
+    assert transmission.sent[-1] == (
+        'CONF:VOLT:DC AUTO,DEF;:CONF:SEC "FREQ";:READ?;:DATA2?'
+    )
+
+
+def test_range_prediction():
+    transmission = FakeTransmission(
+        {
+            "CONF:VOLT:DC AUTO,DEF;:READ?": "+5.0E+00",
+            "CONF:VOLT:DC 1.00e+01,DEF;:READ?": "+6.0E+00",
+            "READ?": "+9.9E+37",
+        }
+    )
+    with patch(
+        "epcomms.equipment.multimeter.keysight_edu34450a.Visa",
+        lambda *_, **__: transmission,
+    ):
+        meter = KeysightEDU34450A("USB0::INSTR")
+    meter.set_range_prediction(True)
+
+    assert meter.measure_voltage_dc() == 5.0
+    assert meter.measure_voltage_dc() == 6.0
+    # the pinned range overloads, so the reading is retaken autoranging
+    assert meter.measure_voltage_dc() == 5.0
+    # an explicit range is always used as given
+    meter.measure_voltage_dc(100)
+    assert transmission.sent == [
+        "CONF:VOLT:DC AUTO,DEF;:READ?",
+        "CONF:VOLT:DC 1.00e+01,DEF;:READ?",
+        "READ?",
+        "CONF:VOLT:DC AUTO,DEF;:READ?",
+        "CONF:VOLT:DC 1.00e+02,DEF;:READ?",
+    ]
+
+
+def test_range_prediction_near_zero():
+    transmission = FakeTransmission(
+        {
+            "CONF:VOLT:DC AUTO,DEF;:READ?": "+5.0E-02",
+            "CONF:VOLT:DC 1.00e-01,DEF;:READ?": "+1.0E-06",
+            "READ?": "+1.0E-06",
+        }
+    )
+    with patch(
+        "epcomms.equipment.multimeter.keysight_edu34450a.Visa",
+        lambda *_, **__: transmission,
+    ):
+        meter = KeysightEDU34450A("USB0::INSTR")
+    meter.set_range_prediction(True)
+
+    meter.measure_voltage_dc()
+    for _ in range(4):
+        assert meter.measure_voltage_dc() == 1e-6
+    # pinned to the lowest range, so the meter isn't reconfigured again
+    assert transmission.sent == [
+        "CONF:VOLT:DC AUTO,DEF;:READ?",
+        "CONF:VOLT:DC 1.00e-01,DEF;:READ?",
+        "READ?",
+        "READ?",
+        "READ?",
+    ]
+
+
+def test_profiles():
+    transmission = FakeTransmission()
+    meter = SCPIMultimeter(transmission, String)
+
+    assert meter.set_profile("fast") == 2500.0
+    meter.measure_voltage_dc()
+    meter.measure_voltage_dc()
+    # an explicit aperture is converted for NPLC functions
+    assert meter.set_profile(MeasurementProfile(aperture=0.1), 60) == 5.0
+    meter.measure_voltage_dc(10, 1e-5)
+    assert transmission.sent == [
+        "CONF:VOLT:DC DEF,MAX;:SENS:VOLT:DC:NPLC 0.02;"
+        ":SENS:VOLT:DC:ZERO:AUTO OFF;:READ?",
+        "READ?",
+        "CONF:VOLT:DC 1.00e+01,1.00e-05;:SENS:VOLT:DC:NPLC 6;:READ?",
+    ]
+    meter.measure_frequency()
+    assert transmission.sent[-1] == "CONF:FREQ DEF,DEF;:SENS:FREQ:APER 0.1;:READ?"
+    meter.set_profile(None)
+    meter.measure_voltage_dc()
+    assert transmission.sent[-1] == "CONF:VOLT:DC DEF,DEF;:READ?"
+
+    with raises(ValueError):
+        meter.set_profile("fastest")
+    with raises(ValueError):
+        MeasurementProfile(nplc=1, aperture=0.02)
+
+
+def test_profile_without_nplc():
+    transmission = FakeTransmission()
+    with patch(
+        "epcomms.equipment.multimeter.keysight_edu34450a.Visa",
+        lambda *_, **__: transmission,
+    ):
+        meter = KeysightEDU34450A("USB0::INSTR")
+
+    assert meter.set_profile("precise") is None
+    meter.measure_voltage_dc()
+    assert transmission.sent == ["CONF:VOLT:DC AUTO,MIN;:READ?"]
+
+
+NO_ERROR = '+0,"No error"'
+UNDEFINED_HEADER = '-113,"Undefined header"'
+
+
+def test_read_errors():
+    transmission = FakeTransmission(
+        {";:".join(["SYST:ERR?"] * 5): ";".join([UNDEFINED_HEADER] + [NO_ERROR] * 4)}
+    )
+    meter = SCPIMultimeter(transmission, String)
+    assert meter.read_errors() == [(-113, "Undefined header")]
+    assert len(transmission.sent) == 1
+
+
+def test_appended_error_check():
+    transmission = FakeTransmission(
+        {
+            "CONF:VOLT:DC DEF,DEF;:READ?;:SYST:ERR?": f"+1.0E+00;{NO_ERROR}",
+            "READ?;:SYST:ERR?": f"+1.0E+00;{UNDEFINED_HEADER}",
+            ";:".join(["SYST:ERR?"] * 5): NO_ERROR,
+        }
+    )
+    meter = SCPIMultimeter(transmission, String)
+    meter.set_error_check_policy(ErrorCheckPolicy.APPENDED)
+
+    assert meter.measure_voltage_dc() == 1.0
+    with raises(CommandError):
+        meter.measure_voltage_dc()
+
+
+def test_every_n_error_check():
+    transmission = FakeTransmission({";:".join(["SYST:ERR?"] * 5): NO_ERROR})
+    meter = SCPIMultimeter(transmission, String)
+    meter.set_error_check_policy(ErrorCheckPolicy.EVERY_N, 2)
+
+    for _ in range(4):
+        meter.measure_voltage_dc()
+    assert [message.startswith("SYST:ERR?") for message in transmission.sent] == [
+        False,
+        False,
+        True,
+        False,
+        False,
+        True,
+    ]
+
+
+def test_measure_statistics():
+    transmission = FakeTransmission(
+        {
+            "INIT;*WAI;:CALC:AVER:MIN?;MAX?;AVER?;SDEV?;COUN?": (
+                "+1.0E+00;+3.0E+00;+2.0E+00;+5.0E-01;+1000"
+            )
+        }
+    )
+    meter = SCPIMultimeter(transmission, String)
+
+    statistics = meter.measure_statistics(1000, "voltage_dc", 10)
+    assert (statistics.minimum, statistics.maximum, statistics.mean) == (1, 3, 2)
+    assert statistics.standard_deviation == 0.5
+    assert statistics.count == 1000
+    assert transmission.sent == [
+        "CONF:VOLT:DC 1.00e+01,DEF;:SAMP:COUN 1000;:TRIG:COUN 1;"
+        ":CALC:FUNC AVER;:CALC:STAT ON",
+        "INIT;*WAI;:CALC:AVER:MIN?;MAX?;AVER?;SDEV?;COUN?",
+        "CALC:STAT OFF",
+    ]
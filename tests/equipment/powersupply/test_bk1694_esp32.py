@@ -0,0 +1,140 @@
+import json
+import time
+from threading import Event, Thread
+from unittest.mock import patch
+
+from epcomms.connection.packet import String
+from epcomms.equipment.powersupply import BK1694
+
+
+class FakeSocket:
+    """Answers like the ESP32 server; getStatus and writes can be held up."""
+
+    def __init__(self, *_, **__):
+        self.sent = []
+        self.value = 0
+        self.enable = False
+        self.write_response = None
+        self.release = Event()
+        self.release.set()
+        self.release_write = Event()
+        self.release_write.set()
+
+    def poll(self, packet):
+        request = json.loads(packet.serialize())
+        self.sent.append(request["command"])
+        if request["command"] == "getStatus":
+            # the status is taken when the request arrives
+            status = json.dumps({"value": self.value, "enable": self.enable})
+            self.release.wait()
+            return String.from_wire(status)
+        self.release_write.wait()
+        if request["command"] == "setValue":
+            self.value = request["value"]
+        else:
+            self.enable = request["value"]
+        return String.from_wire(self.write_response or "ok")
+
+
+def make_supply(status_ttl=10.0):
+    with patch("epcomms.equipment.powersupply.bk1694_esp32.Socket", FakeSocket):
+        return BK1694("127.0.0.1", status_ttl)
+
+
+def wait_for(condition):
+    while not condition():
+        time.sleep(0.001)
+
+
+def test_status_is_cached():
+    supply = make_supply()
+    assert supply.get_output(1) is False
+    assert supply.measure_voltage_setpoint(1) == 0.0
+    assert supply.transmission.sent == ["getStatus"]
+
+    supply.status_ttl = 0
+    time.sleep(0.001)
+    supply.get_output(1)
+    assert supply.transmission.sent == ["getStatus", "getStatus"]
+
+
+def test_single_flight():
+    supply = make_supply()
+    supply.transmission.release.clear()
+    results = []
+    threads = [
+        Thread(target=lambda: results.append(supply.get_output(1))),
+        Thread(target=lambda: results.append(supply.measure_voltage_setpoint(1))),
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    supply.transmission.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [0.0, False]
+    assert supply.transmission.sent == ["getStatus"]
+
+
+def test_writes_update_status():
+    supply = make_supply()
+    supply.get_output(1)
+    supply.set_output(True, 1)
+    assert supply.get_output(1) is True
+
+    # a full status in the response replaces the cached one
+    supply.transmission.write_response = json.dumps({"value": 255, "enable": False})
+    supply.set_voltage(30.0, 1)
+    assert supply.measure_voltage_setpoint(1) == 30.0
+    assert supply.get_output(1) is False
+    assert supply.transmission.sent == ["getStatus", "enable", "setValue"]
+
+
+def test_no_sharing_across_writes():
+    supply = make_supply()
+    supply.transmission.release.clear()
+    results = {}
+
+    def get_output(name):
+        results[name] = supply.get_output(1)
+
+    before = Thread(target=get_output, args=("before",))
+    before.start()
+    wait_for(lambda: supply.transmission.sent)
+    # written while the getStatus above is still in flight
+    supply.set_output(True, 1)
+    after = Thread(target=get_output, args=("after",))
+    after.start()
+    time.sleep(0.05)
+    supply.transmission.release.set()
+    before.join()
+    after.join()
+
+    assert results == {"before": False, "after": True}
+    assert supply.transmission.sent == ["getStatus", "enable", "getStatus"]
+    # the stale read didn't overwrite the cache
+    assert supply.get_output(1) is True
+
+
+def test_status_read_during_write_is_discarded():
+    supply = make_supply()
+    supply.transmission.write_response = json.dumps({"value": 0, "enable": True})
+    supply.transmission.release_write.clear()
+    supply.transmission.release.clear()
+
+    write = Thread(target=supply.set_output, args=(True, 1))
+    write.start()
+    wait_for(lambda: supply.transmission.sent == ["enable"])
+    # sent while the write is in flight, so answered with the old status
+    read = Thread(target=supply.get_output, args=(1,))
+    read.start()
+    wait_for(lambda: supply.transmission.sent == ["enable", "getStatus"])
+    supply.transmission.release_write.set()
+    write.join()
+    supply.transmission.release.set()
+    read.join()
+
+    # the write's response stays cached
+    assert supply.get_output(1) is True
+    assert supply.transmission.sent == ["enable", "getStatus"]
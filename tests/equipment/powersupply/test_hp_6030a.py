@@ -0,0 +1,51 @@
+import time
+from unittest.mock import patch
+
+from pytest import raises
+
+from epcomms.connection.packet import String
+from epcomms.connection.transmission import Transmission
+from epcomms.equipment.powersupply import HP6030A
+
+
+class FakeTransmission(Transmission[String, String]):
+    """Records every message and answers queries with canned responses."""
+
+    def __init__(self, responses=None):
+        super().__init__()
+        self.sent = []
+        self.responses = responses or {}
+
+    def _command(self, packet):
+        self.sent.append(packet.serialize())
+
+    def _read(self):
+        return String.from_wire(self.responses.get(self.sent[-1], "+1.0E+00"))
+
+
+def make_supply(transmission):
+    with patch(
+        "epcomms.equipment.powersupply.hp_6030a.Visa",
+        lambda *_, **__: transmission,
+    ):
+        return HP6030A("GPIB0::5::INSTR")
+
+
+def test_host_timed_ramp():
+    transmission = FakeTransmission()
+    supply = make_supply(transmission)
+
+    start = time.perf_counter()
+    supply.ramp([1.0, 2.0, 3.0], 0.01, current_limits=[0.5, 0.5, 0.5])
+    assert time.perf_counter() - start >= 0.03
+    assert transmission.sent == [
+        "CURR 0.5",
+        "VOLT 1.0",
+        "CURR 0.5",
+        "VOLT 2.0",
+        "CURR 0.5",
+        "VOLT 3.0",
+    ]
+
+    with raises(ValueError):
+        supply.ramp([1.0, 2.0], [0.01])
@@ -0,0 +1,175 @@
+import time
+from threading import Thread
+from unittest.mock import patch
+
+from pytest import raises
+
+from epcomms.connection.packet import String
+from epcomms.connection.transmission import Transmission
+from epcomms.equipment.base import MeasurementError
+from epcomms.equipment.powersupply import KeysightEDU36311A, OutputSnapshot
+
+
+class FakeTransmission(Transmission[String, String]):
+    """Records every message and answers queries with canned responses."""
+
+    def __init__(self, responses=None):
+        super().__init__()
+        self.sent = []
+        self.responses = responses or {}
+
+    def _command(self, packet):
+        self.sent.append(packet.serialize())
+
+    def _read(self):
+        return String.from_wire(self.responses.get(self.sent[-1], "+1.0E+00"))
+
+
+def make_supply(transmission):
+    with patch(
+        "epcomms.equipment.powersupply.keysight_edu36311a.Visa",
+        lambda *_, **__: transmission,
+    ):
+        return KeysightEDU36311A("USB0::INSTR")
+
+
+def test_measure_outputs():
+    query = (
+        "MEAS:VOLT? (@1:3);:MEAS:CURR? (@1:3);:VOLT? (@1:3);:CURR? (@1:3);"
+        ":OUTP? (@1:3)"
+    )
+    transmission = FakeTransmission(
+        {
+            query: (
+                "+5.0E+00,+1.2E+01,0.0E+00;+1.0E-01,+2.0E-01,0.0E+00;"
+                "+5.0E+00,+1.2E+01,+3.0E+00;+1.0E+00,+1.0E+00,+5.0E-01;1,1,0\n"
+            )
+        }
+    )
+    supply = make_supply(transmission)
+
+    snapshots = supply.measure_outputs([1, 2, 3])
+    assert transmission.sent == [query]
+    assert snapshots[0] == OutputSnapshot(1, 5.0, 0.1, 5.0, 1.0, True)
+    assert snapshots[2] == OutputSnapshot(3, 0.0, 0.0, 3.0, 0.5, False)
+
+
+def test_measure_outputs_unexpected_response():
+    supply = make_supply(FakeTransmission())
+    with raises(MeasurementError):
+        supply.measure_outputs([1, 2])
+
+
+def test_state_mirror():
+    transmission = FakeTransmission({"VOLT? (@1,2)": "+5.0E+00,+6.0E+00"})
+    supply = make_supply(transmission)
+    supply.enable_state_mirror()
+
+    supply.set_voltage(5.0, 1)
+    supply.set_voltage(5.0, 1)
+    assert supply.measure_voltage_setpoint(1) == 5.0
+    assert supply.measure_voltage_setpoint([1, 2]) == [5.0, 6.0]
+    assert supply.measure_voltage_setpoint([1, 2]) == [5.0, 6.0]
+    supply.set_output(True, [1, 2])
+    assert supply.get_output([1, 2]) == [True, True]
+    assert transmission.sent == ["VOLT 5.0, (@1)", "VOLT? (@1,2)", "OUTP 1, (@1,2)"]
+
+    supply.invalidate_state_mirror()
+    supply.measure_voltage_setpoint(1)
+    assert transmission.sent[-1] == "VOLT? (@1)"
+
+
+def test_state_mirror_expires():
+    transmission = FakeTransmission()
+    supply = make_supply(transmission)
+    supply.enable_state_mirror(max_age=5)
+
+    with patch(
+        "epcomms.equipment.powersupply.power_supply.time.monotonic",
+        side_effect=[0.0, 0.0, 10.0, 10.0],
+    ):
+        supply.set_current_limit(1.0, 1)
+        supply.set_current_limit(1.0, 1)
+    assert transmission.sent == ["CURR 1.0, (@1)", "CURR 1.0, (@1)"]
+
+
+def test_list_mode_ramp():
+    transmission = FakeTransmission()
+    supply = make_supply(transmission)
+    supply.enable_state_mirror()
+    supply.set_voltage(1.0, 2)
+
+    with patch(
+        "epcomms.equipment.powersupply.list_mode_power_supply.time.sleep"
+    ) as sleep:
+        supply.ramp([1.0, 2.0, 3.0], 0.01, 2, current_limits=[0.5, 0.5, 0.5])
+    sleep.assert_called_once_with(0.03)
+    assert transmission.sent[1:] == [
+        "VOLT:MODE LIST, (@2);:LIST:VOLT 1,2,3, (@2);:CURR:MODE LIST, (@2);"
+        ":LIST:CURR 0.5,0.5,0.5, (@2);:LIST:DWEL 0.01,0.01,0.01, (@2);"
+        ":LIST:COUN 1, (@2);:LIST:TERM:LAST ON, (@2);:TRIG:TRAN:SOUR BUS, (@2);"
+        ":INIT:TRAN (@2);*TRG",
+        "VOLT:MODE FIX, (@2);:CURR:MODE FIX, (@2)",
+    ]
+
+    # the ramp changed the setpoint behind the mirror's back
+    supply.set_voltage(1.0, 2)
+    assert transmission.sent[-1] == "VOLT 1.0, (@2)"
+
+    with raises(ValueError):
+        supply.ramp([1.0, 2.0], [0.01])
+
+
+def test_batch():
+    transmission = FakeTransmission(
+        {"VOLT 5.0, (@1:3);:CURR 1.0, (@1:3);:OUTP 1, (@1:3);*OPC?": "1"}
+    )
+    supply = make_supply(transmission)
+
+    with supply.batch():
+        supply.set_voltage(12.0, 1)
+        supply.set_output(True, 1)
+        # queries are not deferred
+        supply.measure_voltage(1)
+    with supply.batch(wait=True):
+        supply.set_voltage(5.0, [1, 2, 3])
+        supply.set_current_limit(1.0, [1, 2, 3])
+        supply.set_output(True, [1, 2, 3])
+
+    assert transmission.sent == [
+        "MEAS:VOLT? (@1)",
+        "VOLT 12.0, (@1);:OUTP 1, (@1)",
+        "VOLT 5.0, (@1:3);:CURR 1.0, (@1:3);:OUTP 1, (@1:3);*OPC?",
+    ]
+
+
+def test_failed_batch_is_dropped():
+    transmission = FakeTransmission()
+    supply = make_supply(transmission)
+    supply.enable_state_mirror()
+
+    with raises(RuntimeError):
+        with supply.batch():
+            supply.set_voltage(12.0, 1)
+            raise RuntimeError
+    assert not transmission.sent
+    # the mirror doesn't keep the dropped setpoint
+    supply.set_voltage(12.0, 1)
+    assert transmission.sent == ["VOLT 12.0, (@1)"]
+
+
+def test_batch_is_per_thread():
+    transmission = FakeTransmission()
+    supply = make_supply(transmission)
+
+    with raises(RuntimeError):
+        with supply.batch():
+            supply.set_voltage(12.0, 1)
+            # another thread's command is sent straight away, not deferred
+            thread = Thread(target=supply.set_output, args=(True, 2))
+            thread.start()
+            thread.join()
+            assert transmission.sent == ["OUTP 1, (@2)"]
+            raise RuntimeError
+    # only this thread's command was dropped with the batch
+    assert transmission.sent == ["OUTP 1, (@2)"]
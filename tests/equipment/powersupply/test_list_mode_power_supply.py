@@ -0,0 +1,55 @@
+from unittest.mock import patch
+
+from pytest import raises
+
+from epcomms.connection.packet import String
+from epcomms.connection.transmission import Transmission
+from epcomms.equipment.powersupply import ListModePowerSupply
+
+
+class FakeTransmission(Transmission[String, String]):
+    """Records every message."""
+
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    def _command(self, packet):
+        self.sent.append(packet.serialize())
+
+    def _read(self):
+        return String.from_wire("0")
+
+
+@patch.multiple(ListModePowerSupply, __abstractmethods__=set())
+@patch("epcomms.equipment.powersupply.list_mode_power_supply.time.sleep")
+def test_ramp(sleep):
+    transmission = FakeTransmission()
+    supply = ListModePowerSupply(transmission)
+
+    supply.ramp([1.0, 2.5], [0.5, 1.5], 1)
+    sleep.assert_called_once_with(2.0)
+    assert transmission.sent == [
+        "VOLT:MODE LIST, (@1);:LIST:VOLT 1,2.5, (@1);:LIST:DWEL 0.5,1.5, (@1);"
+        ":LIST:COUN 1, (@1);:LIST:TERM:LAST ON, (@1);:TRIG:TRAN:SOUR BUS, (@1);"
+        ":INIT:TRAN (@1);*TRG",
+        "VOLT:MODE FIX, (@1)",
+    ]
+
+    with raises(ValueError):
+        supply.ramp([1.0] * 513, 0.1)
+
+
+@patch.multiple(ListModePowerSupply, __abstractmethods__=set())
+@patch("epcomms.equipment.powersupply.list_mode_power_supply.time.sleep")
+def test_ramp_without_waiting(sleep):
+    transmission = FakeTransmission()
+    supply = ListModePowerSupply(transmission)
+
+    supply.ramp([1.0, 2.0], 0.5, 2, current_limits=[0.1, 0.2], wait=False)
+    sleep.assert_not_called()
+    assert transmission.sent == [
+        "VOLT:MODE LIST, (@2);:LIST:VOLT 1,2, (@2);:CURR:MODE LIST, (@2);"
+        ":LIST:CURR 0.1,0.2, (@2);:LIST:DWEL 0.5,0.5, (@2);:LIST:COUN 1, (@2);"
+        ":LIST:TERM:LAST ON, (@2);:TRIG:TRAN:SOUR BUS, (@2);:INIT:TRAN (@2);*TRG"
+    ]
@@ -0,0 +1,49 @@
+import numpy as np
+from pytest import approx, raises
+
+from epcomms.connection.transmission import TransmissionError
+from epcomms.equipment.vacuumcontroller import InficonBGP400
+
+
+def make_packet(status, error, measurement, software_version=40):
+    packet = [status, error, measurement >> 8, measurement & 0xFF, software_version, 10]
+    return bytearray(packet + [(sum(packet) + 5) % 256])
+
+
+def test_decode_output_packet():
+    # Torr, 5 mA emission, adjustment on, toggle bit set, BA error
+    state = InficonBGP400.decode_output_packet(
+        memoryview(make_packet(0b00011110, 0b10000000, 23000))
+    )
+    assert state.pressure == approx(10 ** (23000 / 4000 - 12.625))
+    assert state.unit == "Torr"
+    assert state.emission == "5 mA"
+    assert state.adjustment == "1000 mbar adjustment on"
+    assert state.toggle_bit == 1
+    assert state.error_msg == "BA error"
+    assert state.software_version == "v2.0"
+
+
+def test_decode_output_packet_bad_checksum():
+    packet = make_packet(0, 0, 0)
+    packet[6] ^= 0xFF
+    with raises(TransmissionError):
+        InficonBGP400.decode_output_packet(packet)
+
+
+def test_decode_output_packets():
+    packets = [make_packet(status, 0, 20000 + status) for status in range(64)]
+    packets[5][6] ^= 0xFF
+    states = InficonBGP400.decode_output_packets(np.array(packets, dtype=np.uint8))
+
+    assert not states["valid"][5]
+    for packet, state in zip(packets, states):
+        if not state["valid"]:
+            continue
+        expected = InficonBGP400.decode_output_packet(packet)
+        assert state["emission"] == expected.emission
+        assert state["unit"] == (expected.unit or "")
+        if expected.pressure is None:
+            assert np.isnan(state["pressure"])
+        else:
+            assert state["pressure"] == expected.pressure